@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Search Index Build Script
+
+This script builds the prebuilt full-text search index that the web
+interface uses for instant lookups. Run it after regenerating the data files
+(e.g. after ``srf-insights combine``), alongside ``verify_data.py``.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    python build_search_index.py                 # index every web dataset
+    python build_search_index.py papers.json     # index selected datasets
+"""
+
+import sys
+from pathlib import Path
+
+from conferences.common.text_index import build_index
+
+# Datasets the web interface can load (see docs/app-simple.js)
+WEB_DATASETS = [
+    "papers-simple.json",
+    "papers-medium.json",
+    "papers.json",
+    "papers-combined.json",
+]
+
+def build_search_indexes(datasets=None):
+    """Build the search index of each web dataset under docs/data/index/."""
+    data_dir = Path(__file__).parent / "docs" / "data"
+    index_root = data_dir / "index"
+
+    for filename in datasets or WEB_DATASETS:
+        dataset = data_dir / filename
+        if not dataset.exists():
+            print(f"❌ Missing dataset: {filename}")
+            continue
+        manifest = build_index(dataset, index_root / dataset.stem)
+        print(f"✅ Indexed {filename}: {manifest['paper_count']} papers, "
+              f"{manifest['term_count']} terms, {len(manifest['shards'])} shards")
+
+    print("Search index build complete!")
+
+if __name__ == "__main__":
+    build_search_indexes(sys.argv[1:])
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Web Figure Image Build Script
+
+This script converts the figure images extracted from proceedings PDFs into
+the deduplicated WebP thumbnails and manifest the web interface shows in the
+paper details, one directory per conference under docs/images/. Run it after
+extracting figures (``hiat2025_extractor.py --images``).
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    python build_web_images.py                          # every conference
+    python build_web_images.py hiat2025                 # selected conferences
+    python build_web_images.py hiat2025 path/to/pngs    # other source directory
+"""
+
+import sys
+from pathlib import Path
+
+from conferences.common.images import build_images
+
+ROOT = Path(__file__).parent
+
+# Conference -> directory of extracted figure images (not committed)
+IMAGE_SOURCES = {
+    "hiat2025": "conferences/HIAT2025/figures",
+}
+
+def build_web_images(conferences=None, source_dir=None):
+    """Build docs/images/<conference>/ for each conference."""
+    for conference in conferences or IMAGE_SOURCES:
+        source = Path(source_dir) if source_dir else ROOT / IMAGE_SOURCES[conference]
+        if not source.is_dir() or not any(source.glob("*.png")):
+            # Keep the published images rather than replacing them with an empty set
+            print(f"❌ No extracted figures for {conference} in {source}")
+            continue
+        manifest = build_images(source, ROOT / "docs" / "images" / conference)
+        print(f"✅ {conference}: {manifest['source_count']} figures -> {manifest['image_count']} distinct images, "
+              f"{manifest['source_bytes'] / 1024 / 1024:.1f} MB -> {manifest['output_bytes'] / 1024 / 1024:.1f} MB")
+
+    print("Web image build complete!")
+
+if __name__ == "__main__":
+    build_web_images(sys.argv[1:2], sys.argv[2] if len(sys.argv) > 2 else None)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Web Data Shard Build Script
+
+This script splits the web datasets into the tiered files the web interface
+loads: a small list file for first paint and detail files fetched when a
+paper is opened. Run it after regenerating the data files, together with
+``build_search_index.py``.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    python build_web_shards.py                 # shard every web dataset
+    python build_web_shards.py papers.json     # shard selected datasets
+"""
+
+import sys
+from pathlib import Path
+
+from conferences.common.web_shards import build_shards
+
+# Datasets the web interface loads through shards (see docs/app-simple.js)
+WEB_DATASETS = [
+    "papers.json",
+]
+
+def build_web_shards(datasets=None):
+    """Build the shards of each web dataset under docs/data/shards/."""
+    data_dir = Path(__file__).parent / "docs" / "data"
+    shard_root = data_dir / "shards"
+
+    for filename in datasets or WEB_DATASETS:
+        dataset = data_dir / filename
+        if not dataset.exists():
+            print(f"❌ Missing dataset: {filename}")
+            continue
+        manifest = build_shards(dataset, shard_root / dataset.stem)
+        print(f"✅ Sharded {filename}: {manifest['paper_count']} papers, "
+              f"list {manifest['list_bytes'] / 1024:.1f} KB "
+              f"({manifest['list_gzip_bytes'] / 1024:.1f} KB gzip), "
+              f"details {manifest['detail_bytes'] / 1024:.1f} KB in {len(manifest['pages'])} pages")
+
+    print("Web shard build complete!")
+
+if __name__ == "__main__":
+    build_web_shards(sys.argv[1:])
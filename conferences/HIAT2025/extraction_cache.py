@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - PDF Extraction Cache
+
+This module stores per-PDF extraction results on disk, keyed by the SHA-256
+of the PDF's content. Results are kept per extraction stage (``text``,
+``figures``, ``references``), each tagged with the stage version that
+produced it, so a re-run over unchanged proceedings is served from the cache
+and a heuristic change invalidates only the stage whose version was bumped
+(see ``pdf_extractor.STAGE_VERSIONS``).
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Content-addressed entries: renamed or copied PDFs reuse their results
+- Per-stage versions for selective invalidation
+- Atomic writes, safe to share between extraction worker processes
+
+Layout:
+    <directory>/<ab>/<sha256(pdf)>.json   {"sha256", "page_count", "stages": {name: {"version", "data"}}}
+
+Usage:
+    cache = ExtractionCache('.extraction-cache')
+    entry = cache.lookup(file_sha256('001_paper.pdf'))
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_VERSION = 1
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Return the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk cache of PDF extraction results.
+
+    Attributes:
+        directory (Path): Cache root directory
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest):
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def lookup(self, digest):
+        """
+        Return the cached entry of a PDF.
+
+        Args:
+            digest (str): SHA-256 of the PDF
+
+        Returns:
+            dict: Entry with ``page_count`` and ``stages``; None on a miss
+        """
+        try:
+            with open(self._path(digest), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_VERSION:
+            return None
+        return entry
+
+    def store(self, digest, page_count, stages):
+        """
+        Store (replace) the entry of a PDF.
+
+        Args:
+            digest (str): SHA-256 of the PDF
+            page_count (int): Pages in the PDF
+            stages (dict): ``{stage name: {"version": int, "data": ...}}``
+        """
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {'version': CACHE_VERSION, 'sha256': digest, 'page_count': page_count, 'stages': stages}
+        # Worker processes may store the same content concurrently
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
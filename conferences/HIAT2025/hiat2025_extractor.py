@@ -2,114 +2,179 @@
 """
 SRF Conference Insights - HIAT2025 Conference Data Extractor
 
-This module provides data extraction capabilities for the HIAT2025 conference papers.
-Currently serves as a placeholder for future implementation of real data extraction
-from the official HIAT2025 conference website.
+This module extracts the HIAT2025 conference papers from the proceedings PDFs.
+The PDF parsing itself lives in ``pdf_extractor``: a directory of PDFs is
+processed across a process pool, one PDF per task, and the resulting records
+follow the format of ``papers.json``.
 
 Author: Ming Liu <mliu@ihep.ac.cn>
 Project: SRF Conference Insights
 Institution: Institute of High Energy Physics, Chinese Academy of Sciences
 
 Features:
-- Template for HIAT2025 paper data extraction
+- Title, authors, affiliations, abstract, sections, tables, figures and
+  references of every proceedings PDF
+- Parallel extraction, one PDF per worker task; failed PDFs are skipped
+- Streaming output: papers are written as they are extracted (``.jsonl``)
+- Content-hash extraction cache: unchanged PDFs are not parsed again
+- Figure images converted to deduplicated WebP thumbnails for the web interface
 - Compatible with SRF Conference Insights data schema
-- Extensible architecture for future implementation
 
 Dependencies:
 - json: Data serialization and file operations
-- requests: HTTP client for web scraping (future use)
-- beautifulsoup4: HTML parsing (future use)
+- PyMuPDF: PDF parsing, imported only when PDFs are extracted
+- Pillow: Web figure images, imported only when they are built
 
 Development Log:
 - v1.0: Initial template implementation
 - v1.1: Schema compatibility with main system
 - v1.2: Placeholder for real data extraction capabilities
+- v1.3: Real extraction from proceedings PDFs with a process pool
+- v1.4: Per-stage extraction cache keyed by PDF content hash
+- v1.5: Web image stage (deduplicated WebP variants and manifest)
 
 Usage:
-    python hiat2025_extractor.py
-    
+    python -m conferences.HIAT2025.hiat2025_extractor <pdf_dir> [output] [--workers N] [--images DIR]
+                                                  [--cache DIR | --no-cache] [--web-images DIR]
+
 Output:
-    Placeholder data structure compatible with the main analysis system
+    hiat2025_papers.json (or .jsonl), in the format of papers.json
 """
 
+import argparse
 import json
 import time
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
+
+from conferences.common.paper_io import JsonlPaperWriter, is_jsonl
+
+DEFAULT_CACHE_DIR = ".extraction-cache"
 
 class HIAT2025Extractor:
     """
     Data extractor for HIAT2025 conference papers.
     
-    This class provides the framework for extracting paper data from the
-    HIAT2025 conference. Currently implements placeholder functionality
-    that can be extended for real data extraction.
+    Extracts paper records from a directory of HIAT2025 proceedings PDFs.
     
     Attributes:
         conference_name (str): Name of the conference
-        base_url (str): Base URL for the conference website (placeholder)
+        pdf_dir (str): Directory of proceedings PDFs
+        workers (int): Worker processes (None: CPU count, 0: in-process)
+        image_dir (str): Directory for extracted figure images (None: not saved)
+        cache_dir (str): Extraction cache directory (None: no cache)
     """
     
-    def __init__(self):
+    def __init__(self, pdf_dir: str = "pdfs", workers: int = None, image_dir: str = None,
+                 cache_dir: str = None):
         self.conference_name = "HIAT2025"
-        self.base_url = "https://hiat2025.example.org"  # Placeholder URL
+        self.pdf_dir = pdf_dir
+        self.workers = workers
+        self.image_dir = image_dir
+        self.cache_dir = cache_dir
         
-    def extract_papers(self) -> List[Dict[str, Any]]:
+    def iter_papers(self) -> Iterator[Dict[str, Any]]:
         """
-        Extract paper data from HIAT2025 conference.
+        Extract papers one at a time, in file name order.
         
-        Currently returns placeholder data structure. This method should be
-        implemented with real extraction logic when the official website
-        and data sources become available.
+        Yields:
+            Dict[str, Any]: Paper record
+        """
+        from conferences.HIAT2025.pdf_extractor import extract_directory
+        
+        yield from extract_directory(self.pdf_dir, workers=self.workers, image_dir=self.image_dir,
+                                     cache_dir=self.cache_dir)
+        
+    def extract_papers(self) -> List[Dict[str, Any]]:
+        """
+        Extract paper data from the HIAT2025 proceedings PDFs.
         
         Returns:
             List[Dict[str, Any]]: List of paper dictionaries with metadata
         """
         print(f"=== {self.conference_name} Data Extractor ===")
-        print("Note: This is a placeholder implementation")
-        print("Real data extraction will be implemented when source becomes available")
+        papers = list(self.iter_papers())
+        print(f"Extracted {len(papers)} papers from {self.conference_name}")
+        return papers
+    
+    def build_web_images(self, output_dir: str = "docs/images/hiat2025") -> Dict[str, Any]:
+        """
+        Convert the extracted figures to deduplicated WebP variants.
         
-        # Placeholder data structure
-        papers = []
+        Args:
+            output_dir (str): Web image directory (manifest and variants)
         
-        # This would be replaced with real extraction logic
-        # For now, return empty list to maintain system compatibility
+        Returns:
+            Dict[str, Any]: Image manifest (see ``conferences.common.images``)
+        """
+        from conferences.common.images import build_images
         
-        print(f"Extracted {len(papers)} papers from {self.conference_name}")
-        return papers
+        manifest = build_images(self.image_dir, output_dir, workers=self.workers)
+        print(f"✓ {manifest['source_count']} figures -> {manifest['image_count']} distinct images "
+              f"in {output_dir}")
+        return manifest
     
-    def save_data(self, papers: List[Dict[str, Any]], filename: str = "hiat2025_papers.json"):
+    def save_data(self, papers, filename: str = "hiat2025_papers.json"):
         """
-        Save extracted paper data to JSON file.
+        Save extracted paper data to a JSON or JSON Lines file.
+        
+        For ``.jsonl`` output each paper is written as soon as it arrives, so
+        ``papers`` can be the ``iter_papers()`` generator.
         
         Args:
-            papers (List[Dict[str, Any]]): List of paper dictionaries
+            papers (iterable): Paper dictionaries
             filename (str): Output filename for the data
         """
-        data = {
+        metadata = {
             'conference': self.conference_name,
-            'source': 'HIAT2025 Official Website (Placeholder)',
+            'source': 'HIAT2025 Proceedings PDFs',
             'extraction_date': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'total_papers': len(papers),
-            'papers': papers
         }
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if is_jsonl(filename):
+                with JsonlPaperWriter(filename, metadata) as writer:
+                    for paper in papers:
+                        writer.write(paper)
+            else:
+                papers = list(papers)
+                data = {**metadata, 'total_papers': len(papers), 'papers': papers}
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             print(f"✓ Data saved to: {filename}")
         except Exception as e:
             print(f"❌ Failed to save data: {e}")
 
-def main():
+def main(argv=None):
     """
     Main execution function for HIAT2025 extractor.
     
-    Initializes the extractor and runs the data extraction process.
-    Currently serves as a placeholder for future implementation.
+    Arguments: ``<pdf_dir> [output] [--workers N] [--images DIR] [--cache DIR | --no-cache]
+    [--web-images DIR]``. The extraction cache defaults to ``DEFAULT_CACHE_DIR``;
+    ``--web-images`` (with ``--images``) also builds the web figure images.
     """
-    extractor = HIAT2025Extractor()
-    papers = extractor.extract_papers()
-    extractor.save_data(papers)
+    parser = argparse.ArgumentParser(description='Extract HIAT2025 papers from the proceedings PDFs')
+    parser.add_argument('pdf_dir', help='Directory of proceedings PDFs')
+    parser.add_argument('output', nargs='?', default='hiat2025_papers.json',
+                        help='Output file; .jsonl streams papers as they are extracted '
+                             '(default: hiat2025_papers.json)')
+    parser.add_argument('--workers', type=int, help='Extraction processes (default: one per CPU, 0: in-process)')
+    parser.add_argument('--images', metavar='DIR', help='Also extract figure images to DIR')
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument('--cache', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                       help=f'Extraction cache directory (default: {DEFAULT_CACHE_DIR})')
+    cache.add_argument('--no-cache', action='store_true', help='Extract every PDF without the cache')
+    parser.add_argument('--web-images', metavar='DIR',
+                        help='Also build WebP thumbnails and their manifest in DIR (needs --images)')
+    args = parser.parse_args(argv)
+    if args.web_images and not args.images:
+        parser.error('--web-images requires --images')
+    
+    extractor = HIAT2025Extractor(args.pdf_dir, workers=args.workers, image_dir=args.images,
+                                  cache_dir=None if args.no_cache else args.cache)
+    print(f"=== {extractor.conference_name} Data Extractor ===")
+    extractor.save_data(extractor.iter_papers(), args.output)
+    if args.web_images:
+        extractor.build_web_images(args.web_images)
 
 if __name__ == "__main__":
     main()
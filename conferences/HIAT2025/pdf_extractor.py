@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Proceedings PDF Extraction Engine
+
+This module extracts paper records from JACoW-style proceedings PDFs into the
+HIAT2025 ``papers.json`` format. A directory of PDFs is processed across a
+process pool, one PDF per task; within a PDF, pages are read one at a time and
+their lines fed through a small state machine, so no whole-document text is
+built up front.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Title from the largest font on the first page
+- Author / affiliation split of the header ("A. Author, B. Author, Institute, City, Country")
+- Abstract, sections (bold upper-case headings), table captions and references
+- Figure inventory from embedded images, optionally saved as PNG files
+- Process-pool extraction with per-file error isolation, results in file order
+- Optional content-hash cache with per-stage invalidation (``extraction_cache``)
+
+Dependencies:
+- PyMuPDF: PDF parsing
+
+Record fields:
+    paper_number, filename, title, authors, affiliations, abstract, keywords,
+    page_count, file_size_kb, figures, tables, references, sections,
+    reference_count, figure_count, table_count
+
+Usage:
+    for paper in extract_directory('proceedings/', workers=8):
+        print(paper['title'])
+"""
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from conferences.HIAT2025.extraction_cache import ExtractionCache, file_sha256
+
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF < 1.24
+    try:
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
+# Headings that count even when a PDF does not mark them bold
+KNOWN_HEADINGS = {'INTRODUCTION', 'CONCLUSION', 'CONCLUSIONS', 'SUMMARY', 'ACKNOWLEDGEMENT',
+                  'ACKNOWLEDGEMENTS', 'ACKNOWLEDGMENT', 'ACKNOWLEDGMENTS', 'REFERENCES'}
+REFERENCE_HEADINGS = {'REFERENCES', 'REFERENCE'}
+MAX_HEADING_LENGTH = 80
+
+_NAME_RE = re.compile(r"^(?:[A-Z][a-z]?\.\s*-?\s*)+(?:[A-Z][\w'À-ɏ-]*\s+)?[A-Z][\w'À-ɏ-]+$")
+_TRAILING_MARKERS_RE = re.compile(r'[\d*†‡§¶]+$')
+_LEADING_MARKER_RE = re.compile(r'^\d+(?=[A-Z])')
+_TABLE_CAPTION_RE = re.compile(r'^Table\s+\d+\s*[:.]')
+_REFERENCE_START_RE = re.compile(r'^\[\d+\]')
+_PAPER_NUMBER_RE = re.compile(r'^(\d+)')
+
+# Extraction stages and their versions. Bump a stage's version when its
+# heuristics change: cached results of the other stages stay valid.
+STAGES = ('text', 'figures', 'references')
+STAGE_VERSIONS = {'text': 1, 'figures': 1, 'references': 1}
+
+
+def _page_lines(page):
+    """Yield ``(text, size, bold)`` for each non-empty line of a page, in content order."""
+    for block in page.get_text('dict')['blocks']:
+        for line in block.get('lines', []):
+            spans = [span for span in line['spans'] if span['text'].strip()]
+            if not spans:
+                continue
+            text = ' '.join(''.join(span['text'] for span in spans).split())
+            size = max(span['size'] for span in spans)
+            bold = all(span['flags'] & 16 or 'bold' in span['font'].lower() for span in spans)
+            yield text, size, bold
+
+
+def _is_heading(text, bold):
+    letters = re.sub(r'[^A-Za-z]', '', text)
+    if len(letters) < 4 or len(text) > MAX_HEADING_LENGTH or text != text.upper():
+        return False
+    return bold or text.strip(' .:') in KNOWN_HEADINGS
+
+
+def _join_lines(lines):
+    """Join wrapped lines, undoing end-of-line hyphenation."""
+    text = ''
+    for line in lines:
+        if text.endswith('-'):
+            text = text[:-1] + line
+        else:
+            text = f"{text} {line}" if text else line
+    return text
+
+
+def split_header(text):
+    """
+    Split the author block of a paper into authors and affiliations.
+
+    Comma-separated parts that look like names ("J. Wei", "A.-M. Smith")
+    are authors; runs of other parts form one affiliation each.
+
+    Returns:
+        tuple: ``(authors, affiliations)``
+    """
+    authors, affiliations, current = [], [], []
+    for part in re.split(r',\s*|\s+and\s+', text):
+        part = part.strip()
+        if not part:
+            continue
+        name = _TRAILING_MARKERS_RE.sub('', part).strip()
+        if _NAME_RE.match(name):
+            if current:
+                affiliations.append(', '.join(current))
+                current = []
+            authors.append(name)
+        else:
+            current.append(_LEADING_MARKER_RE.sub('', part))
+    if current:
+        affiliations.append(', '.join(current))
+    return authors, affiliations
+
+
+def _figures(doc, page, page_number, stem, image_dir):
+    figures = []
+    seen = set()
+    for image in page.get_images(full=True):
+        xref, width, height = image[0], image[2], image[3]
+        if xref in seen:
+            continue
+        seen.add(xref)
+        index = len(figures) + 1
+        if image_dir:
+            pixmap = pymupdf.Pixmap(doc, xref)
+            if pixmap.n - pixmap.alpha > 3:
+                pixmap = pymupdf.Pixmap(pymupdf.csRGB, pixmap)
+            path = Path(image_dir) / _figure_filename(stem, page_number, index)
+            pixmap.save(str(path))
+            size = path.stat().st_size
+        else:
+            size = len(doc.xref_stream_raw(xref) or b'')
+        figures.append({'page': page_number, 'index': index, 'size_kb': round(size / 1024, 2),
+                        'width': width, 'height': height})
+    return figures
+
+
+def _figure_filename(stem, page, index):
+    return f"{stem}_page{page}_img{index}.png"
+
+
+def _run_stages(path, stages, image_dir):
+    """
+    Run the given extraction stages over a PDF, one page at a time.
+
+    Returns:
+        tuple: ``(page_count, {stage: {"version": int, "data": ...}})``
+    """
+    parse_text = 'text' in stages or 'references' in stages
+    title_lines, header_lines, abstract_lines = [], [], []
+    sections, tables, references, figures = {}, [], [], []
+    state, heading = 'header', None
+
+    with pymupdf.open(path) as doc:
+        page_count = doc.page_count
+        for page_number, page in enumerate(doc, 1):
+            if 'figures' in stages:
+                figures.extend(_figures(doc, page, page_number, path.stem, image_dir))
+            if not parse_text:
+                continue
+
+            lines = list(_page_lines(page))
+            if page_number == 1 and lines:
+                # Title: the leading run of lines in the largest font on the first page
+                title_size = max(size for _, size, _ in lines)
+                start = next(i for i, (_, size, _) in enumerate(lines) if size == title_size)
+                end = start
+                while end < len(lines) and lines[end][1] == title_size:
+                    end += 1
+                title_lines = [text for text, _, _ in lines[start:end]]
+                lines = lines[end:]
+
+            for text, size, bold in lines:
+                if state == 'header' and text.lower().rstrip(':') == 'abstract':
+                    state = 'abstract'
+                    continue
+                if _is_heading(text, bold):
+                    name = text.strip(' .:')
+                    state = 'references' if name in REFERENCE_HEADINGS else 'section'
+                    if state == 'section':
+                        heading = name
+                        sections.setdefault(heading, '')
+                    continue
+                if state == 'references':
+                    if _REFERENCE_START_RE.match(text) or not references:
+                        references.append(text)
+                    else:
+                        references[-1] = _join_lines([references[-1], text])
+                    continue
+                if _TABLE_CAPTION_RE.match(text):
+                    tables.append(text)
+                if state == 'header':
+                    header_lines.append(text)
+                elif state == 'abstract':
+                    abstract_lines.append(text)
+                else:
+                    sections[heading] += text + ' \n'
+
+    results = {}
+    if 'text' in stages:
+        authors, affiliations = split_header(_join_lines(header_lines))
+        results['text'] = {
+            'title': ' '.join(title_lines),
+            'authors': authors,
+            'affiliations': affiliations,
+            'abstract': _join_lines(abstract_lines),
+            'sections': {name: text.rstrip() for name, text in sections.items()},
+            'tables': tables,
+        }
+    if 'references' in stages:
+        results['references'] = references
+    if 'figures' in stages:
+        results['figures'] = figures
+    stage_entries = {name: {'version': STAGE_VERSIONS[name], 'data': data} for name, data in results.items()}
+    if 'figures' in stage_entries:
+        stage_entries['figures']['images'] = bool(image_dir)
+    return page_count, stage_entries
+
+
+def _stage_current(name, stage, path, image_dir):
+    """Return True if a cached stage can be reused for this run."""
+    if name not in STAGE_VERSIONS or stage.get('version') != STAGE_VERSIONS[name]:
+        return False
+    if name == 'figures':
+        # Sizes differ between raw streams and saved PNGs; saved files must still exist
+        if stage.get('images') != bool(image_dir):
+            return False
+        if image_dir and not all((Path(image_dir) / _figure_filename(path.stem, f['page'], f['index'])).exists()
+                                 for f in stage['data']):
+            return False
+    return True
+
+
+def _extract(path, paper_number=None, image_dir=None, cache=None):
+    """``extract_pdf``, also returning the names of the stages that were run."""
+    if pymupdf is None:
+        raise ImportError("PyMuPDF is required for PDF extraction")
+    path = Path(path)
+    if paper_number is None:
+        match = _PAPER_NUMBER_RE.match(path.name)
+        paper_number = int(match.group(1)) if match else 0
+    if image_dir:
+        Path(image_dir).mkdir(parents=True, exist_ok=True)
+
+    stages, page_count, digest = {}, None, None
+    if cache is not None:
+        if not isinstance(cache, ExtractionCache):
+            cache = ExtractionCache(cache)
+        digest = file_sha256(path)
+        entry = cache.lookup(digest)
+        if entry:
+            page_count = entry['page_count']
+            stages = {name: stage for name, stage in entry['stages'].items()
+                      if _stage_current(name, stage, path, image_dir)}
+
+    missing = [name for name in STAGES if name not in stages]
+    if missing:
+        page_count, results = _run_stages(path, missing, image_dir)
+        stages.update(results)
+        if cache is not None:
+            cache.store(digest, page_count, stages)
+
+    text = stages['text']['data']
+    references = stages['references']['data']
+    figures = [{'filename': _figure_filename(path.stem, f['page'], f['index']), 'page': f['page'],
+                'size_kb': f['size_kb'], 'width': f['width'], 'height': f['height']}
+               for f in stages['figures']['data']]
+    record = {
+        'paper_number': paper_number,
+        'filename': path.name,
+        'title': text['title'],
+        'authors': text['authors'],
+        'affiliations': text['affiliations'],
+        'abstract': text['abstract'],
+        'keywords': [],
+        'page_count': page_count,
+        'file_size_kb': round(path.stat().st_size / 1024, 1),
+        'figures': figures,
+        'tables': text['tables'],
+        'references': references,
+        'sections': text['sections'],
+        'reference_count': len(references),
+        'figure_count': len(figures),
+        'table_count': len(text['tables']),
+    }
+    return record, missing
+
+
+def extract_pdf(path, paper_number=None, image_dir=None, cache=None):
+    """
+    Extract one proceedings PDF into a paper record.
+
+    Args:
+        path (str): PDF file
+        paper_number (int, optional): Number to record (default: the
+                                      file name's leading digits, or 0)
+        image_dir (str, optional): Save embedded images here as PNG
+        cache (ExtractionCache or str, optional): Reuse and store per-stage
+                                                  results keyed by the PDF's SHA-256
+
+    Returns:
+        dict: Paper record in the HIAT2025 ``papers.json`` format
+    """
+    return _extract(path, paper_number, image_dir, cache)[0]
+
+
+def _extract_task(task):
+    """Process-pool entry point: never raises, so one bad PDF cannot stop a run."""
+    path, paper_number, image_dir, cache_dir = task
+    try:
+        record, stages = _extract(path, paper_number, image_dir, cache_dir)
+        return path, record, stages, None
+    except Exception as e:
+        return path, None, None, f"{type(e).__name__}: {e}"
+
+
+def extract_directory(pdf_dir, workers=None, image_dir=None, pattern='*.pdf', cache_dir=None):
+    """
+    Extract every PDF of a proceedings directory.
+
+    PDFs are numbered by their file name's leading digits, or by position in
+    sorted order. Files that fail are reported and skipped.
+
+    Args:
+        pdf_dir (str): Directory of proceedings PDFs
+        workers (int, optional): Worker processes (default: CPU count; 0 extracts in-process)
+        image_dir (str, optional): Save embedded images here
+        pattern (str): File name pattern
+        cache_dir (str, optional): Extraction cache directory (``ExtractionCache``)
+
+    Yields:
+        dict: Paper records in file order
+    """
+    paths = sorted(Path(pdf_dir).glob(pattern))
+    tasks = []
+    for position, path in enumerate(paths, 1):
+        match = _PAPER_NUMBER_RE.match(path.name)
+        tasks.append((str(path), int(match.group(1)) if match else position,
+                      str(image_dir) if image_dir else None, str(cache_dir) if cache_dir else None))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if cache_dir:
+        # Create it once here rather than racing in the workers
+        ExtractionCache(cache_dir)
+    if workers == 0 or len(tasks) <= 1:
+        yield from _report(map(_extract_task, tasks), cache_dir)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        # chunksize=1: one PDF per task, so a large PDF does not hold back others
+        yield from _report(executor.map(_extract_task, tasks, chunksize=1), cache_dir)
+
+
+def _report(results, cache_dir):
+    extracted = cached = 0
+    for path, record, stages, error in results:
+        if error:
+            print(f"❌ Failed to extract {os.path.basename(path)}: {error}")
+            continue
+        if stages:
+            extracted += 1
+        else:
+            cached += 1
+        yield record
+    if cache_dir:
+        print(f"✓ {extracted + cached} PDFs: {cached} from cache, {extracted} (re)extracted")
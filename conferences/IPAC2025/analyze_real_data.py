@@ -13,75 +13,112 @@ Features:
 - Statistical analysis of paper metadata (titles, authors, abstracts)
 - Data quality assessment and coverage metrics
 - Export analysis reports in multiple formats
+- Vectorized engine: one load, all metrics as DataFrame column operations
+- Works on any conference dataset (JSON, JSON Lines, Parquet/Arrow)
 
 Dependencies:
-- json: Data loading and parsing
-- collections.Counter: Statistical counting operations
+- conferences.common.analysis: Vectorized statistics (pandas/numpy)
 
 Development Log:
 - v1.0: Basic statistical analysis implementation
 - v1.1: Enhanced data quality metrics and reporting
 - v1.2: Added comprehensive coverage analysis
+- v1.3: Single-pass streaming analysis, JSON Lines input
+- v1.4: Column-projected Parquet / Arrow input
+- v1.5: Vectorized analysis engine; distributions, top institutions and keywords
 
 Usage:
-    python analyze_real_data.py
+    python analyze_real_data.py [dataset]
     
 Input:
-    ipac2025_real_papers.json - Raw paper data from crawler
+    ipac2025_real_papers.json (or .jsonl/.parquet) - Raw paper data from crawler
     
 Output:
     Console report with detailed statistics and metrics
 """
 
-import json
+import os
 import sys
-from collections import Counter
 
-def analyze_papers(filename="ipac2025_real_papers.json"):
+# Make the repository root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from conferences.common.analysis import compute_statistics, load_papers_frame, save_statistics
+
+def analyze_papers(filename="ipac2025_real_papers.json", output=None, top_n=10):
     """
     Analyze extracted paper data and generate comprehensive statistics.
     
+    The papers are loaded once into a DataFrame and every metric is computed
+    with vectorized column operations (see ``conferences.common.analysis``),
+    so any conference dataset can be analyzed, not only IPAC2025 crawls.
+    
     Args:
-        filename (str): Path to the JSON file containing paper data
+        filename (str): Path to a JSON, JSON Lines or Parquet/Arrow dataset
+        output (str, optional): Also write the statistics as JSON to this file
+        top_n (int): Number of entries in the top institution/keyword lists
         
     Returns:
         bool: True if analysis completed successfully, False otherwise
     """
     try:
         print("Loading data file...")
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data, df = load_papers_frame(filename)
+        stats = compute_statistics(df, top_n)
+        basic = stats['basic_stats']
+        coverage = stats['coverage']
+        conference = data.get('conference') or ', '.join(stats['conference_distribution']) or 'Conference'
         
-        papers = data.get('papers', [])
-        
-        print("=== IPAC2025 Real Data Analysis Report ===")
+        print(f"=== {conference} Real Data Analysis Report ===")
         print(f"Data source: {data.get('source', 'Unknown')}")
-        print(f"Crawl date: {data.get('crawl_date', 'Unknown')}")
+        print(f"Crawl date: {data.get('crawl_date', data.get('extraction_time', 'Unknown'))}")
         print(f"Conference website: {data.get('url', 'Unknown')}")
         print()
         
         # Basic statistics
         print("📊 Basic Statistics:")
-        print(f"  Total papers: {len(papers)}")
-        
-        papers_with_abstracts = [p for p in papers if p.get('abstract') and p.get('abstract').strip()]
-        papers_with_authors = [p for p in papers if p.get('authors') and len(p.get('authors', [])) > 0]
-        papers_with_categories = [p for p in papers if p.get('category') and p.get('category').strip()]
-        
-        print(f"  Papers with abstracts: {len(papers_with_abstracts)}")
-        print(f"  Papers with authors: {len(papers_with_authors)}")
-        print(f"  Papers with categories: {len(papers_with_categories)}")
+        print(f"  Total papers: {basic['total_papers']}")
+        print(f"  Papers with abstracts: {coverage['abstracts']['count']}")
+        print(f"  Papers with authors: {coverage['authors']['count']}")
+        print(f"  Papers with categories: {coverage['categories']['count']}")
+        print(f"  Unique authors: {basic['total_authors']}")
+        print(f"  Unique institutions: {basic['total_institutions']}")
         print()
         
         # Coverage percentages
-        total = len(papers)
-        if total > 0:
+        if basic['total_papers'] > 0:
             print("📈 Data Coverage:")
-            print(f"  Abstract coverage: {len(papers_with_abstracts)/total*100:.1f}%")
-            print(f"  Author coverage: {len(papers_with_authors)/total*100:.1f}%")
-            print(f"  Category coverage: {len(papers_with_categories)/total*100:.1f}%")
+            print(f"  Abstract coverage: {coverage['abstracts']['percent']:.1f}%")
+            print(f"  Author coverage: {coverage['authors']['percent']:.1f}%")
+            print(f"  Category coverage: {coverage['categories']['percent']:.1f}%")
+            print(f"  Institution coverage: {coverage['institutions']['percent']:.1f}%")
+            print(f"  Keyword coverage: {coverage['keywords']['percent']:.1f}%")
             print()
         
+        for title, key in (("🏛️ Top Institutions:", 'top_institutions'),
+                           ("🔑 Top Keywords:", 'top_keywords'),
+                           ("🗂️ Top Categories:", 'top_categories')):
+            if stats[key]:
+                print(title)
+                for name, count in stats[key]:
+                    print(f"  {count:4d}  {name}")
+                print()
+        
+        if basic['total_pages']:
+            print("📄 Page Distribution:")
+            for label, count in stats['page_distribution'].items():
+                print(f"  {label}: {count}")
+            print()
+        if basic['total_figures']:
+            print("🖼️ Figure Distribution:")
+            for label, count in stats['figure_distribution'].items():
+                print(f"  {label}: {count}")
+            print()
+        
+        if output:
+            save_statistics(stats, output)
+            print(f"✓ Statistics saved to: {output}")
+        
         return True
         
     except Exception as e:
@@ -89,4 +126,4 @@ def analyze_papers(filename="ipac2025_real_papers.json"):
         return False
 
 if __name__ == "__main__":
-    analyze_papers()
+    analyze_papers(*sys.argv[1:2])
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Vectorized Analysis Engine
+
+This module loads a paper dataset once into a pandas DataFrame and computes
+every coverage metric and distribution with column operations, instead of
+one Python pass over the papers per statistic. It accepts any conference
+file the project produces: crawler outputs (JSON, JSON Lines, Parquet,
+Arrow), the HIAT2025 extractor format and the combined web datasets.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Field normalization across the per-conference formats
+- Coverage metrics for abstracts, authors, institutions, categories, keywords
+- Page and figure histograms in the ``statistics.json`` layout
+- Top institutions, keywords, categories and sessions from exploded list columns
+- Author and institution counts over resolved canonical entities (``entities``)
+
+Dependencies:
+- pandas / numpy: Columnar computation
+
+Usage:
+    metadata, df = load_papers_frame('papers-combined.json')
+    stats = compute_statistics(df)
+    save_statistics(stats, 'statistics.json')
+"""
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from conferences.common.entities import resolve_authors, resolve_institutions
+from conferences.common.paper_io import open_papers
+
+# Histogram bins (right-inclusive) and labels, as in statistics.json
+PAGE_BINS = [-np.inf, 2, 4, 6, 8, np.inf]
+PAGE_LABELS = ['1-2页', '3-4页', '5-6页', '7-8页', '8+页']
+FIGURE_BINS = [-np.inf, 5, 10, 15, 20, np.inf]
+FIGURE_LABELS = ['0-5图', '6-10图', '11-15图', '16-20图', '20+图']
+
+TEXT_FIELDS = ['title', 'abstract', 'category', 'session', 'conference']
+LIST_FIELDS = {
+    'authors': ['authors'],
+    'institutions': ['institutions', 'affiliations'],
+    'keywords': ['keywords'],
+}
+# Count fields and the source columns they may come from, in priority order;
+# list-valued sources (e.g. HIAT2025 ``figures``) are counted by length
+COUNT_FIELDS = {
+    'pages': ['pages', 'page_count'],
+    'figures': ['figure_count', 'figures'],
+    'tables': ['table_count', 'tables'],
+    'references': ['reference_count', 'references'],
+}
+
+ANALYSIS_COLUMNS = TEXT_FIELDS + [name for sources in LIST_FIELDS.values() for name in sources] \
+    + [name for sources in COUNT_FIELDS.values() for name in sources]
+
+
+def load_papers_frame(path, columns=None):
+    """
+    Load a paper dataset into a normalized DataFrame.
+
+    Args:
+        path (str): Any dataset file supported by ``paper_io.open_papers``
+        columns (list, optional): For columnar files, the columns to read
+                                  (default: those the analysis uses)
+
+    Returns:
+        tuple: ``(metadata, DataFrame)``
+    """
+    if str(path).lower().endswith(('.parquet', '.arrow', '.feather')):
+        from conferences.common import columnar
+        if columns is None:
+            available = set(columnar.read_schema(path).names)
+            columns = [name for name in ANALYSIS_COLUMNS if name in available]
+        return columnar.read_metadata(path), normalize_frame(columnar.read_columns(path, columns))
+    metadata, papers = open_papers(path)
+    return metadata, normalize_frame(pd.DataFrame.from_records(papers))
+
+
+def _first_column(df, names):
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return None
+
+
+def _list_lengths(series):
+    """Number of non-null items in each list cell (0 for missing cells)."""
+    exploded = series.explode()
+    return exploded.notna().groupby(level=0).sum().reindex(series.index, fill_value=0).astype(int)
+
+
+def normalize_frame(df):
+    """
+    Map the per-conference field names onto one set of columns.
+
+    The result has string columns ``TEXT_FIELDS`` ('' when missing), list
+    columns ``LIST_FIELDS`` (empty lists when missing) and numeric columns
+    ``COUNT_FIELDS`` (NaN when unknown).
+
+    Args:
+        df (DataFrame): Papers as loaded from any dataset format
+
+    Returns:
+        DataFrame: Normalized copy
+    """
+    df = df.reset_index(drop=True)
+    out = pd.DataFrame(index=df.index)
+    for field in TEXT_FIELDS:
+        column = df[field] if field in df.columns else pd.Series('', index=df.index)
+        out[field] = column.fillna('').astype(str)
+
+    for field, sources in LIST_FIELDS.items():
+        column = _first_column(df, sources)
+        if column is None:
+            column = pd.Series([[]] * len(df), index=df.index, dtype=object)
+        # Normalize null cells and array cells (from Arrow) to lists
+        out[field] = column.map(lambda v: list(v) if isinstance(v, (list, tuple, np.ndarray)) else [])
+
+    for field, sources in COUNT_FIELDS.items():
+        column = _first_column(df, sources)
+        if column is None:
+            out[field] = np.nan
+        elif column.map(lambda v: isinstance(v, (list, tuple, np.ndarray))).any():
+            out[field] = _list_lengths(column).astype(float)
+        else:
+            out[field] = pd.to_numeric(column, errors='coerce')
+    return out
+
+
+def _has_items(series):
+    return _list_lengths(series) > 0
+
+
+def _has_text(series):
+    return series.str.strip().str.len() > 0
+
+
+def _top_counts(values, top_n):
+    """
+    Most frequent values as ``[[value, count], ...]``.
+
+    Ties keep first-seen order, like ``collections.Counter.most_common``.
+    """
+    counts = values.value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    return [[value, int(count)] for value, count in counts.head(top_n).items()]
+
+
+def _histogram(values, bins, labels):
+    binned = pd.cut(values.dropna(), bins=bins, labels=labels)
+    counts = binned.value_counts(sort=False)
+    return {label: int(counts.get(label, 0)) for label in labels}
+
+
+def coverage_metrics(df):
+    """
+    Count and share of papers with each field present.
+
+    Args:
+        df (DataFrame): Normalized papers
+
+    Returns:
+        dict: field -> ``{'count': n, 'percent': p}``
+    """
+    present = {
+        'abstracts': _has_text(df['abstract']),
+        'authors': _has_items(df['authors']),
+        'institutions': _has_items(df['institutions']),
+        'categories': _has_text(df['category']),
+        'keywords': _has_items(df['keywords']),
+    }
+    total = len(df)
+    return {name: {'count': int(mask.sum()),
+                   'percent': float(mask.sum() / total * 100) if total else 0.0}
+            for name, mask in present.items()}
+
+
+def compute_statistics(df, top_n=10, resolve_entities=True):
+    """
+    Compute the full statistics report for a normalized DataFrame.
+
+    The ``basic_stats``, ``top_institutions``, ``top_keywords``,
+    ``page_distribution`` and ``figure_distribution`` keys follow the
+    ``statistics.json`` layout used by the web data.
+
+    Args:
+        df (DataFrame): Normalized papers (see ``normalize_frame``)
+        top_n (int): Length of the top-N lists
+        resolve_entities (bool): Count authors and institutions as resolved
+                                 canonical entities; if False, count distinct
+                                 raw strings and rank institutions by the text
+                                 before the first comma
+
+    Returns:
+        dict: JSON-serializable statistics
+    """
+    total = len(df)
+    authors = df['authors'].explode().dropna().astype(str)
+    institutions = df['institutions'].explode().dropna().astype(str)
+    keywords = df['keywords'].explode().dropna()
+    if resolve_entities:
+        author_table = resolve_authors(authors)
+        institution_table = resolve_institutions(institutions)
+        institution_names = institutions.map(institution_table.name_of).dropna()
+        total_authors, total_institutions = len(author_table), len(institution_table)
+    else:
+        # Institutions are ranked by their leading name, before any address
+        institution_names = institutions.str.split(',', n=1).str[0].str.strip()
+        total_authors, total_institutions = int(authors.nunique()), int(institutions.nunique())
+
+    def total_of(field):
+        return int(df[field].sum()) if df[field].notna().any() else 0
+
+    def mean_of(field):
+        return float(df[field].sum() / total) if total and df[field].notna().any() else 0
+
+    basic_stats = {
+        'total_papers': total,
+        'total_pages': total_of('pages'),
+        'total_authors': total_authors,
+        'total_institutions': total_institutions,
+        'total_figures': total_of('figures'),
+        'total_tables': total_of('tables'),
+        'total_references': total_of('references'),
+        'papers_with_abstract': int(_has_text(df['abstract']).sum()),
+        'papers_with_keywords': int(_has_items(df['keywords']).sum()),
+        'avg_pages': mean_of('pages'),
+        'avg_figures': mean_of('figures'),
+        'avg_references': mean_of('references'),
+    }
+
+    return {
+        'basic_stats': basic_stats,
+        'coverage': coverage_metrics(df),
+        'top_institutions': _top_counts(institution_names, top_n),
+        'top_keywords': _top_counts(keywords, top_n),
+        'top_categories': _top_counts(df['category'][_has_text(df['category'])], top_n),
+        'top_sessions': _top_counts(df['session'][_has_text(df['session'])], top_n),
+        'conference_distribution': {name: count for name, count in _top_counts(
+            df['conference'][_has_text(df['conference'])], None)},
+        'page_distribution': _histogram(df['pages'], PAGE_BINS, PAGE_LABELS),
+        'figure_distribution': _histogram(df['figures'], FIGURE_BINS, FIGURE_LABELS),
+        'generated_at': datetime.now().isoformat(),
+    }
+
+
+def analyze_file(path, top_n=10, resolve_entities=True):
+    """
+    Load a dataset and compute its statistics.
+
+    Returns:
+        tuple: ``(metadata, statistics)``
+    """
+    metadata, df = load_papers_frame(path)
+    return metadata, compute_statistics(df, top_n, resolve_entities=resolve_entities)
+
+
+def save_statistics(stats, path):
+    """Write a statistics report as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Raw HTML Archive (WARC)
+
+This module writes every page a crawler fetches into an append-only WARC
+file, so extraction can be replayed later from local disk without touching
+the network. Each record is a separate gzip member (the standard
+``.warc.gz`` layout), which keeps the file readable by common WARC tools and
+lets a sidecar offset index seek straight to any page.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- WARC/1.0 ``response`` records, one gzip member per record
+- JSON Lines offset index (``<archive>.idx``) for random access by URL
+- Streaming sequential reader that tolerates a truncated final record
+- Thread-safe appends for concurrent crawls
+
+Usage:
+    archive = WarcArchive('ipac2025.warc.gz')
+    crawler = ImprovedIPAC2025Crawler(archive=archive)
+    ...
+    for record in WarcArchive('ipac2025.warc.gz').iter_records():
+        print(record.url, len(record.body))
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import uuid
+import zlib
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+WarcRecord = namedtuple('WarcRecord', ['url', 'date', 'status', 'headers', 'body'])
+
+
+def _http_block(body, status=200, content_type='text/html; charset=utf-8'):
+    payload = body.encode('utf-8')
+    head = (f"HTTP/1.1 {status} OK\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n").encode('latin-1')
+    return head + payload, payload
+
+
+def _parse_headers(lines):
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+def _iter_gzip_members(f, chunk_size=1 << 20):
+    """
+    Yield ``(offset, length, data)`` for each gzip member in a stream.
+
+    A truncated trailing member (e.g. from a crash mid-write) ends the
+    iteration instead of raising.
+    """
+    offset = 0
+    pending = b''
+    while True:
+        decompressor = zlib.decompressobj(wbits=31)
+        start = offset
+        parts = []
+        while not decompressor.eof:
+            if not pending:
+                pending = f.read(chunk_size)
+                if not pending:
+                    return
+            try:
+                parts.append(decompressor.decompress(pending))
+            except zlib.error:
+                return
+            if decompressor.eof:
+                used = len(pending) - len(decompressor.unused_data)
+                pending = decompressor.unused_data
+            else:
+                used = len(pending)
+                pending = b''
+            offset += used
+        yield start, offset - start, b''.join(parts)
+
+
+def _parse_record(data):
+    """Parse one decompressed WARC record into a WarcRecord, or None."""
+    head, _, rest = data.partition(b'\r\n\r\n')
+    lines = head.decode('utf-8').split('\r\n')
+    if not lines or not lines[0].startswith('WARC/'):
+        return None
+    warc_headers = _parse_headers(lines[1:])
+    if warc_headers.get('WARC-Type') != 'response':
+        return None
+    block = rest[:int(warc_headers.get('Content-Length', len(rest)))]
+    http_head, _, body = block.partition(b'\r\n\r\n')
+    http_lines = http_head.decode('latin-1').split('\r\n')
+    status = int(http_lines[0].split()[1])
+    return WarcRecord(
+        url=warc_headers.get('WARC-Target-URI'),
+        date=warc_headers.get('WARC-Date'),
+        status=status,
+        headers=_parse_headers(http_lines[1:]),
+        body=body.decode('utf-8'),
+    )
+
+
+class WarcArchive:
+    """
+    Append-only gzip-compressed WARC archive of fetched pages.
+
+    Attributes:
+        path (Path): Archive file (conventionally ``*.warc.gz``)
+        index_path (Path): Sidecar JSON Lines offset index
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + '.idx')
+        self._lock = threading.Lock()
+
+    def write(self, url, body, status=200):
+        """
+        Append one fetched page.
+
+        Args:
+            url (str): Page URL
+            body (str): Decoded HTML
+            status (int): HTTP status the page was served with
+        """
+        block, payload = _http_block(body, status)
+        date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        warc_head = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Date: {date}\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Payload-Digest: sha256:{hashlib.sha256(payload).hexdigest()}\r\n"
+            "Content-Type: application/http; msgtype=response\r\n"
+            f"Content-Length: {len(block)}\r\n\r\n"
+        ).encode('utf-8')
+        member = gzip.compress(warc_head + block + b'\r\n\r\n')
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'ab') as f:
+                offset = f.tell()
+                f.write(member)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'url': url, 'offset': offset,
+                                    'length': len(member), 'date': date}) + '\n')
+
+    def iter_records(self):
+        """
+        Read all response records sequentially.
+
+        Yields:
+            WarcRecord: Records in the order they were written
+        """
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            for _, _, data in _iter_gzip_members(f):
+                record = _parse_record(data)
+                if record is not None:
+                    yield record
+
+    def latest_records(self):
+        """
+        Return the most recent record for every URL.
+
+        Returns:
+            dict: URL -> WarcRecord, in first-seen order
+        """
+        latest = {}
+        for record in self.iter_records():
+            latest[record.url] = record
+        return latest
+
+    def load_index(self):
+        """
+        Load the offset index, rebuilding it from the archive if missing.
+
+        Returns:
+            dict: URL -> index entry of its latest record
+        """
+        if not self.index_path.exists():
+            self.rebuild_index()
+        index = {}
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                index[entry['url']] = entry
+        return index
+
+    def rebuild_index(self):
+        """Recreate the offset index by scanning the archive."""
+        with self._lock:
+            if not self.path.exists():
+                self.index_path.write_text('', encoding='utf-8')
+                return
+            with open(self.path, 'rb') as f, \
+                    open(self.index_path, 'w', encoding='utf-8') as out:
+                for offset, length, data in _iter_gzip_members(f):
+                    record = _parse_record(data)
+                    if record is not None:
+                        out.write(json.dumps({'url': record.url, 'offset': offset,
+                                              'length': length, 'date': record.date}) + '\n')
+
+    def get(self, url, index=None):
+        """
+        Random access to the latest record for ``url``.
+
+        Args:
+            url (str): Page URL
+            index (dict, optional): Preloaded result of ``load_index``
+
+        Returns:
+            WarcRecord: The record, or None if the URL is not archived
+        """
+        entry = (index if index is not None else self.load_index()).get(url)
+        if entry is None:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(entry['offset'])
+            return _parse_record(gzip.decompress(f.read(entry['length'])))
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Multi-Event Batch Crawl
+
+This module crawls many Indico events (registered conference adapters) in
+one process. Every event gets its own ``IndicoCrawler``, output file, journal
+and metrics; all of them share one ``RateLimiter`` (the per-host request
+rate) and one ``ConnectionScheduler`` (the global budget of concurrent
+requests). Slots of the budget are granted round-robin over hosts, and over
+the events of each host, so a large event cannot starve a small one and a
+full refresh keeps every allowed connection busy until the last event is done.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Global cap on concurrent requests across all events (``max_connections``)
+- Optional per-host cap (``per_host``) on top of the per-host rate limit
+- Fair slot granting: round-robin over hosts, then over events of a host
+- Per-event output, journal (resume; removed after a clean crawl) and incremental mode
+- Periodic per-event progress lines and a JSON run summary
+- A failing event is reported without stopping the others
+
+Usage:
+    batch = BatchCrawler(['ipac2025', 'linac2026'], max_connections=16, rate=8)
+    summary = batch.run(resume=True)
+    srf-insights batch ipac2025 linac2026 --max-connections 16 --rate 8
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from conferences.common.adapters import get_adapter
+from conferences.common.http_cache import HTTPCache
+from conferences.common.indico import IndicoCrawler
+from conferences.common.journal import CrawlJournal
+from conferences.common.metrics import Metrics
+from conferences.common.paper_io import is_jsonl
+from conferences.common.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionScheduler:
+    """
+    Global budget of concurrent requests, shared fairly.
+
+    Requests wait in a queue per host and event. Whenever a slot is free the
+    next host in round-robin order that is below its ``per_host`` cap gets
+    it, and within that host the next event in round-robin order, so every
+    active event keeps getting a share of the budget however many requests
+    the others have queued.
+
+    Attributes:
+        max_connections (int): Requests in flight at once, over all hosts
+        per_host (int): Requests in flight at once to a single host
+        peak (int): Most requests that were ever in flight together
+        granted (Counter): Event -> requests granted
+        wait_seconds (Counter): Event -> total time its requests waited for a slot
+    """
+
+    def __init__(self, max_connections=8, per_host=None):
+        self.max_connections = max(1, int(max_connections))
+        self.per_host = min(self.max_connections, max(1, int(per_host or self.max_connections)))
+        self.peak = 0
+        self.granted = Counter()
+        self.wait_seconds = Counter()
+        self._condition = threading.Condition()
+        self._waiting = OrderedDict()   # host -> OrderedDict(event -> deque of tickets)
+        self._active = Counter()        # host -> requests in flight
+        self._in_flight = 0
+
+    @contextmanager
+    def slot(self, url, event=None):
+        """Hold one slot for a request to ``url`` on behalf of ``event``."""
+        host = RateLimiter.host_of(url)
+        self.acquire(host, event)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def acquire(self, host, event=None):
+        """Block until a slot for ``host`` is granted to ``event``."""
+        ticket = {'granted': False}
+        start = time.perf_counter()
+        with self._condition:
+            self._waiting.setdefault(host, OrderedDict()).setdefault(event, deque()).append(ticket)
+            self._dispatch()
+            while not ticket['granted']:
+                self._condition.wait()
+            self.wait_seconds[event] += time.perf_counter() - start
+
+    def release(self, host):
+        """Return the slot of a finished request to ``host``."""
+        with self._condition:
+            self._in_flight -= 1
+            self._active[host] -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        """Grant free slots to waiting requests (called with the lock held)."""
+        granted = False
+        while self._in_flight < self.max_connections:
+            host = next((h for h in self._waiting if self._active[h] < self.per_host), None)
+            if host is None:
+                break
+            events = self._waiting[host]
+            event, tickets = next(iter(events.items()))
+            tickets.popleft()['granted'] = True
+            # Rotate both levels so the next slot goes to someone else
+            if tickets:
+                events.move_to_end(event)
+            else:
+                del events[event]
+            if events:
+                self._waiting.move_to_end(host)
+            else:
+                del self._waiting[host]
+
+            self._in_flight += 1
+            self._active[host] += 1
+            self.peak = max(self.peak, self._in_flight)
+            self.granted[event] += 1
+            granted = True
+        if granted:
+            self._condition.notify_all()
+
+    def waiting(self):
+        """Number of requests currently waiting for a slot."""
+        with self._condition:
+            return sum(len(tickets) for events in self._waiting.values() for tickets in events.values())
+
+    def in_flight(self):
+        """Number of requests currently holding a slot."""
+        with self._condition:
+            return self._in_flight
+
+
+class BatchCrawler:
+    """
+    Crawl several conferences concurrently under one connection budget.
+
+    Attributes:
+        adapters (list): ConferenceAdapter of each event, in the order given
+        scheduler (ConnectionScheduler): Connection budget shared by the events
+        rate_limiter (RateLimiter): Per-host request rate shared by the events
+        crawlers (dict): Event name -> its IndicoCrawler
+        outputs (dict): Event name -> output file
+    """
+
+    def __init__(self, adapters, max_connections=8, per_host=None, rate=2.0, host_rates=None,
+                 output_dir='.', output_format=None, cache=None, parse_workers=0,
+                 progress_interval=10.0, timeout=30):
+        """
+        Args:
+            adapters (list): ConferenceAdapter objects or registered names
+            max_connections (int): Global cap on concurrent requests
+            per_host (int, optional): Cap on concurrent requests to one host
+                                      (default: ``max_connections``)
+            rate (float): Requests per second allowed per host
+            host_rates (dict, optional): Per-host overrides of ``rate``
+            output_dir (str): Directory the per-event outputs are written to
+            output_format (str, optional): Extension replacing that of each
+                                      adapter's ``output`` (``json``, ``jsonl``,
+                                      ``parquet``, ``arrow``)
+            cache (HTTPCache or str, optional): Response cache shared by the events
+            parse_workers (int): Parse processes per event (0: parse in the fetch threads)
+            progress_interval (float): Seconds between progress lines (0: none)
+            timeout (float): Seconds to wait for a server response
+        """
+        self.adapters = []
+        for adapter in adapters:
+            if isinstance(adapter, str):
+                name, adapter = adapter, get_adapter(adapter)
+                if adapter is None:
+                    raise ValueError(f"No conference adapter registered as '{name}'")
+            self.adapters.append(adapter)
+        names = [adapter.name for adapter in self.adapters]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Conference listed more than once: {', '.join(names)}")
+
+        self.scheduler = ConnectionScheduler(max_connections, per_host)
+        # One event lives on one host, so it never gets more than per_host slots
+        workers = self.scheduler.per_host
+        self.rate_limiter = RateLimiter(requests_per_second=rate, burst=workers,
+                                        host_rates=host_rates)
+        if isinstance(cache, (str, os.PathLike)):
+            cache = HTTPCache(cache)
+        self.parse_workers = parse_workers
+        self.progress_interval = progress_interval
+        self.crawlers = {
+            adapter.name: IndicoCrawler(adapter, workers=workers, rate_limiter=self.rate_limiter,
+                                        cache=cache, timeout=timeout, metrics=Metrics(),
+                                        scheduler=self.scheduler)
+            for adapter in self.adapters
+        }
+        self.outputs = {adapter.name: self.output_path(adapter, output_dir, output_format)
+                        for adapter in self.adapters}
+        self.status = {name: 'queued' for name in names}
+
+    @staticmethod
+    def output_path(adapter, output_dir='.', output_format=None):
+        """Output file of one event: the adapter's ``output``, optionally re-suffixed."""
+        filename = adapter.output
+        if output_format:
+            filename = f"{os.path.splitext(filename)[0]}.{output_format.lstrip('.')}"
+        return os.path.join(output_dir, filename)
+
+    def progress(self, name):
+        """
+        Progress of one event.
+
+        Returns:
+            dict: ``status``, ``done`` and ``failed`` contributions, ``total``
+                  (None until the contribution list is known) and ``requests``
+        """
+        metrics = self.crawlers[name].metrics
+        succeeded = metrics.counter('papers_total', outcome='success')
+        failed = metrics.counter('papers_total', outcome='failure')
+        pending = metrics.gauge('pending_contributions')
+        return {
+            'status': self.status[name],
+            'done': succeeded + failed,
+            'failed': failed,
+            'total': None if pending is None else succeeded + failed + pending,
+            'requests': self.scheduler.granted[name],
+        }
+
+    def log_progress(self):
+        """Log one progress line per event plus the connection budget in use."""
+        for name in self.crawlers:
+            progress = self.progress(name)
+            total = '?' if progress['total'] is None else progress['total']
+            logger.info("[%s] %s: %d/%s papers, %d failed, %d requests", name, progress['status'],
+                        progress['done'], total, progress['failed'], progress['requests'])
+        logger.info("Connections: %d/%d in flight, %d waiting", self.scheduler.in_flight(),
+                    self.scheduler.max_connections, self.scheduler.waiting())
+
+    def _report_progress(self, stop):
+        while not stop.wait(self.progress_interval):
+            self.log_progress()
+
+    def crawl_event(self, name, max_papers=None, resume=False, incremental=False):
+        """
+        Crawl one event into its output file.
+
+        Returns:
+            dict: Event summary (see ``run``)
+        """
+        crawler, output = self.crawlers[name], self.outputs[name]
+        self.status[name] = 'crawling'
+        start = time.perf_counter()
+        try:
+            os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+            journal = CrawlJournal(f"{output}.journal.jsonl")
+            previous = None
+            if incremental and os.path.exists(output):
+                previous = crawler.load_papers(output)
+            options = dict(max_papers=max_papers, journal=journal, resume=resume,
+                           previous=previous, parse_workers=self.parse_workers)
+            if is_jsonl(output):
+                with crawler.open_writer(output) as writer:
+                    papers = crawler.crawl_conference(writer=writer, **options)['extracted']
+            else:
+                papers = crawler.crawl_conference(**options)
+                crawler.save_papers(papers, output)
+                papers = len(papers)
+            # Like srf-insights crawl: the journal is only kept to resume an
+            # event that did not finish cleanly
+            if papers and not journal.failed():
+                journal.reset()
+        except Exception as e:
+            logger.error("❌ %s failed: %s", name, e)
+            self.status[name] = 'failed'
+            summary = {'error': str(e), 'papers': 0}
+        else:
+            self.status[name] = 'done' if papers else 'failed'
+            summary = {'error': None if papers else 'no papers extracted', 'papers': papers}
+
+        progress = self.progress(name)
+        summary.update({
+            'status': self.status[name],
+            'output': output,
+            'failed': progress['failed'],
+            'requests': progress['requests'],
+            'bytes': crawler.metrics.counter('bytes_downloaded_total'),
+            'seconds': round(time.perf_counter() - start, 3),
+            'wait_seconds': round(self.scheduler.wait_seconds[name], 3),
+        })
+        logger.info("[%s] %s: %d papers in %.1fs -> %s", name, summary['status'],
+                    summary['papers'], summary['seconds'], output)
+        return summary
+
+    def run(self, max_papers=None, resume=False, incremental=False):
+        """
+        Crawl every event concurrently.
+
+        Args:
+            max_papers (int, optional): Limit per event
+            resume (bool): Resume each event from its journal
+            incremental (bool): Re-parse only new or changed contributions of
+                                events whose output already exists
+
+        Returns:
+            dict: ``events`` (name -> ``status``, ``papers``, ``failed``,
+                  ``output``, ``requests``, ``bytes``, ``seconds``,
+                  ``wait_seconds`` and ``error``), ``elapsed_seconds``,
+                  ``max_connections`` and ``peak_connections``
+        """
+        logger.info("=== Batch crawl: %d events, %d connections (%d per host) ===",
+                    len(self.crawlers), self.scheduler.max_connections, self.scheduler.per_host)
+        start = time.perf_counter()
+        stop = threading.Event()
+        reporter = None
+        if self.progress_interval and self.progress_interval > 0:
+            reporter = threading.Thread(target=self._report_progress, args=(stop,),
+                                        name='batch-progress', daemon=True)
+            reporter.start()
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.crawlers),
+                                    thread_name_prefix='batch-event') as pool:
+                futures = {name: pool.submit(self.crawl_event, name, max_papers, resume, incremental)
+                           for name in self.crawlers}
+                events = {name: future.result() for name, future in futures.items()}
+        finally:
+            stop.set()
+            if reporter is not None:
+                reporter.join()
+
+        return {
+            'events': events,
+            'elapsed_seconds': round(time.perf_counter() - start, 3),
+            'max_connections': self.scheduler.max_connections,
+            'peak_connections': self.scheduler.peak,
+        }
+
+    def write_metrics(self, directory):
+        """Write each event's run metrics to ``<directory>/<event>.prom``."""
+        os.makedirs(directory, exist_ok=True)
+        for name, crawler in self.crawlers.items():
+            crawler.metrics.write(os.path.join(directory, f"{name.lower()}.prom"))
+
+
+def write_summary(summary, path):
+    """Write a ``BatchCrawler.run`` summary as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Columnar Paper Datasets (Parquet / Arrow IPC)
+
+This module stores paper datasets in columnar form so analyses can load just
+the columns they need. The Arrow schema is derived from
+``conferences/conference_schema.json``: string properties become string
+columns, arrays become list columns (authors, institutions, keywords), and
+integers/numbers become int64/float64. Dataset-level metadata (conference,
+source, crawl date, statistics) travels in the schema metadata.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Streaming writer: papers are converted in record batches, not all at once
+- Parquet (``.parquet``) or Arrow IPC (``.arrow``/``.feather``) by file suffix
+- Column projection and memory-mapped reads
+- Sparse round trip: absent fields are stored as nulls and dropped on read
+- pyarrow is imported on first use, so importing this module stays cheap
+
+Dependencies:
+- pyarrow (optional): ``pip install pyarrow``
+- pandas: DataFrame results of ``read_columns``
+
+Usage:
+    with ColumnarPaperWriter('papers.parquet', metadata={'conference': 'IPAC2025'}) as writer:
+        for paper in papers:
+            writer.write(paper)
+
+    df = read_columns('papers.parquet', ['authors', 'category'])
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+# pyarrow modules, imported by _require_pyarrow on first use
+pa = pa_ipc = pq = None
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / 'conference_schema.json'
+PARQUET_SUFFIXES = ('.parquet',)
+ARROW_SUFFIXES = ('.arrow', '.feather')
+METADATA_KEY = b'srf_metadata'
+
+
+def is_columnar(path):
+    """Return True if ``path`` names a Parquet or Arrow IPC dataset."""
+    return str(path).lower().endswith(PARQUET_SUFFIXES + ARROW_SUFFIXES)
+
+
+def available():
+    """Return True if pyarrow is installed, without importing it."""
+    return pa is not None or importlib.util.find_spec('pyarrow') is not None
+
+
+def _require_pyarrow():
+    global pa, pa_ipc, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Columnar export requires pyarrow: pip install pyarrow") from None
+        pa, pa_ipc, pq = pyarrow, pyarrow.ipc, pyarrow.parquet
+
+
+def load_schema(path=SCHEMA_PATH):
+    """Load the paper record JSON Schema."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _arrow_type(spec):
+    json_type = spec.get('type')
+    if isinstance(json_type, list):
+        json_type = next(t for t in json_type if t != 'null')
+    if json_type == 'array':
+        return pa.list_(_arrow_type(spec.get('items', {'type': 'string'})))
+    return {
+        'string': pa.string(),
+        'integer': pa.int64(),
+        'number': pa.float64(),
+        'boolean': pa.bool_(),
+    }[json_type]
+
+
+def arrow_schema(schema=None):
+    """
+    Derive the Arrow schema from the paper record JSON Schema.
+
+    Args:
+        schema (dict, optional): JSON Schema; defaults to ``conference_schema.json``
+
+    Returns:
+        pyarrow.Schema: One nullable column per property, in property order
+    """
+    _require_pyarrow()
+    schema = schema or load_schema()
+    return pa.schema([pa.field(name, _arrow_type(spec))
+                      for name, spec in schema['properties'].items()])
+
+
+class ColumnarPaperWriter:
+    """
+    Incremental Parquet / Arrow IPC writer for paper datasets.
+
+    Papers are buffered into record batches of ``batch_size`` rows; fields
+    not in the schema are ignored.
+
+    Attributes:
+        path (Path): Output file
+        schema (pyarrow.Schema): Column layout, with dataset metadata attached
+        rows (int): Papers written so far
+    """
+
+    def __init__(self, path, metadata=None, schema=None, batch_size=4096):
+        _require_pyarrow()
+        self.path = Path(path)
+        self.schema = (schema or arrow_schema()).with_metadata(
+            {METADATA_KEY: json.dumps(metadata or {}, ensure_ascii=False).encode('utf-8')})
+        self.batch_size = batch_size
+        self.rows = 0
+        self._columns = {name: [] for name in self.schema.names}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if str(self.path).lower().endswith(PARQUET_SUFFIXES):
+            compression = 'zstd' if pa.Codec.is_available('zstd') else 'snappy'
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=compression)
+        else:
+            self._writer = pa_ipc.new_file(str(self.path), self.schema)
+
+    def write(self, paper):
+        """Append one paper."""
+        for name, values in self._columns.items():
+            values.append(paper.get(name))
+        self.rows += 1
+        if len(self._columns[self.schema.names[0]]) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._columns[self.schema.names[0]]:
+            return
+        batch = pa.record_batch([pa.array(self._columns[field.name], type=field.type)
+                                 for field in self.schema], schema=self.schema)
+        if isinstance(self._writer, pq.ParquetWriter):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+        self._columns = {name: [] for name in self.schema.names}
+
+    def close(self):
+        """Write remaining rows and finalize the file."""
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_papers(path, papers, metadata=None, schema=None):
+    """
+    Write an iterable of papers to a columnar file.
+
+    Returns:
+        int: Number of papers written
+    """
+    with ColumnarPaperWriter(path, metadata, schema) as writer:
+        for paper in papers:
+            writer.write(paper)
+    return writer.rows
+
+
+def read_table(path, columns=None):
+    """
+    Read a columnar dataset as an Arrow table.
+
+    Parquet files are read through a memory map; Arrow IPC files are mapped
+    directly, so unprojected columns are never touched.
+
+    Args:
+        path (str): ``.parquet``, ``.arrow`` or ``.feather`` file
+        columns (list, optional): Column names to load (default: all)
+
+    Returns:
+        pyarrow.Table: The requested columns
+    """
+    _require_pyarrow()
+    if str(path).lower().endswith(PARQUET_SUFFIXES):
+        return pq.read_table(path, columns=columns, memory_map=True)
+    # The table's buffers point into the map, which stays open while they live
+    table = pa_ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def read_columns(path, columns=None):
+    """
+    Load selected columns into a pandas DataFrame.
+
+    Args:
+        path (str): Columnar dataset file
+        columns (list, optional): Column names to load (default: all)
+
+    Returns:
+        pandas.DataFrame: One row per paper
+    """
+    return read_table(path, columns).to_pandas()
+
+
+def read_schema(path):
+    """Read a dataset's Arrow schema without loading any column data."""
+    _require_pyarrow()
+    if str(path).lower().endswith(PARQUET_SUFFIXES):
+        return pq.read_schema(path)
+    with pa.memory_map(str(path), 'r') as source:
+        return pa_ipc.open_file(source).schema
+
+
+def read_metadata(path):
+    """
+    Read the dataset-level metadata without loading any column data.
+
+    Returns:
+        dict: Metadata passed to the writer
+    """
+    raw = (read_schema(path).metadata or {}).get(METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def iter_papers(path, columns=None):
+    """
+    Yield papers as dictionaries, one record batch at a time.
+
+    Null fields are omitted, so papers written with missing fields read back
+    as they were written.
+    """
+    table = read_table(path, columns)
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            yield {key: value for key, value in row.items() if value is not None}
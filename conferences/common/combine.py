@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Multi-Conference Combine Pipeline
+
+This module builds the combined web dataset (``docs/data/papers-combined.json``)
+from the per-conference outputs. Each conference is a registered source: the
+candidate files its data may live in and a converter to the unified paper
+format. Converted papers are cached per source, keyed by the SHA-256 of the
+input file and the converter version, so a run only converts the sources
+that changed; the combined file is then assembled by streaming the cached
+parts.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Source registry with per-conference converters (``register_source``)
+- Input discovery: the first existing candidate file of each source
+- Per-source conversion cache, skipped when the input hash is unchanged
+- Author/institution resolution over all sources (``entities``)
+- Optional Parquet output next to the JSON dataset
+
+Cache layout (``<output dir>/.combine/``):
+    state.json        {"sources": {name: {"input", "sha256", "converter_version", "papers", "part"}}}
+    <source>.jsonl    Converted papers of one source (``paper_io`` JSON Lines)
+
+Adding a conference:
+    register_source('LINAC2026', ['docs/data/linac2026_papers.json'], convert_linac_format)
+
+Usage:
+    summary = combine()                       # docs/data/papers-combined.json
+    srf-insights combine --list
+"""
+
+import hashlib
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from conferences.common import columnar
+from conferences.common.paper_io import JsonlPaperWriter, iter_papers, write_json_document
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_OUTPUT = REPO_ROOT / 'docs' / 'data' / 'papers-combined.json'
+CACHE_DIRNAME = '.combine'
+STATE_VERSION = 1
+
+
+class CombineSource:
+    """A conference dataset that feeds the combined output."""
+
+    def __init__(self, name, candidates, converter, version=1):
+        """
+        Args:
+            name (str): Source name, also the conference label in statistics
+            candidates (list): Input files relative to the repository root, in
+                               order of preference
+            converter (callable): Maps an iterable of input papers to unified papers
+            version (int): Bump when the converter's output changes, to
+                           invalidate cached conversions
+        """
+        self.name = name
+        self.candidates = list(candidates)
+        self.converter = converter
+        self.version = version
+
+    def discover(self, root=REPO_ROOT):
+        """Return the first existing candidate file, or None."""
+        for candidate in self.candidates:
+            path = Path(root) / candidate
+            if path.exists():
+                return path
+        return None
+
+    def convert(self, path):
+        return self.converter(iter_papers(path))
+
+
+SOURCE_REGISTRY = {}
+
+
+def register_source(name, candidates, converter, version=1):
+    """
+    Register (or replace) a conference source.
+
+    Sources are combined in registration order.
+
+    Returns:
+        CombineSource: The registered source
+    """
+    source = CombineSource(name, candidates, converter, version)
+    SOURCE_REGISTRY[name] = source
+    return source
+
+
+# ---------------------------------------------------------------------------
+# Converters
+# ---------------------------------------------------------------------------
+
+def convert_hiat_format(hiat_papers):
+    """Convert HIAT2025 extractor records to the unified format (generator)."""
+    for paper in hiat_papers:
+        yield {
+            "contribution_id": f"HIAT25_{paper.get('paper_number', 0):04d}",
+            "paper_code": f"HIAT25-{paper.get('paper_number', 0):03d}",
+            "title": paper.get('title', 'Unknown Title'),
+            "authors": paper.get('authors', []),
+            "institutions": paper.get('affiliations', [])[:3],  # First three affiliations
+            "abstract": paper.get('abstract', '')[:200] + "..." if paper.get('abstract') else "No abstract available",
+            "keywords": [],  # HIAT data has no keywords
+            "category": "Heavy Ion Accelerator Technology",
+            "type": "Conference Paper",
+            "datetime": "2025/6/22 9:00",  # HIAT2025 date
+            "conference": "HIAT2025",
+            "session": "HIAT",
+            "pages": paper.get('page_count', 4),
+            "doi": f"10.18429/JACoW-HIAT2025-{paper.get('paper_number', 0):03d}",
+            "url": f"https://jacow.org/hiat2025/papers/{paper.get('filename', 'paper')}.pdf",
+            "figures": len(paper.get('figures', [])),
+            "tables": len(paper.get('tables', [])),
+            "references": len(paper.get('references', [])),
+            "file_size_kb": paper.get('file_size_kb', 0),
+            "extraction_source": "HIAT2025"
+        }
+
+
+def convert_ipac_format(ipac_papers):
+    """Convert IPAC2025 crawler records to the unified format (generator)."""
+    for paper in ipac_papers:
+        paper["extraction_source"] = "IPAC2025"
+        yield paper
+
+
+register_source('HIAT2025', ['conferences/HIAT2025/papers.json'], convert_hiat_format)
+register_source('IPAC2025', [
+    'docs/data/ipac2025_papers.json',
+    'conferences/IPAC2025/ipac2025_real_papers.json',
+    'conferences/IPAC2025/ipac2025_real_papers.jsonl',
+    'conferences/IPAC2025/ipac2025_real_papers.parquet',
+], convert_ipac_format)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_state(cache_dir):
+    state_path = cache_dir / 'state.json'
+    if state_path.exists():
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == STATE_VERSION:
+            return state
+    return {'version': STATE_VERSION, 'sources': {}, 'output': None}
+
+
+def _save_state(cache_dir, state):
+    tmp_path = cache_dir / 'state.json.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, cache_dir / 'state.json')
+
+
+def _convert_source(source, path, part_path, entry):
+    """Convert one source into its cached JSON Lines part."""
+    tmp_path = part_path.with_name(part_path.name + '.tmp')
+    with JsonlPaperWriter(tmp_path, {'source': source.name, 'input': entry['input'],
+                                     'sha256': entry['sha256']}) as writer:
+        for paper in source.convert(path):
+            writer.write(paper)
+        count = writer.statistics.total_papers
+    os.replace(tmp_path, part_path)
+    return count
+
+
+def combine(output_file=DEFAULT_OUTPUT, columnar_file=None, sources=None, root=REPO_ROOT,
+            force=False, remove=None):
+    """
+    Update the combined dataset from the registered sources.
+
+    Sources that are not selected, or whose input is missing, keep the papers
+    they contributed to earlier runs; a source is dropped only through ``remove``.
+
+    Args:
+        output_file (str): Combined JSON dataset
+        columnar_file (str, optional): Also write a Parquet/Arrow copy (needs pyarrow)
+        sources (list, optional): CombineSource objects to update (default: the registry)
+        root (str): Directory the source candidates are relative to
+        force (bool): Reconvert the selected sources and rewrite the output
+        remove (list, optional): Names of sources to drop from the dataset
+
+    Returns:
+        dict: ``converted``, ``skipped``, ``missing`` and ``removed`` source names,
+              ``written`` (whether the output was rewritten) and the statistics
+    """
+    output_file = Path(output_file)
+    sources = list(SOURCE_REGISTRY.values()) if sources is None else list(sources)
+    cache_dir = output_file.parent / CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    state = _load_state(cache_dir)
+    previous = state['sources']
+    remove = set(remove or ())
+
+    summary = {'converted': [], 'skipped': [], 'missing': [], 'removed': [], 'written': False}
+    # Start from the previous run so unselected sources are kept
+    current = {name: cached for name, cached in previous.items()
+               if (cache_dir / cached['part']).exists()}
+    for source in sources:
+        if source.name in remove:
+            continue
+        path = source.discover(root)
+        if path is None:
+            summary['missing'].append(source.name)
+            if source.name in current:
+                print(f"❌ No input found for {source.name}; keeping its "
+                      f"{current[source.name]['papers']} previously combined papers")
+            else:
+                print(f"❌ No input found for {source.name}")
+            continue
+
+        entry = {
+            'input': os.path.relpath(path, root),
+            'sha256': file_sha256(path),
+            'converter_version': source.version,
+            'part': f"{source.name.lower()}.jsonl",
+        }
+        part_path = cache_dir / entry['part']
+        cached = previous.get(source.name)
+        if (not force and cached and part_path.exists()
+                and all(cached.get(key) == entry[key] for key in ('input', 'sha256', 'converter_version'))):
+            entry['papers'] = cached['papers']
+            summary['skipped'].append(source.name)
+            print(f"✓ {source.name}: unchanged ({entry['papers']} papers)")
+        else:
+            entry['papers'] = _convert_source(source, path, part_path, entry)
+            summary['converted'].append(source.name)
+            print(f"✓ {source.name}: converted {entry['papers']} papers from {entry['input']}")
+        current[source.name] = entry
+
+    for name in sorted(remove):
+        cached = current.pop(name, None)
+        if cached is None:
+            print(f"❌ {name} is not in the combined dataset")
+            continue
+        (cache_dir / cached['part']).unlink()
+        summary['removed'].append(name)
+        print(f"✓ {name}: removed ({cached['papers']} papers)")
+    state['sources'] = current
+
+    outputs = {'json': str(output_file), 'columnar': str(columnar_file) if columnar_file else None}
+    unchanged = (not force and not summary['converted'] and state.get('output') == outputs
+                 and set(previous) == set(current) and output_file.exists()
+                 and (not columnar_file or Path(columnar_file).exists()))
+    if unchanged:
+        print(f"✓ {output_file} is up to date")
+        _save_state(cache_dir, state)
+        summary['statistics'] = state.get('statistics')
+        return summary
+
+    summary['statistics'] = _write_combined(output_file, columnar_file,
+                                            [cache_dir / entry['part'] for entry in current.values()],
+                                            current)
+    summary['written'] = True
+    state['output'] = outputs
+    state['statistics'] = summary['statistics']
+    _save_state(cache_dir, state)
+    return summary
+
+
+def _write_combined(output_file, columnar_file, part_paths, entries):
+    """Stream the cached parts into the combined dataset."""
+    # numpy (entity resolution) is only loaded when there is something to write
+    from conferences.common.entities import resolve_authors, resolve_institutions
+
+    def all_parts():
+        for part_path in part_paths:
+            yield from iter_papers(part_path)
+
+    # First pass: resolve authors and institutions across every source
+    author_names, institution_names = [], []
+    for paper in all_parts():
+        author_names.extend(paper.get('authors') or [])
+        institution_names.extend(paper.get('institutions') or [])
+    authors = resolve_authors(author_names)
+    institutions = resolve_institutions(institution_names)
+
+    conference_counts = Counter()
+    metadata = {
+        'extraction_time': datetime.now().isoformat(),
+        'sources': {name: {'input': entry['input'], 'sha256': entry['sha256']}
+                    for name, entry in entries.items()},
+    }
+    columnar_writer = None
+    if columnar_file:
+        if not columnar.available():
+            print("❌ pyarrow is not installed; skipping the columnar output")
+        else:
+            columnar_writer = columnar.ColumnarPaperWriter(
+                columnar_file, metadata={'extraction_time': metadata['extraction_time']})
+
+    def papers():
+        for paper in all_parts():
+            paper['author_ids'] = authors.ids_of(paper.get('authors'))
+            paper['institution_ids'] = institutions.ids_of(paper.get('institutions'))
+            conference_counts[paper.get('conference') or paper.get('extraction_source')] += 1
+            if columnar_writer is not None:
+                columnar_writer.write(paper)
+            yield paper
+
+    def statistics():
+        return {
+            'total_papers': sum(conference_counts.values()),
+            'conferences': dict(conference_counts),
+            'total_authors': len(authors),
+            'total_institutions': len(institutions),
+        }
+
+    def trailer():
+        return {
+            **statistics(),
+            'entities': {
+                'authors': {entity_id: authors.names[entity_id] for entity_id in sorted(authors.names)},
+                'institutions': {entity_id: institutions.names[entity_id]
+                                 for entity_id in sorted(institutions.names)},
+            },
+        }
+
+    tmp_path = output_file.with_name(output_file.name + '.tmp')
+    write_json_document(tmp_path, metadata, papers(), trailer=trailer)
+    os.replace(tmp_path, output_file)
+    if columnar_writer is not None:
+        columnar_writer.close()
+
+    stats = statistics()
+    print(f"✅ Combined {stats['total_papers']} papers into {output_file}")
+    for name, count in stats['conferences'].items():
+        print(f"   {name}: {count}")
+    if columnar_writer is not None:
+        print(f"✓ Columnar data saved to: {columnar_file}")
+    return stats
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Author and Institution Resolution
+
+This module maps the raw author and affiliation strings found in conference
+data onto canonical entities, so that "Facility for Rare Isotope Beams",
+"1Facility for Rare Isotope Beams" and "The Facility for Rare Isotope Beams
+(FRIB)" count as one institution. Candidate pairs come from blocking keys and
+MinHash/LSH buckets rather than all-pairs comparison, which keeps resolution
+near-linear in the number of distinct names.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Cleanup of affiliation markers (1, †, *, "also at"), addresses and acronyms
+- Institutions: character-trigram MinHash with LSH banding, verified by Jaccard
+  similarity, plus merging of names that extend a long name word by word
+- Authors: blocking by surname and first initial; initial-only variants
+  ("M. Liu") join a full name only when it is the unique match in the block
+- Stable canonical IDs derived from the resolved names
+
+Usage:
+    institutions = resolve_institutions(raw_affiliations)
+    institutions.id_of('1Facility for Rare Isotope Beams, East Lansing, MI, USA')
+    authors = resolve_authors(raw_authors)
+    authors.name_of('M. Liu')
+"""
+
+import hashlib
+import re
+import unicodedata
+import zlib
+from collections import Counter, defaultdict
+
+import numpy as np
+
+# Institutions with trigram Jaccard similarity at or above this are merged
+INSTITUTION_THRESHOLD = 0.8
+# MinHash signature length and LSH banding (bands * rows == NUM_PERM); with
+# 16 bands of 4 rows, pairs above ~0.5 similarity become candidates
+NUM_PERM = 64
+LSH_BANDS = 16
+# A name extending another word by word is merged only if the shorter one
+# has at least this many words ("University of X" stays apart from "University of X Y")
+PREFIX_MIN_WORDS = 4
+# Shingles gathered per MinHash step (bounds memory to ~NUM_PERM * 4 bytes each)
+MINHASH_CHUNK = 1 << 16
+# Larger LSH buckets are compared against their first member only
+MAX_BUCKET_PAIRS = 64
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_MARKERS_RE = re.compile(r'^(?:\s*(?:\d+|[*†‡§¶#]+|also\s+at\b))+\s*', re.IGNORECASE)
+_TRAILING_RE = re.compile(r'[\s.*†‡§¶#\d,;:-]+$')
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_NON_ALNUM_RE = re.compile(r'[^0-9a-z]+')
+_SURNAME_PARTICLES = {'van', 'von', 'de', 'der', 'den', 'di', 'da', 'del', 'la', 'le', 'du'}
+
+
+def fold(text):
+    """Lowercase ASCII form of a name: accents stripped, punctuation to spaces."""
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+def _stable_id(prefix, key):
+    return f"{prefix}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+
+
+class EntityTable:
+    """Resolution result: raw string -> canonical ID, ID -> canonical name."""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.ids = {}
+        self.names = {}
+        self.variants = defaultdict(list)
+
+    def add(self, entity_id, name, raw_names):
+        self.names[entity_id] = name
+        for raw in raw_names:
+            self.ids[raw] = entity_id
+            self.variants[entity_id].append(raw)
+
+    def id_of(self, raw):
+        """Canonical ID of a raw string, or None if it holds no usable name."""
+        return self.ids.get(raw)
+
+    def name_of(self, raw):
+        """Canonical name of a raw string, or None if it holds no usable name."""
+        entity_id = self.ids.get(raw)
+        return self.names[entity_id] if entity_id else None
+
+    def ids_of(self, raw_names):
+        """Canonical IDs of a list of raw strings, without duplicates or blanks."""
+        ids = []
+        for raw in raw_names or []:
+            entity_id = self.ids.get(raw)
+            if entity_id and entity_id not in ids:
+                ids.append(entity_id)
+        return ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def to_dict(self):
+        """JSON-serializable ``{id: {"name", "variants"}}``."""
+        return {entity_id: {'name': self.names[entity_id], 'variants': sorted(self.variants[entity_id])}
+                for entity_id in sorted(self.names)}
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+# ---------------------------------------------------------------------------
+# Institutions
+# ---------------------------------------------------------------------------
+
+def clean_institution(raw):
+    """
+    Display form of an affiliation string.
+
+    Drops affiliation markers, a leading "The", the address after the first
+    comma and trailing punctuation: "1Facility for Rare Isotope Beams, East
+    Lansing, MI, USA" -> "Facility for Rare Isotope Beams".
+    """
+    name = _MARKERS_RE.sub('', str(raw)).split(',', 1)[0]
+    name = re.sub(r'^the\s+', '', name.strip(), flags=re.IGNORECASE)
+    return _TRAILING_RE.sub('', name).strip()
+
+
+def institution_key(name):
+    """Matching key of a cleaned institution name (acronyms in parentheses dropped)."""
+    return fold(_PARENS_RE.sub(' ', name))
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def minhash_signatures(shingle_sets, num_perm=NUM_PERM, seed=1):
+    """
+    MinHash signatures of shingle sets, computed in one vectorized pass.
+
+    Each distinct shingle is hashed once (crc32, so results do not depend on
+    PYTHONHASHSEED) and permuted with multiply-shift hashing.
+
+    Args:
+        shingle_sets (list): Non-empty sets of strings
+        num_perm (int): Signature length
+
+    Returns:
+        ndarray: uint32 array of shape ``(len(shingle_sets), num_perm)``
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64) * 2 + 1
+    b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    vocabulary = {}
+    sizes = np.array([len(shingles) for shingles in shingle_sets], dtype=np.int64)
+    shingle_ids = np.fromiter((vocabulary.setdefault(shingle, len(vocabulary))
+                               for shingles in shingle_sets for shingle in shingles),
+                              dtype=np.int64, count=int(sizes.sum()))
+    hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in vocabulary),
+                         dtype=np.uint64, count=len(vocabulary))
+    permuted = ((hashes[:, None] * a + b) >> np.uint64(32)).astype(np.uint32)
+
+    # Gather and reduce a bounded number of shingles at a time
+    signatures = np.empty((len(shingle_sets), num_perm), dtype=np.uint32)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    chunk_start = 0
+    while chunk_start < len(shingle_sets):
+        chunk_end = int(np.searchsorted(ends, starts[chunk_start] + MINHASH_CHUNK, side='right'))
+        chunk_end = max(chunk_end, chunk_start + 1)
+        offset = starts[chunk_start]
+        gathered = permuted[shingle_ids[offset:ends[chunk_end - 1]]]
+        signatures[chunk_start:chunk_end] = np.minimum.reduceat(
+            gathered, starts[chunk_start:chunk_end] - offset, axis=0)
+        chunk_start = chunk_end
+    return signatures
+
+
+def lsh_candidates(signatures, bands=LSH_BANDS):
+    """
+    Candidate pairs of rows sharing at least one LSH band.
+
+    Returns:
+        set: ``(i, j)`` pairs with ``i < j``
+    """
+    count, num_perm = signatures.shape
+    rows = num_perm // bands
+    # Fold the rows of a band into one 64-bit bucket key
+    weights = np.random.RandomState(0).randint(1, 1 << 62, size=rows, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    pairs = set()
+    for band in range(bands):
+        keys = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64) @ weights
+        _, bucket_of, bucket_sizes = np.unique(keys, return_inverse=True, return_counts=True)
+        # Only buckets holding two or more rows produce pairs
+        shared = np.flatnonzero(bucket_sizes[bucket_of] > 1)
+        if not len(shared):
+            continue
+        order = shared[np.argsort(bucket_of[shared], kind='stable')]
+        boundaries = np.flatnonzero(np.diff(bucket_of[order])) + 1
+        for members in np.split(order, boundaries):
+            members = members.tolist()
+            if len(members) <= MAX_BUCKET_PAIRS:
+                pairs.update((members[i], other) for i in range(len(members))
+                             for other in members[i + 1:])
+            else:
+                pairs.update((members[0], other) for other in members[1:])
+    return pairs
+
+
+def resolve_institutions(raw_names, threshold=INSTITUTION_THRESHOLD):
+    """
+    Resolve affiliation strings to canonical institutions.
+
+    Args:
+        raw_names (iterable): Raw affiliation strings (repeats count towards
+                              choosing the canonical name)
+        threshold (float): Trigram Jaccard similarity needed to merge
+
+    Returns:
+        EntityTable: IDs are ``inst-<hash>``
+    """
+    raw_counts = Counter(str(raw) for raw in raw_names)
+    display_counts = Counter()
+    raw_by_key = defaultdict(list)
+    displays_by_key = defaultdict(set)
+    for raw, count in raw_counts.items():
+        display = clean_institution(raw)
+        key = institution_key(display)
+        if not key:
+            continue
+        display_counts[display] += count
+        raw_by_key[key].append(raw)
+        displays_by_key[key].add(display)
+
+    keys = sorted(raw_by_key)
+    union = _UnionFind(len(keys))
+
+    # Approximate matches: LSH candidates verified by exact Jaccard similarity
+    shingles = [_trigrams(key) for key in keys]
+    if keys:
+        for i, j in lsh_candidates(minhash_signatures(shingles)):
+            overlap = len(shingles[i] & shingles[j])
+            if overlap / (len(shingles[i]) + len(shingles[j]) - overlap) >= threshold:
+                union.union(i, j)
+
+    # Truncated or extended names: look up each key's leading words as a key
+    position = {key: index for index, key in enumerate(keys)}
+    for index, key in enumerate(keys):
+        words = key.split()
+        for length in range(PREFIX_MIN_WORDS, len(words)):
+            prefix = position.get(' '.join(words[:length]))
+            if prefix is not None:
+                union.union(index, prefix)
+
+    # Most frequent display form; ties go to the longer, then alphabetically first
+    return _build_table('inst', keys, union, displays_by_key, raw_by_key, institution_key,
+                        rank=lambda name: (-display_counts[name], -len(name), name))
+
+
+def _build_table(prefix, keys, union, displays_by_key, raw_by_key, key_of, rank):
+    """Collect union-find clusters into an EntityTable named by their best-ranked display form."""
+    clusters = defaultdict(list)
+    for index in range(len(keys)):
+        clusters[union.find(index)].append(index)
+
+    table = EntityTable(prefix)
+    for members in clusters.values():
+        name = min({display for index in members for display in displays_by_key[keys[index]]}, key=rank)
+        raw = [raw for index in members for raw in raw_by_key[keys[index]]]
+        table.add(_stable_id(prefix, key_of(name)), name, raw)
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Authors
+# ---------------------------------------------------------------------------
+
+def clean_author(raw):
+    """
+    Display form of an author string: markers stripped, "Surname, Given" reordered.
+
+    "H. Alamprese†" -> "H. Alamprese", "Liu, Ming" -> "Ming Liu".
+    """
+    name = re.sub(r'[\d*†‡§¶#]+', ' ', str(raw))
+    if name.count(',') == 1:
+        surname, given = name.split(',')
+        name = f"{given} {surname}"
+    return ' '.join(name.replace(',', ' ').split()).strip(' .-')
+
+
+def split_author(name):
+    """
+    Split a cleaned author name into folded ``(given words, surname)``.
+
+    Lowercase particles before the last word ("van der Berg") belong to the surname.
+    """
+    words = name.split()
+    if not words:
+        return [], ''
+    surname_start = len(words) - 1
+    while surname_start > 1 and words[surname_start - 1].lower() in _SURNAME_PARTICLES:
+        surname_start -= 1
+    # Hyphenated surnames stay one word; hyphenated given names split ("J.-P." -> j p)
+    surname = ' '.join(fold(word).replace(' ', '') for word in words[surname_start:])
+    return fold(' '.join(words[:surname_start])).split(), surname
+
+
+def _initials(given):
+    return ''.join(word[0] for word in given)
+
+
+def _is_initials_only(raw_given):
+    return all(len(word) == 1 for word in raw_given)
+
+
+def resolve_authors(raw_names):
+    """
+    Resolve author strings to canonical authors.
+
+    Names are blocked by surname and first initial. Within a block, names
+    with the same folded given names are one author; an initials-only name
+    ("M. Liu", "J.P. Smith") joins the single full name whose initials it
+    starts, and stays separate when several full names qualify.
+
+    Args:
+        raw_names (iterable): Raw author strings (repeats count towards
+                              choosing the canonical name)
+
+    Returns:
+        EntityTable: IDs are ``auth-<hash>``
+    """
+    raw_counts = Counter(str(raw) for raw in raw_names)
+    display_counts = Counter()
+    raw_by_key = defaultdict(list)
+    displays_by_key = defaultdict(set)
+    blocks = defaultdict(set)
+    for raw, count in raw_counts.items():
+        display = clean_author(raw)
+        key = author_key(display)
+        if not key:
+            continue
+        display_counts[display] += count
+        raw_by_key[key].append(raw)
+        displays_by_key[key].add(display)
+        given, surname = split_author(display)
+        blocks[(surname, given[0][0] if given else '')].add(key)
+
+    keys = sorted(raw_by_key)
+    position = {key: index for index, key in enumerate(keys)}
+    union = _UnionFind(len(keys))
+
+    for block_keys in blocks.values():
+        full, abbreviated = [], []
+        for key in block_keys:
+            given = key.split(' | ')[0].split()
+            (abbreviated if _is_initials_only(given) else full).append((key, _initials(given)))
+        for key, initials in abbreviated:
+            matches = [other for other, other_initials in full if other_initials.startswith(initials)]
+            if len(matches) == 1:
+                union.union(position[key], position[matches[0]])
+            elif not matches:
+                # Otherwise join a longer initials-only form, if unambiguous ("J. Smith" -> "J.P. Smith")
+                longer = [other for other, other_initials in abbreviated
+                          if other != key and other_initials.startswith(initials)]
+                if len(longer) == 1:
+                    union.union(position[key], position[longer[0]])
+
+    # Full-name display forms first, then by frequency and length
+    def rank(name):
+        given = split_author(name)[0]
+        return (_is_initials_only(given), -display_counts[name], -len(name), name)
+
+    return _build_table('auth', keys, union, displays_by_key, raw_by_key, author_key, rank=rank)
+
+
+def author_key(name):
+    """Matching key of a cleaned author name: ``"<given words> | <surname>"``."""
+    given, surname = split_author(name)
+    if not surname:
+        return ''
+    return f"{' '.join(given)} | {surname}"
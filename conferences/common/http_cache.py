@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Persistent HTTP Response Cache
+
+This module provides a content-addressed on-disk cache for crawler responses.
+Entries remember each URL's ETag and Last-Modified validators so that
+recrawls can issue conditional requests and re-parse unchanged pages from
+local disk after a cheap ``304 Not Modified``.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Bodies stored once per SHA-256 digest (identical pages share storage)
+- Per-URL metadata with ETag/Last-Modified validators
+- TTL during which entries are served without any network request
+- Size-bounded eviction of least recently used entries, from an in-memory
+  index built once when the cache is opened
+- Atomic writes, safe to share between crawler worker threads
+
+Layout:
+    <directory>/entries/<sha256(url)>.json   URL metadata and validators
+    <directory>/objects/<ab>/<sha256(body)>  Response bodies
+
+Usage:
+    cache = HTTPCache('.crawl-cache', ttl=3600, max_bytes=512 * 1024 * 1024)
+    crawler = ImprovedIPAC2025Crawler(cache=cache)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Eviction frees space down to this fraction of max_bytes, so it runs once
+# per batch of stores instead of on every store over the bound
+EVICT_TO = 0.9
+
+
+def _atomic_write(path, data):
+    """Write bytes to ``path`` via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class HTTPCache:
+    """
+    Content-addressed on-disk HTTP response cache.
+
+    Entries are indexed in memory when the cache is opened: an LRU order of
+    URL keys, body reference counts and body sizes. Eviction works from the
+    index and never rescans the cache directory.
+
+    Attributes:
+        directory (Path): Cache root directory
+        ttl (float): Seconds an entry is served without revalidation;
+                     0 means always revalidate with a conditional request
+        max_bytes (int): Upper bound on stored body bytes
+        stats (dict): Hit/miss/revalidation/eviction counters
+    """
+
+    def __init__(self, directory, ttl=0, max_bytes=512 * 1024 * 1024, clock=time.time):
+        self.directory = Path(directory)
+        self.ttl = ttl or 0
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries_dir = self.directory / 'entries'
+        self._objects_dir = self.directory / 'objects'
+        self._entries_dir.mkdir(parents=True, exist_ok=True)
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lru = OrderedDict()   # URL key -> body digest, least recently used first
+        self._refcounts = {}        # body digest -> entries referencing it
+        self._sizes = {}            # body digest -> stored size
+        self._orphans = set()       # stored bodies no entry references
+        self._total_bytes = 0
+        self._load_index()
+        self.stats = {
+            'fresh_hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+        }
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, url):
+        return self._entries_dir / f"{self._key(url)}.json"
+
+    def _object_path(self, digest):
+        return self._objects_dir / digest[:2] / digest
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _load_index(self):
+        """Index the entries by last use and the stored bodies by size."""
+        entries = []
+        for path in self._entries_dir.glob('*.json'):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((entry.get('accessed_at', 0), path.stem, entry['digest']))
+        for _, key, digest in sorted(entries):
+            self._lru[key] = digest
+            self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+
+        for object_path in self._objects_dir.glob('*/*'):
+            # Leftovers of interrupted writes are not bodies
+            if object_path.name.startswith('.tmp-'):
+                continue
+            self._sizes[object_path.name] = object_path.stat().st_size
+            self._total_bytes += self._sizes[object_path.name]
+            if object_path.name not in self._refcounts:
+                self._orphans.add(object_path.name)
+
+    def _reference(self, key, digest):
+        """Point ``key`` at ``digest`` as the most recently used entry (lock held)."""
+        previous = self._lru.pop(key, None)
+        if previous is not None:
+            self._release(previous)
+        self._lru[key] = digest
+        self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+        self._orphans.discard(digest)
+
+    def _release(self, digest):
+        """Drop one reference to ``digest`` (lock held)."""
+        self._refcounts[digest] -= 1
+        if self._refcounts[digest] == 0:
+            del self._refcounts[digest]
+            if digest in self._sizes:
+                self._orphans.add(digest)
+
+    def _delete_object(self, digest):
+        """Delete a stored body (lock held)."""
+        self._total_bytes -= self._sizes.pop(digest, 0)
+        self._orphans.discard(digest)
+        self._object_path(digest).unlink(missing_ok=True)
+
+    def lookup(self, url):
+        """
+        Return the cached metadata for ``url``.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            dict: Entry with ``etag``, ``last_modified``, ``digest``,
+                  ``stored_at`` and ``accessed_at``; None on a miss or if
+                  the body has been evicted
+        """
+        path = self._entry_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count('misses')
+            return None
+        if not self._object_path(entry['digest']).exists():
+            self._count('misses')
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """Return True if ``entry`` can be served without revalidation."""
+        return self.ttl > 0 and self._clock() - entry['stored_at'] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Build conditional request headers from a cached entry.
+
+        Returns:
+            dict: ``If-None-Match`` and/or ``If-Modified-Since`` headers
+        """
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, entry, revalidated=False):
+        """
+        Return the cached body for ``entry`` and mark it as used.
+
+        Args:
+            entry (dict): Entry returned by ``lookup``
+            revalidated (bool): True after a 304, which restarts the TTL
+
+        Returns:
+            str: Decoded response body, or None if it was evicted meanwhile
+        """
+        try:
+            body = self._object_path(entry['digest']).read_bytes().decode('utf-8')
+        except OSError:
+            return None
+        now = self._clock()
+        entry = dict(entry, accessed_at=now)
+        if revalidated:
+            entry['stored_at'] = now
+            self._count('revalidated')
+        else:
+            self._count('fresh_hits')
+        _atomic_write(self._entry_path(entry['url']), json.dumps(entry).encode('utf-8'))
+        key = self._key(entry['url'])
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+        return body
+
+    def store(self, url, body, headers=None):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url (str): Request URL
+            body (str): Decoded response body
+            headers (Mapping, optional): Response headers
+
+        Returns:
+            dict: The new cache entry
+        """
+        headers = headers or {}
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        with self._lock:
+            if digest not in self._sizes:
+                _atomic_write(object_path, data)
+                self._sizes[digest] = len(data)
+                self._total_bytes += len(data)
+        now = self._clock()
+        entry = {
+            'url': url,
+            'digest': digest,
+            'size': len(data),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': now,
+            'accessed_at': now,
+        }
+        _atomic_write(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+        with self._lock:
+            self._reference(self._key(url), digest)
+            self.stats['stores'] += 1
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+        return entry
+
+    def evict(self):
+        """
+        Drop least recently used entries until stored bodies fit
+        ``EVICT_TO`` of ``max_bytes``.
+
+        Unreferenced bodies are deleted first; after that, bodies are deleted
+        once no remaining entry references them.
+        """
+        with self._lock:
+            # Bodies orphaned by a page changing go first
+            for digest in list(self._orphans):
+                self._delete_object(digest)
+
+            target = self.max_bytes * EVICT_TO
+            while self._total_bytes > target and self._lru:
+                key, digest = self._lru.popitem(last=False)
+                (self._entries_dir / f"{key}.json").unlink(missing_ok=True)
+                self.stats['evictions'] += 1
+                self._release(digest)
+                if digest in self._orphans:
+                    self._delete_object(digest)
+
+    @property
+    def total_bytes(self):
+        """Total size of stored bodies in bytes."""
+        return self._total_bytes
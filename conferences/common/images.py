@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Figure Image Pipeline
+
+This module turns the figure images extracted from proceedings PDFs into the
+files the web interface serves: each distinct image once, as WebP variants at
+several widths, plus a manifest mapping papers to their figures. Identical
+files and perceptually near-identical images (logos and banners repeated on
+every paper, re-encoded copies) are stored once.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Exact deduplication by SHA-256, near-duplicates by 64-bit difference hash (dHash)
+- WebP variants (``VARIANT_WIDTHS`` plus full size), never upscaled
+- Content-named outputs: unchanged images are not re-encoded on rebuilds
+- Inspection and encoding spread over a process pool
+- Manifest from paper to figures; files no longer referenced are removed
+
+Dependencies:
+- Pillow: Image decoding, resizing and WebP encoding
+
+Output layout (``<output_dir>/``):
+    manifest.json            {"variants", "images": {id: {...}}, "papers": {paper: [figure, ...]}}
+    <id>-<variant>.webp      One variant of one distinct image
+
+Source images are named like the PDF extractor writes them,
+``<paper number>_<title>_page<p>_img<i>.png``; the manifest's paper keys are
+the paper numbers.
+
+Usage:
+    manifest = build_images('conferences/HIAT2025/figures', 'docs/images/hiat2025')
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+MANIFEST_VERSION = 1
+# Variant name -> maximum width in pixels; a full-size variant is always written
+VARIANT_WIDTHS = {'thumb': 160, 'small': 480, 'medium': 960}
+WEBP_QUALITY = 80
+HASH_SIZE = 8
+# Images whose dHashes differ in at most this many of 64 bits are duplicates
+DHASH_THRESHOLD = 4
+# ... provided their aspect ratios are this close
+MAX_ASPECT_DIFFERENCE = 0.05
+ID_LENGTH = 16
+
+_SOURCE_NAME_RE = re.compile(r'^(?P<stem>.*)_page(?P<page>\d+)_img(?P<index>\d+)$')
+_PAPER_NUMBER_RE = re.compile(r'^(\d+)_')
+
+
+def dhash(image, hash_size=HASH_SIZE):
+    """
+    Difference hash of an image.
+
+    The image is reduced to a ``(hash_size + 1) x hash_size`` grayscale grid
+    and each bit records whether a pixel is brighter than its right-hand
+    neighbour, so the hash survives rescaling and re-encoding.
+
+    Returns:
+        int: ``hash_size ** 2``-bit hash
+    """
+    gray = image.convert('L').resize((hash_size + 1, hash_size), Image.LANCZOS)
+    pixels = gray.tobytes()
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = value << 1 | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def _inspect(path):
+    """Hash one source image (process-pool task)."""
+    data = Path(path).read_bytes()
+    with Image.open(path) as image:
+        return {
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'dhash': dhash(image),
+            'width': image.width,
+            'height': image.height,
+            'bytes': len(data),
+        }
+
+
+def _render(task):
+    """Write the WebP variants of one image (process-pool task)."""
+    path, output_dir, image_id = task
+    variants = {}
+    with Image.open(path) as image:
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+        sizes = [(name, width) for name, width in VARIANT_WIDTHS.items() if width < image.width]
+        for name, width in sizes + [('full', image.width)]:
+            filename = f"{image_id}-{name}.webp"
+            target = Path(output_dir) / filename
+            if not target.exists():
+                height = max(1, round(image.height * width / image.width))
+                variant = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                tmp_path = target.with_name(f".{filename}.tmp")
+                variant.save(tmp_path, 'WEBP', quality=WEBP_QUALITY, method=6)
+                os.replace(tmp_path, target)
+            variants[name] = filename
+    return variants
+
+
+def _map(function, items, workers):
+    if workers == 0 or len(items) <= 1:
+        return list(map(function, items))
+    with ProcessPoolExecutor(max_workers=min(workers, len(items)),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(function, items, chunksize=4))
+
+
+def find_duplicates(infos, threshold=DHASH_THRESHOLD):
+    """
+    Assign each image to a canonical image.
+
+    Exact duplicates share a SHA-256. Near-duplicates have dHashes within
+    ``threshold`` bits and similar aspect ratios; the largest image of a
+    group is kept. Candidates are found through hash bands: split into
+    ``threshold + 1`` bands, two hashes within ``threshold`` bits agree on at
+    least one band.
+
+    Args:
+        infos (list): ``_inspect`` results
+        threshold (int): Maximum differing dHash bits
+
+    Returns:
+        list: Index of the canonical image for each input
+    """
+    bits = HASH_SIZE * HASH_SIZE
+    band_count = threshold + 1
+    band_edges = [bits * band // band_count for band in range(band_count + 1)]
+
+    def bands(value):
+        return [(band, (value >> band_edges[band]) & ((1 << (band_edges[band + 1] - band_edges[band])) - 1))
+                for band in range(band_count)]
+
+    canonical = [None] * len(infos)
+    by_digest = {}
+    band_index = {}
+    # Largest first, so a group is represented by its best copy
+    order = sorted(range(len(infos)), key=lambda i: (-infos[i]['width'] * infos[i]['height'], i))
+    for i in order:
+        info = infos[i]
+        if info['sha256'] in by_digest:
+            canonical[i] = by_digest[info['sha256']]
+            continue
+        aspect = info['width'] / info['height']
+        for key in bands(info['dhash']):
+            for j in band_index.get(key, ()):
+                other = infos[j]
+                if (bin(info['dhash'] ^ other['dhash']).count('1') <= threshold
+                        and abs(aspect / (other['width'] / other['height']) - 1) <= MAX_ASPECT_DIFFERENCE):
+                    canonical[i] = j
+                    break
+            if canonical[i] is not None:
+                break
+        if canonical[i] is None:
+            canonical[i] = i
+            for key in bands(info['dhash']):
+                band_index.setdefault(key, []).append(i)
+        by_digest[info['sha256']] = canonical[i]
+    return canonical
+
+
+def _figure_entry(path):
+    """Paper key and figure position from an extractor file name."""
+    match = _SOURCE_NAME_RE.match(path.stem)
+    stem = match.group('stem') if match else path.stem
+    number = _PAPER_NUMBER_RE.match(stem)
+    paper = str(int(number.group(1))) if number else stem
+    entry = {'source': path.name}
+    if match:
+        entry.update(page=int(match.group('page')), index=int(match.group('index')))
+    return paper, entry
+
+
+def build_images(source_dir, output_dir, workers=None, threshold=DHASH_THRESHOLD, pattern='*.png'):
+    """
+    Build deduplicated WebP variants and the manifest of a figure directory.
+
+    Args:
+        source_dir (str): Extracted figure images
+        output_dir (str): Directory to (re)write
+        workers (int, optional): Worker processes (default: CPU count; 0 works in-process)
+        threshold (int): Maximum differing dHash bits of near-duplicates
+        pattern (str): Source file name pattern
+
+    Returns:
+        dict: The manifest that was written
+    """
+    if Image is None:
+        raise ImportError("Pillow is required for the image pipeline")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sources = sorted(Path(source_dir).glob(pattern))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    infos = _map(_inspect, [str(path) for path in sources], workers)
+    canonical = find_duplicates(infos, threshold)
+    ids = {i: infos[i]['sha256'][:ID_LENGTH] for i in sorted(set(canonical))}
+    rendered = _map(_render, [(str(sources[i]), str(output_dir), image_id) for i, image_id in ids.items()],
+                    workers)
+
+    images = {}
+    for (i, image_id), variants in zip(ids.items(), rendered):
+        images[image_id] = {'width': infos[i]['width'], 'height': infos[i]['height'],
+                            'variants': variants, 'sources': []}
+    papers = {}
+    for path, info, i in zip(sources, infos, canonical):
+        image_id = ids[i]
+        images[image_id]['sources'].append(path.name)
+        paper, entry = _figure_entry(path)
+        entry['image'] = image_id
+        papers.setdefault(paper, []).append(entry)
+
+    written = {name for image in images.values() for name in image['variants'].values()}
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'variants': dict(VARIANT_WIDTHS, full=None),
+        'source_count': len(sources),
+        'image_count': len(images),
+        'source_bytes': sum(info['bytes'] for info in infos),
+        'output_bytes': sum((output_dir / name).stat().st_size for name in written),
+        'images': images,
+        'papers': papers,
+    }
+    with open(output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    written.add('manifest.json')
+
+    for path in output_dir.iterdir():
+        if path.is_file() and path.name not in written:
+            path.unlink()
+    return manifest
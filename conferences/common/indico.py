@@ -0,0 +1,914 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Indico Crawl Engine
+
+This module provides the crawl engine shared by every conference hosted on
+Indico (JACoW events such as IPAC, SRF, LINAC). ``IndicoCrawler`` is
+parameterized by a ``ConferenceAdapter`` (``conferences.common.adapters``)
+holding the base URL, event ID, selectors and schema mapping; everything
+else is shared.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Concurrent contribution fetching with a bounded worker pool
+- Per-host rate limiting with status-aware backoff (429/503, Retry-After)
+- Optional persistent response cache (ETag/Last-Modified revalidation)
+- Append-only crawl journal so interrupted crawls can resume
+- Incremental mode re-parsing only new or changed contributions
+- Optional process-pool parse stage fed by I/O workers through a bounded queue
+- Optional raw-HTML WARC archive for offline re-extraction
+- JSON, streaming JSON Lines or columnar Parquet / Arrow IPC output
+- Run metrics and progress logging
+- Optional shared ``ConnectionScheduler`` bounding concurrent requests across
+  crawlers (``conferences.common.batch``)
+
+Dependencies:
+- requests: HTTP client, imported when the first request is made
+- lxml (optional) / beautifulsoup4: HTML parsing (``html_parser``)
+- pyarrow (optional): Parquet / Arrow IPC output
+
+Usage:
+    crawler = IndicoCrawler('ipac2025', workers=8)
+    papers = crawler.crawl_conference()
+    crawler.save_papers(papers)
+"""
+
+import hashlib
+import logging
+import os
+import re
+import json
+import time
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+
+from conferences.common.adapters import get_adapter
+from conferences.common.archive import WarcArchive
+from conferences.common.columnar import is_columnar, write_papers as write_columnar
+from conferences.common.html_parser import SinglePassExtractor, scan_links
+from conferences.common.http_cache import HTTPCache
+from conferences.common.metrics import Metrics
+from conferences.common.paper_io import JsonlPaperWriter, PaperStatistics, is_jsonl, iter_papers
+from conferences.common.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+class IndicoCrawler:
+    """
+    Crawl engine for one Indico event.
+    
+    Everything specific to a conference comes from its ``ConferenceAdapter``:
+    event URL, field selectors and schema mapping. Fetching, caching, rate
+    limiting, journaling, parsing and output are the same for every event.
+    
+    Attributes:
+        adapter (ConferenceAdapter): The conference being crawled
+        base_url (str): Base URL for the Indico system
+        event_url (str): Event URL (``<base_url>/event/<event_id>/``)
+        workers (int): Number of concurrent contribution fetches
+        rate_limiter (RateLimiter): Per-host request pacing and backoff
+        cache (HTTPCache): Optional on-disk response cache, None to disable
+        archive (WarcArchive): Optional raw-HTML archive of every fetched page
+        timeout (float): Seconds to wait for a server response
+        metrics (Metrics): Counters, timers and gauges of the crawler's runs
+        extractor (SinglePassExtractor): Compiled field selectors
+        session (requests.Session): HTTP session with optimized headers,
+                                    created on first use
+    """
+    def __init__(self, adapter, base_url=None, workers=1, rate_limiter=None,
+                 cache=None, parser_backend=None, archive=None, timeout=30,
+                 metrics=None, scheduler=None):
+        """
+        Args:
+            adapter (ConferenceAdapter or str): Conference, or its registered name
+            base_url (str, optional): Indico server, overriding the adapter's
+                                      (e.g. a mirror or a local test server)
+            workers (int): Default number of concurrent contribution fetches
+            rate_limiter (RateLimiter, optional): Shared by every crawler that
+                                      should respect the same per-host limits
+            cache (HTTPCache or str, optional): Response cache or its directory
+            parser_backend (str, optional): ``'lxml'`` or ``'html.parser'``
+            archive (WarcArchive or str, optional): Raw-HTML archive or its path
+            timeout (float): Seconds to wait for a server response
+            metrics (Metrics, optional): Registry to record the runs in
+            scheduler (ConnectionScheduler, optional): Connection budget shared
+                                      with other crawlers; every request waits
+                                      for a slot of it
+        """
+        if isinstance(adapter, str):
+            name, adapter = adapter, get_adapter(adapter)
+            if adapter is None:
+                raise ValueError(f"No conference adapter registered as '{name}'")
+        self.adapter = adapter
+        self.base_url = (base_url or adapter.base_url).rstrip('/')
+        self.event_url = f"{self.base_url}/event/{adapter.event_id}/"
+        self.workers = max(1, int(workers))
+        self.rate_limiter = rate_limiter or RateLimiter(requests_per_second=2.0, burst=4)
+        if isinstance(cache, (str, os.PathLike)):
+            cache = HTTPCache(cache)
+        self.cache = cache
+        if isinstance(archive, (str, os.PathLike)):
+            archive = WarcArchive(archive)
+        self.archive = archive
+        self.timeout = timeout
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.scheduler = scheduler
+        self.extractor = SinglePassExtractor(
+            first_fields=adapter.field_selectors,
+            list_fields={'authors': adapter.author_selectors},
+            backend=parser_backend,
+        )
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """
+        HTTP session shared by all fetch workers.
+        
+        requests is only imported here, so re-extraction from an archive and
+        other offline uses of the crawler never load it.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    session.headers.update({
+                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    })
+                    # Size the connection pool so every worker can keep its own
+                    # keep-alive connection instead of reconnecting per request
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, self.workers))
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+        
+    def get_page_content(self, url, max_retries=3):
+        """
+        Fetch web page content with retry mechanism.
+        
+        Every attempt is paced by ``self.rate_limiter``. Network errors and
+        retryable statuses (429, 5xx) are retried with jittered exponential
+        backoff; other HTTP errors such as 404 fail immediately.
+        
+        With a cache configured, entries younger than the cache TTL are
+        returned without any request; older entries are revalidated with
+        ``If-None-Match``/``If-Modified-Since`` and a ``304`` is served from
+        disk.
+        
+        With an archive configured, every page returned is also appended to
+        it, so the crawl can later be re-extracted without the network.
+        
+        Each attempt is recorded in ``self.metrics``: ``fetch_seconds`` and
+        ``http_requests_total`` by status (``error`` when no response
+        arrived), plus ``bytes_downloaded_total``, ``fetch_retries_total``,
+        ``fetch_failures_total`` and ``cache_hits_total`` by kind.
+        
+        Args:
+            url (str): Target URL to fetch
+            max_retries (int): Maximum number of retry attempts
+            
+        Returns:
+            str: HTML content if successful, None if failed
+        """
+        html_content = self._download_page(url, max_retries)
+        if html_content is not None and self.archive is not None:
+            self.archive.write(url, html_content)
+        return html_content
+    
+    def _download_page(self, url, max_retries):
+        """Fetch a page through the cache and rate limiter (see ``get_page_content``)."""
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            body = self.cache.read_body(cached)
+            if body is not None:
+                self.metrics.inc('cache_hits_total', kind='fresh')
+                return body
+            cached = None
+        
+        for attempt in range(max_retries):
+            response = None
+            try:
+                # Spend the token only once a slot is held: tokens taken while
+                # queued for a slot would all be used in a burst when it frees
+                with self._connection_slot(url):
+                    self.rate_limiter.acquire(url)
+                    logger.debug("Fetching: %s", url)
+                    start = time.perf_counter()
+                    try:
+                        response = self.session.get(url, timeout=self.timeout,
+                                                    headers=HTTPCache.conditional_headers(cached))
+                    finally:
+                        status = response.status_code if response is not None else 'error'
+                        self.metrics.observe('fetch_seconds', time.perf_counter() - start, status=status)
+                        self.metrics.inc('http_requests_total', status=status)
+                self.metrics.inc('bytes_downloaded_total', len(response.content))
+                self.rate_limiter.record_response(url, response.status_code, response.headers)
+                
+                if response.status_code == 304 and cached:
+                    body = self.cache.read_body(cached, revalidated=True)
+                    if body is not None:
+                        self.metrics.inc('cache_hits_total', kind='revalidated')
+                        return body
+                    # Body evicted between lookup and 304: refetch unconditionally
+                    cached = None
+                    continue
+                response.raise_for_status()
+                
+                if self.cache:
+                    self.cache.store(url, response.text, response.headers)
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if 'text/html' in content_type:
+                    return response.text
+                else:
+                    logger.warning("Non-HTML content type %s: %s", content_type, url)
+                    return response.text
+                    
+            except Exception as e:
+                logger.warning("Page fetch failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
+                status = response.status_code if response is not None else None
+                if attempt < max_retries - 1 and self.rate_limiter.is_retryable(status):
+                    self.metrics.inc('fetch_retries_total')
+                    headers = response.headers if response is not None else None
+                    self.rate_limiter.backoff(url, attempt, status, headers)
+                else:
+                    break
+        self.metrics.inc('fetch_failures_total')
+        return None
+    
+    def _connection_slot(self, url):
+        """Slot of the shared connection budget for one request (no-op without a scheduler)."""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(url, self.adapter.name)
+    
+    def find_contribution_links(self, html_content):
+        """
+        Extract all paper contribution links from HTML content.
+        
+        Args:
+            html_content (str): HTML source code from the contributions page
+            
+        Returns:
+            list: List of unique contribution URLs, ordered by contribution ID
+        """
+        # One regex pass collects both <a href> links to specific papers
+        # (not list pages) and absolute paper URLs anywhere in the page
+        contribution_links = scan_links(html_content, self.adapter.contribution_pattern(),
+                                        self.base_url)
+        
+        # Sort by contribution ID so crawl order (and output order) is deterministic
+        contribution_list = sorted(contribution_links, key=self._contribution_sort_key)
+        logger.info("Found %d unique paper links", len(contribution_list))
+        for i, link in enumerate(contribution_list[:3]):
+            logger.debug("  %d. %s", i + 1, link)
+        
+        return contribution_list
+    
+    @staticmethod
+    def _contribution_id(url):
+        """Return the contribution ID in a contribution URL, or None."""
+        match = re.search(r'/contributions/(\d+)', url)
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def _contribution_sort_key(url):
+        """Sort key ordering contribution URLs by numeric ID, then by URL."""
+        match = re.search(r'/contributions/(\d+)', url)
+        return (int(match.group(1)) if match else -1, url)
+    
+    @staticmethod
+    def page_hash(html_content):
+        """Return the SHA-256 hex digest identifying a page's content."""
+        return page_hash(html_content)
+    
+    def extract_paper_info(self, contribution_url):
+        """
+        Extract detailed paper information from a single contribution page.
+        
+        Args:
+            contribution_url (str): URL of the specific paper contribution page
+            
+        Returns:
+            dict: Paper information containing title, authors, abstract, etc.
+                 None if extraction fails
+        """
+        html_content = self.get_page_content(contribution_url)
+        if not html_content:
+            return None
+        return self.parse_paper_info(contribution_url, html_content)
+    
+    def parse_paper_info(self, contribution_url, html_content):
+        """
+        Parse paper information from already fetched contribution page HTML.
+        
+        Args:
+            contribution_url (str): URL the page was fetched from
+            html_content (str): HTML source of the contribution page
+            
+        Returns:
+            dict: Paper information, including the ``page_hash`` of the HTML.
+                 None if extraction fails
+        """
+        timings = {}
+        paper_info = parse_contribution_html(contribution_url, html_content, self.extractor,
+                                             self.adapter, timings)
+        self._record_parse_timings(timings)
+        return paper_info
+    
+    def _record_parse_timings(self, timings):
+        """Add the field group timings of one parse to ``parse_seconds``."""
+        for group, seconds in timings.items():
+            self.metrics.observe('parse_seconds', seconds, group=group)
+    
+    def _crawl_contribution(self, link, journal=None, previous=None):
+        """
+        Extract one contribution and record the outcome in the journal.
+        
+        Args:
+            link (str): Contribution URL
+            journal (CrawlJournal, optional): Journal to append the outcome to
+            previous (dict, optional): Record of this contribution from an
+                                     earlier crawl; returned unchanged (and
+                                     the page not re-parsed) if the page
+                                     hash still matches
+            
+        Returns:
+            dict: Paper information, None if extraction failed
+        """
+        html_content, paper_info = self._fetch_contribution(link, previous)
+        if html_content:
+            paper_info = self.parse_paper_info(link, html_content)
+        return self._record_outcome(link, paper_info, journal)
+    
+    def _fetch_contribution(self, link, previous=None):
+        """
+        Fetch stage: download a contribution page.
+        
+        Returns:
+            tuple: ``(html, None)`` if the page needs parsing,
+                   ``(None, previous)`` if its hash matches ``previous``,
+                   ``(None, None)`` if the fetch failed
+        """
+        html_content = self.get_page_content(link)
+        if not html_content:
+            return None, None
+        if previous and previous.get('page_hash') == self.page_hash(html_content):
+            return None, previous
+        return html_content, None
+    
+    def _record_outcome(self, link, paper_info, journal=None):
+        """Validate an extracted paper, count and journal the outcome."""
+        if not (paper_info and paper_info.get('title')):
+            paper_info = None
+        self.metrics.inc('papers_total', outcome='success' if paper_info else 'failure')
+        if journal is not None:
+            if paper_info:
+                journal.record_success(link, paper_info)
+            else:
+                journal.record_failure(link, 'extraction failed')
+        return paper_info
+    
+    def _crawl_pipeline(self, links, workers, parse_workers, journal=None,
+                        previous_by_id=None, queue_size=None, on_result=None):
+        """
+        Crawl contributions with separate fetch and parse stages.
+        
+        ``workers`` I/O threads download pages into a bounded queue; the
+        calling thread drains it into a pool of ``parse_workers`` processes,
+        keeping at most two parse jobs per process in flight. When parsing
+        falls behind, the queue fills up and the fetch threads block, so
+        memory stays bounded no matter how fast pages arrive. The
+        ``fetch_queue_depth`` and ``parse_in_flight`` gauges track both.
+        
+        If the calling thread stops early (an exception from ``on_result``,
+        a failed submit, ``KeyboardInterrupt``), queued fetches are cancelled,
+        running ones stop waiting for queue space and outstanding parse jobs
+        are cancelled, so the exception propagates instead of the fetch
+        threads blocking on a queue nobody drains.
+        
+        Args:
+            links (list): Contribution URLs to crawl
+            workers (int): Number of fetch threads
+            parse_workers (int): Number of parse processes
+            journal (CrawlJournal, optional): Journal for outcomes
+            previous_by_id (dict, optional): Incremental-mode previous records
+            queue_size (int, optional): Fetched pages buffered between the
+                                       stages (default: 4 per fetch thread)
+            on_result (callable, optional): Called with ``(link, paper_info)``
+                                       as soon as each outcome is known,
+                                       instead of collecting the outcomes
+            
+        Returns:
+            dict: Contribution URL -> paper information (None on failure);
+                  empty when ``on_result`` is given
+        """
+        previous_by_id = previous_by_id or {}
+        fetched = queue.Queue(maxsize=queue_size or 4 * workers)
+        max_in_flight = 2 * parse_workers
+        results = {}
+        stop = threading.Event()
+        
+        def fetch(link):
+            if stop.is_set():
+                return
+            html_content, paper_info = None, None
+            try:
+                previous = previous_by_id.get(self._contribution_id(link))
+                html_content, paper_info = self._fetch_contribution(link, previous)
+            finally:
+                # Always hand something to the parse stage so it never waits
+                # for a page that is not coming, unless the parse stage is gone
+                while not stop.is_set():
+                    try:
+                        fetched.put((link, html_content, paper_info), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        
+        def collect(done):
+            for future in done:
+                link = in_flight.pop(future)
+                try:
+                    paper_info, timings = future.result()
+                    self._record_parse_timings(timings)
+                except Exception as e:
+                    logger.warning("Error parsing %s: %s", link, e)
+                    paper_info = None
+                deliver(link, self._record_outcome(link, paper_info, journal))
+        
+        def deliver(link, paper_info):
+            if on_result is not None:
+                on_result(link, paper_info)
+            else:
+                results[link] = paper_info
+        
+        # Spawned (not forked) parse processes: forking while fetch threads
+        # hold locks can deadlock the children
+        parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_parse_worker,
+            initargs=(self.extractor, self.adapter),
+        )
+        in_flight = {}
+        fetches = []
+        with parse_pool, ThreadPoolExecutor(max_workers=workers) as fetch_pool:
+            try:
+                for link in links:
+                    fetches.append(fetch_pool.submit(fetch, link))
+                
+                for i in range(1, len(links) + 1):
+                    link, html_content, paper_info = fetched.get()
+                    self.metrics.set_gauge('fetch_queue_depth', fetched.qsize())
+                    if html_content is None:
+                        deliver(link, self._record_outcome(link, paper_info, journal))
+                    else:
+                        while len(in_flight) >= max_in_flight:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            collect(done)
+                        in_flight[parse_pool.submit(_parse_in_worker, link, html_content)] = link
+                        self.metrics.set_gauge('parse_in_flight', len(in_flight))
+                    if i % 50 == 0:
+                        logger.info("Fetched %d/%d papers, %d queued, %d parsing",
+                                    i, len(links), fetched.qsize(), len(in_flight))
+                
+                collect(wait(in_flight).done)
+            finally:
+                # No-op after a complete run; after an early exit, release
+                # fetch threads blocked on the full queue and drop pending work
+                # (by hand: shutdown(cancel_futures=True) needs Python 3.9)
+                stop.set()
+                for future in fetches + list(in_flight):
+                    future.cancel()
+                fetch_pool.shutdown(wait=False)
+        return results
+    
+    def crawl_conference(self, max_papers=None, workers=None, journal=None, resume=False,
+                         previous=None, parse_workers=0, writer=None):
+        """
+        Main crawling function to extract all conference papers.
+        
+        Args:
+            max_papers (int, optional): Maximum number of papers to crawl.
+                                      If None, crawls all available papers.
+            workers (int, optional): Number of concurrent fetch workers.
+                                   Defaults to the crawler's ``workers``.
+            journal (CrawlJournal, optional): Journal that records every
+                                   contribution outcome as soon as it is known.
+            resume (bool): Reuse papers already completed in ``journal`` and
+                           only fetch contributions that are new or failed.
+                           Without it, an existing journal is discarded.
+            previous (list, optional): Papers from an earlier crawl (see
+                           ``load_papers``). Enables incremental mode:
+                           contributions are matched by ``contribution_id``,
+                           only new pages and pages whose ``page_hash``
+                           changed are parsed, and contributions no longer
+                           listed are dropped. Combine with an ``HTTPCache``
+                           so unchanged pages cost a ``304`` instead of a
+                           download.
+            parse_workers (int): If positive, parse pages in this many worker
+                           processes fed by the fetch workers through a
+                           bounded queue (see ``_crawl_pipeline``). Use it
+                           when parsing, not the network, is the bottleneck.
+            writer (JsonlPaperWriter, optional): Receives each paper, in
+                           contribution order, as soon as it and every
+                           paper before it are done (see ``open_writer``).
+                           Written papers are not kept, so memory stays
+                           flat however large the event is.
+                                      
+        Returns:
+            list: List of paper dictionaries with extracted information,
+                  in contribution ID order regardless of worker count.
+                  With a ``writer``, a dict of counts instead: ``links``
+                  found, papers ``extracted`` and ``failed``
+        """
+        workers = max(1, int(workers or self.workers))
+        logger.info("=== %s Indico Crawler ===", self.adapter.name)
+        logger.info("Target website: %s", self.event_url)
+        
+        papers = []
+        
+        # 1. Get main contributions list page
+        contributions_url = f"{self.event_url}contributions/"
+        logger.info("Step 1: Fetching contributions list page")
+        with self.metrics.span('stage_seconds', stage='list'):
+            html_content = self.get_page_content(contributions_url)
+        
+        if not html_content:
+            logger.error("❌ Failed to fetch contributions list page")
+            return papers if writer is None else self._crawl_counts(0, 0)
+        
+        # 2. Extract all paper links
+        logger.info("Step 2: Parsing paper links")
+        with self.metrics.span('stage_seconds', stage='links'):
+            contribution_links = self.find_contribution_links(html_content)
+        
+        if not contribution_links:
+            logger.error("❌ No paper links found")
+            return papers if writer is None else self._crawl_counts(0, 0)
+        
+        # 3. Optional limit on number of papers to crawl
+        if max_papers and len(contribution_links) > max_papers:
+            contribution_links = contribution_links[:max_papers]
+            logger.info("Limiting to first %d papers", max_papers)
+        else:
+            logger.info("Will crawl all %d papers", len(contribution_links))
+        
+        # Skip contributions finished by a previous, interrupted run
+        results = {}
+        if journal is not None:
+            if resume:
+                completed = journal.completed()
+                results = {link: completed[link] for link in contribution_links
+                           if link in completed}
+                logger.info("Resuming: %d papers already completed in %s", len(results), journal.path)
+            else:
+                journal.reset()
+        pending = [link for link in contribution_links if link not in results]
+        
+        # Incremental mode: diff discovered contribution IDs against the
+        # previous output
+        previous_by_id = {}
+        if previous is not None:
+            previous_by_id = {str(p['contribution_id']): p for p in previous
+                              if p.get('contribution_id')}
+            discovered_ids = {self._contribution_id(link) for link in contribution_links}
+            new_count = len(discovered_ids - set(previous_by_id))
+            removed_count = len(set(previous_by_id) - discovered_ids)
+            logger.info("Incremental: %d new, %d known, %d no longer listed",
+                        new_count, len(discovered_ids) - new_count, removed_count)
+        
+        def crawl_one(link):
+            return self._crawl_contribution(
+                link, journal, previous_by_id.get(self._contribution_id(link)))
+        
+        # Outcomes are tallied as they arrive, so writer mode can drop
+        # papers once they are written
+        finished = success_count = unchanged = 0
+        
+        def tally(paper_info):
+            nonlocal finished, success_count, unchanged
+            finished += 1
+            if paper_info:
+                success_count += 1
+                if paper_info is previous_by_id.get(str(paper_info.get('contribution_id'))):
+                    unchanged += 1
+        
+        for paper_info in results.values():
+            tally(paper_info)
+        
+        # Stream finished papers to the writer in contribution order: a
+        # paper is written (and forgotten) once every contribution before it
+        # has an outcome
+        written = 0
+        
+        def flush():
+            nonlocal written
+            if writer is None:
+                return
+            while written < len(contribution_links) and contribution_links[written] in results:
+                paper = results.pop(contribution_links[written])
+                if paper:
+                    writer.write(paper)
+                written += 1
+        
+        def deliver(link, paper_info):
+            results[link] = paper_info
+            tally(paper_info)
+            self.metrics.set_gauge('pending_contributions', len(contribution_links) - finished)
+            flush()
+        
+        flush()  # papers resumed from the journal
+        self.metrics.set_gauge('pending_contributions', len(pending))
+        
+        # 4. Extract detailed information for each paper
+        logger.info("Step 3: Extracting detailed paper information")
+        
+        with self.metrics.span('stage_seconds', stage='contributions'):
+            if parse_workers and parse_workers > 0:
+                logger.info("Pipeline: %d fetch workers -> %d parse processes", workers, parse_workers)
+                self._crawl_pipeline(pending, workers, parse_workers, journal,
+                                     previous_by_id, on_result=deliver)
+            elif workers > 1:
+                logger.info("Using %d concurrent workers", workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # map() yields results in submission order; outcomes are
+                    # journaled inside the workers as soon as each one finishes
+                    outcomes = executor.map(crawl_one, pending)
+                    for i, (link, paper_info) in enumerate(zip(pending, outcomes), 1):
+                        deliver(link, paper_info)
+                        if i % 50 == 0:
+                            logger.info("Processed %d/%d papers", i, len(pending))
+            else:
+                for i, link in enumerate(pending, 1):
+                    logger.debug("Processing paper %d/%d", i, len(pending))
+                    deliver(link, crawl_one(link))
+        
+        if writer is None:
+            papers = [results[link] for link in contribution_links if results.get(link)]
+        if previous is not None:
+            self.metrics.inc('papers_unchanged_total', unchanged)
+            logger.info("Incremental: %d unchanged, %d parsed", unchanged, success_count - unchanged)
+        
+        logger.info("=== Crawling Complete ===")
+        logger.info("Paper links found: %d", len(contribution_links))
+        logger.info("Successfully extracted: %d", success_count)
+        logger.info("Failed: %d", len(contribution_links) - success_count)
+        for host, stats in self.rate_limiter.metrics().items():
+            self.metrics.set_gauge('rate_limit_throttled_seconds', stats['throttled_seconds'], host=host)
+            self.metrics.set_gauge('rate_limit_backoff_seconds', stats['backoff_seconds'], host=host)
+            logger.info("Rate limiting (%s): %d requests, %.1fs throttled, %d retries, %.1fs backing off",
+                        host, stats['requests'], stats['throttled_seconds'],
+                        stats['retries'], stats['backoff_seconds'])
+        if self.cache:
+            logger.info("HTTP cache: %d fresh hits, %d revalidated (304), %d downloaded",
+                        self.cache.stats['fresh_hits'], self.cache.stats['revalidated'],
+                        self.cache.stats['stores'])
+        
+        if writer is not None:
+            return self._crawl_counts(len(contribution_links), success_count)
+        return papers
+    
+    @staticmethod
+    def _crawl_counts(links, extracted):
+        """Return value of ``crawl_conference`` in writer mode."""
+        return {'links': links, 'extracted': extracted, 'failed': links - extracted}
+    
+    def reextract_from_archive(self, archive, parse_workers=0):
+        """
+        Re-run extraction over the contribution pages in a raw-HTML archive.
+        
+        No network requests are made. When a page was archived several
+        times, its latest copy is used.
+        
+        Args:
+            archive (WarcArchive or str): Archive written by an earlier crawl
+            parse_workers (int): Parse in this many processes (0: in-process)
+            
+        Returns:
+            list: Paper dictionaries in contribution order
+        """
+        if isinstance(archive, (str, os.PathLike)):
+            archive = WarcArchive(archive)
+        contribution_url = re.compile(re.escape(self.base_url) + self.adapter.contribution_pattern())
+        pages = {url: record.body for url, record in archive.latest_records().items()
+                 if contribution_url.fullmatch(url) and record.status == 200}
+        links = sorted(pages, key=self._contribution_sort_key)
+        logger.info("Re-extracting %d archived contribution pages", len(links))
+        
+        with self.metrics.span('stage_seconds', stage='reextract'):
+            if parse_workers and parse_workers > 1:
+                with ProcessPoolExecutor(
+                    max_workers=parse_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_parse_worker,
+                    initargs=(self.extractor, self.adapter),
+                ) as pool:
+                    parsed = pool.map(_parse_in_worker, links, [pages[link] for link in links],
+                                      chunksize=16)
+                    results = []
+                    for paper_info, timings in parsed:
+                        self._record_parse_timings(timings)
+                        results.append(paper_info)
+            else:
+                results = [self.parse_paper_info(link, pages[link]) for link in links]
+        
+        papers = [self._record_outcome(link, paper_info)
+                  for link, paper_info in zip(links, results)]
+        papers = [paper for paper in papers if paper]
+        logger.info("Re-extracted %d papers from %s", len(papers), archive.path)
+        return papers
+    
+    @staticmethod
+    def load_papers(filename):
+        """
+        Load the paper list from a file written by ``save_papers``.
+        
+        Args:
+            filename (str): Path to a previous crawl output (JSON or JSON Lines)
+            
+        Returns:
+            list: Paper dictionaries
+        """
+        return list(iter_papers(filename))
+    
+    def output_metadata(self):
+        """Dataset-level fields written ahead of the papers."""
+        return {
+            'conference': self.adapter.name,
+            'source': 'Real Indico Website',
+            'url': self.event_url,
+            'crawl_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+    
+    def open_writer(self, filename):
+        """
+        Open a streaming JSON Lines writer for ``crawl_conference(writer=...)``.
+        
+        Args:
+            filename (str): Output ``.jsonl`` file
+            
+        Returns:
+            JsonlPaperWriter: Writer; close it to add the statistics trailer
+        """
+        return JsonlPaperWriter(filename, self.output_metadata())
+    
+    def save_papers(self, papers, filename=None):
+        """
+        Save extracted paper data to JSON file with statistics.
+        
+        A ``.jsonl`` filename selects the JSON Lines format, which streams
+        ``papers`` (any iterable) to disk one paper at a time. A ``.parquet``
+        or ``.arrow`` filename writes a columnar dataset laid out by
+        ``conference_schema.json`` (requires pyarrow).
+        
+        Args:
+            papers (list): List of paper dictionaries to save
+            filename (str, optional): Output file (default: the adapter's ``output``)
+        """
+        output_file = filename or self.adapter.output
+        
+        try:
+            with self.metrics.span('stage_seconds', stage='save'):
+                stats = self._write_papers(papers, output_file)
+            logger.info("✓ Data saved to: %s", output_file)
+            logger.info("Statistics:")
+            for key, value in stats.items():
+                logger.info("  %s: %s", key, value)
+        except Exception as e:
+            logger.error("❌ Failed to save file: %s", e)
+    
+    def _write_papers(self, papers, output_file):
+        """Write ``papers`` in the format chosen by ``output_file`` and return its statistics."""
+        if is_jsonl(output_file):
+            with self.open_writer(output_file) as writer:
+                for paper in papers:
+                    writer.write(paper)
+            stats = writer.statistics.as_dict()
+        elif is_columnar(output_file):
+            statistics = PaperStatistics()
+            for paper in papers:
+                statistics.add(paper)
+            stats = statistics.as_dict()
+            metadata = self.output_metadata()
+            metadata['statistics'] = stats
+            write_columnar(output_file, papers, metadata)
+        else:
+            statistics = PaperStatistics()
+            for paper in papers:
+                statistics.add(paper)
+            stats = statistics.as_dict()
+            data = self.output_metadata()
+            data.update({'statistics': stats, 'papers': papers})
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        return stats
+
+def page_hash(html_content):
+    """Return the SHA-256 hex digest identifying a page's content."""
+    return hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+
+def parse_contribution_html(contribution_url, html_content, extractor, adapter, timings=None):
+    """
+    Parse paper information from a contribution page.
+    
+    Module-level so that it can run in a parse worker process.
+    
+    Args:
+        contribution_url (str): URL the page was fetched from
+        html_content (str): HTML source of the contribution page
+        extractor (SinglePassExtractor): Compiled field selectors
+        adapter (ConferenceAdapter): Conference name and schema mapping
+        timings (dict, optional): Receives the seconds spent per field
+                                  group: ``fields`` (the single pass over
+                                  the page for title, abstract, category,
+                                  datetime and author candidates),
+                                  ``authors`` (author selection) and
+                                  ``identity`` (contribution ID, page hash)
+        
+    Returns:
+        dict: Paper information, including the ``page_hash`` of the HTML.
+             None if extraction fails
+    """
+    paper_info = {
+        'url': contribution_url,
+        'title': '',
+        'authors': [],
+        'institutions': [],
+        'abstract': '',
+        'category': '',
+        'session': '',
+        'type': '',
+        'datetime': '',
+        'keywords': [],
+        'conference': adapter.name
+    }
+    
+    if timings is None:
+        timings = {}
+    start = time.perf_counter()
+    try:
+        # All fields are collected in a single traversal of the page
+        fields = extractor.extract(html_content)
+        timings['fields'] = time.perf_counter() - start
+        start = time.perf_counter()
+        
+        paper_info['title'] = fields['title']
+        paper_info['abstract'] = fields['abstract']
+        paper_info['category'] = fields['category']
+        paper_info['datetime'] = fields['datetime']
+        
+        # Use the first author pattern that yields any plausible name
+        for candidates in fields['authors']:
+            for author_name in candidates:
+                if author_name and len(author_name) > 2:
+                    paper_info['authors'].append(author_name)
+            if paper_info['authors']:
+                break
+        timings['authors'] = time.perf_counter() - start
+        start = time.perf_counter()
+        
+        # Extract ID from URL
+        url_match = re.search(r'/contributions/(\d+)', contribution_url)
+        if url_match:
+            paper_info['contribution_id'] = url_match.group(1)
+        
+        paper_info['page_hash'] = page_hash(html_content)
+        paper_info = adapter.map_record(paper_info)
+        timings['identity'] = time.perf_counter() - start
+        
+        logger.debug("✓ Successfully extracted: %s...", paper_info['title'][:50])
+        
+    except Exception as e:
+        logger.warning("Error extracting paper information from %s: %s", contribution_url, e)
+        return None
+        
+    return paper_info
+
+# Extractor and adapter of the current parse worker process, set by _init_parse_worker
+_worker_extractor = None
+_worker_adapter = None
+
+def _init_parse_worker(extractor, adapter):
+    global _worker_extractor, _worker_adapter
+    _worker_extractor, _worker_adapter = extractor, adapter
+
+def _parse_in_worker(contribution_url, html_content):
+    """Parse one page in a worker process; returns ``(paper_info, timings)``."""
+    timings = {}
+    paper_info = parse_contribution_html(contribution_url, html_content, _worker_extractor,
+                                         _worker_adapter, timings)
+    return paper_info, timings
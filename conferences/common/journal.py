@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Crawl State Journal
+
+This module provides an append-only JSON Lines journal that records the
+outcome of every contribution as a crawl progresses, so an interrupted crawl
+can resume where it stopped instead of starting from zero.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- One JSON record per completed or failed contribution, flushed immediately
+- Tolerates a truncated final line left behind by a crash
+- Latest record per URL wins, so retried failures become successes
+- Thread-safe appends for concurrent crawls
+
+Record format:
+    {"url": "...", "contribution_id": "123", "status": "ok", "paper": {...}, "time": ...}
+    {"url": "...", "contribution_id": "124", "status": "failed", "error": "...", "time": ...}
+
+Usage:
+    journal = CrawlJournal('papers.json.journal.jsonl')
+    papers = crawler.crawl_conference(journal=journal, resume=True)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+
+class CrawlJournal:
+    """
+    Append-only record of per-contribution crawl outcomes.
+
+    Attributes:
+        path (Path): Journal file location
+        fsync (bool): Force each record to disk, not just to the OS
+    """
+
+    def __init__(self, path, fsync=False):
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def contribution_id(url):
+        match = re.search(r'/contributions/(\d+)', url)
+        return match.group(1) if match else None
+
+    def _append(self, record):
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a+b') as f:
+                # Terminate a partial line left by a crash so this record
+                # is not glued onto it
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+    def record_success(self, url, paper):
+        """Record a successfully extracted paper."""
+        self._append({
+            'url': url,
+            'contribution_id': self.contribution_id(url),
+            'status': 'ok',
+            'paper': paper,
+            'time': time.time(),
+        })
+
+    def record_failure(self, url, error=None):
+        """Record a contribution that could not be extracted."""
+        self._append({
+            'url': url,
+            'contribution_id': self.contribution_id(url),
+            'status': 'failed',
+            'error': error,
+            'time': time.time(),
+        })
+
+    def records(self):
+        """
+        Read the latest record for every URL in the journal.
+
+        Returns:
+            dict: URL -> record; empty if the journal does not exist
+        """
+        latest = {}
+        if not self.path.exists():
+            return latest
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Partial line from an interrupted write
+                    continue
+                latest[record['url']] = record
+        return latest
+
+    def completed(self):
+        """
+        Return papers already extracted successfully.
+
+        Returns:
+            dict: URL -> paper dictionary
+        """
+        return {url: record['paper'] for url, record in self.records().items()
+                if record.get('status') == 'ok'}
+
+    def failed(self):
+        """Return URLs whose latest attempt failed."""
+        return [url for url, record in self.records().items()
+                if record.get('status') != 'ok']
+
+    def reset(self):
+        """Discard the journal to start a fresh crawl."""
+        with self._lock:
+            if self.path.exists():
+                self.path.unlink()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Run Metrics and Tracing Hooks
+
+This module provides a small, thread-safe instrumentation registry for the
+crawlers: counters, timers and gauges keyed by name and labels, plus span
+hooks for tracing. At the end of a run the registry is written as a
+Prometheus text exposition file or as a JSON report, showing where a crawl
+spent its time.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Counters (``inc``), timers (``observe``/``timer``) and gauges (``set_gauge``)
+- Labels on every series, e.g. ``fetch_seconds{status="200"}``
+- Timer summaries with count, sum, mean, p50/p90/p99 and max
+- Gauges remember their maximum, e.g. the deepest a queue got
+- Spans: timed blocks reported to registered hooks (tracing, live logging)
+- Prometheus text format or JSON export, chosen by file extension
+
+Usage:
+    metrics = Metrics()
+    with metrics.span('stage_seconds', stage='fetch'):
+        metrics.inc('bytes_downloaded_total', len(body))
+    metrics.write('crawl-metrics.prom')     # or crawl-metrics.json
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Quantiles reported for every timer
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _key(labels):
+    return tuple(sorted((str(name), str(value)) for name, value in labels.items()))
+
+
+def _quantile(ordered, fraction):
+    """Nearest-rank quantile of a sorted, non-empty list."""
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Metrics:
+    """
+    Thread-safe registry of counters, timers and gauges.
+
+    Attributes:
+        prefix (str): Prepended to every metric name on export
+    """
+
+    def __init__(self, prefix='srf'):
+        self.prefix = prefix
+        self._counters = {}
+        self._timers = {}
+        self._gauges = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def inc(self, name, value=1, **labels):
+        """Add ``value`` to a counter."""
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            key = _key(labels)
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration of a timer."""
+        with self._lock:
+            self._timers.setdefault(name, {}).setdefault(_key(labels), []).append(seconds)
+
+    def set_gauge(self, name, value, **labels):
+        """Set a gauge, keeping track of the highest value it has had."""
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            key = _key(labels)
+            _, peak = series.get(key, (value, value))
+            series[key] = (value, max(peak, value))
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time a block into the timer ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def add_hook(self, hook):
+        """
+        Register a tracing hook.
+
+        Args:
+            hook (callable): Called with a dict (``name``, ``labels``,
+                             ``start`` epoch time, ``seconds``, ``error``)
+                             when each span ends
+        """
+        self._hooks.append(hook)
+
+    @contextmanager
+    def span(self, name, **labels):
+        """
+        Time a block into the timer ``name`` and report it to the hooks.
+
+        ``error`` in the hook event is the exception type name if the block
+        raised, otherwise None; the exception is not swallowed.
+        """
+        start, begin = time.time(), time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - begin
+            self.observe(name, seconds, **labels)
+            event = {'name': name, 'labels': dict(labels), 'start': start,
+                     'seconds': seconds, 'error': error}
+            for hook in list(self._hooks):
+                hook(event)
+
+    def counter(self, name, **labels):
+        """Current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_key(labels), 0)
+
+    def gauge(self, name, **labels):
+        """Current value of a gauge (None if never set)."""
+        with self._lock:
+            value = self._gauges.get(name, {}).get(_key(labels))
+            return value[0] if value is not None else None
+
+    def to_dict(self):
+        """
+        Snapshot of every series.
+
+        Returns:
+            dict: ``counters``, ``timers`` and ``gauges``, each mapping a metric
+                  name to a list of ``{'labels': ..., ...}`` series
+        """
+        with self._lock:
+            counters = {name: [{'labels': dict(key), 'value': value}
+                               for key, value in sorted(series.items())]
+                        for name, series in sorted(self._counters.items())}
+            timers = {}
+            for name, series in sorted(self._timers.items()):
+                timers[name] = []
+                for key, values in sorted(series.items()):
+                    ordered = sorted(values)
+                    summary = {'labels': dict(key), 'count': len(ordered), 'sum': sum(ordered),
+                               'mean': sum(ordered) / len(ordered), 'max': ordered[-1]}
+                    for fraction in QUANTILES:
+                        summary[f'p{round(fraction * 100)}'] = _quantile(ordered, fraction)
+                    timers[name].append(summary)
+            gauges = {name: [{'labels': dict(key), 'value': value, 'max': peak}
+                             for key, (value, peak) in sorted(series.items())]
+                      for name, series in sorted(self._gauges.items())}
+        return {'started': self.started, 'elapsed_seconds': time.time() - self.started,
+                'counters': counters, 'timers': timers, 'gauges': gauges}
+
+    def to_prometheus(self):
+        """
+        Render every series in the Prometheus text exposition format.
+
+        Timers become summaries (quantiles plus ``_sum``/``_count``); each
+        gauge also gets a ``<name>_max`` gauge.
+
+        Returns:
+            str: Exposition text
+        """
+        snapshot = self.to_dict()
+        lines = []
+        for name, series in snapshot['counters'].items():
+            metric = f'{self.prefix}_{name}'
+            lines.append(f'# TYPE {metric} counter')
+            for item in series:
+                lines.append(f"{metric}{_format_labels(_key(item['labels']))} {item['value']}")
+        for name, series in snapshot['timers'].items():
+            metric = f'{self.prefix}_{name}'
+            lines.append(f'# TYPE {metric} summary')
+            for item in series:
+                key = _key(item['labels'])
+                for fraction in QUANTILES:
+                    value = item[f'p{round(fraction * 100)}']
+                    lines.append(f"{metric}{_format_labels(key, [('quantile', fraction)])} {value:.6f}")
+                lines.append(f"{metric}_sum{_format_labels(key)} {item['sum']:.6f}")
+                lines.append(f"{metric}_count{_format_labels(key)} {item['count']}")
+        for name, series in snapshot['gauges'].items():
+            metric = f'{self.prefix}_{name}'
+            for suffix, field in (('', 'value'), ('_max', 'max')):
+                lines.append(f'# TYPE {metric}{suffix} gauge')
+                for item in series:
+                    lines.append(f"{metric}{suffix}{_format_labels(_key(item['labels']))} {item[field]}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Write the metrics report: JSON for a ``.json`` path, Prometheus text otherwise.
+
+        Args:
+            path (str): Output file, replaced atomically
+        """
+        path = os.fspath(path)
+        if path.endswith('.json'):
+            content = json.dumps(self.to_dict(), indent=2) + '\n'
+        else:
+            content = self.to_prometheus()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
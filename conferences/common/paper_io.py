@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Paper Dataset I/O
+
+This module reads and writes paper datasets without holding them in memory.
+Besides the original single JSON document (``{"...": ..., "papers": [...]}``)
+it supports a JSON Lines format that is written one paper at a time, so a
+crawl's output grows as papers are extracted and readers can stream through
+many conferences with flat memory use.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+JSON Lines layout (``*.jsonl``):
+    {"record_type": "header", "format": "srf-papers", "version": 1, "conference": ..., ...}
+    {"title": ..., "authors": [...], ...}          one line per paper
+    {"record_type": "statistics", "statistics": {...}}
+
+The statistics trailer is written when the writer is closed; a file from an
+interrupted run simply lacks it, and a torn final line is ignored.
+
+Usage:
+    with JsonlPaperWriter('papers.jsonl', {'conference': 'IPAC2025'}) as writer:
+        for paper in papers:
+            writer.write(paper)
+
+    metadata, papers = open_papers('papers.jsonl')
+    for paper in papers:
+        ...
+"""
+
+import json
+import os
+from pathlib import Path
+
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+FORMAT_NAME = 'srf-papers'
+FORMAT_VERSION = 1
+
+
+def is_jsonl(path):
+    """Return True if ``path`` names a JSON Lines dataset."""
+    return str(path).lower().endswith(JSONL_SUFFIXES)
+
+
+class PaperStatistics:
+    """
+    Running dataset statistics, updated one paper at a time.
+
+    Produces the same keys the crawler has always written in its output.
+    """
+
+    def __init__(self):
+        self.total_papers = 0
+        self.papers_with_abstracts = 0
+        self.papers_with_authors = 0
+        self.title_length_sum = 0
+
+    def add(self, paper):
+        self.total_papers += 1
+        self.papers_with_abstracts += bool(paper.get('abstract'))
+        self.papers_with_authors += bool(paper.get('authors'))
+        self.title_length_sum += len(paper.get('title', ''))
+
+    def as_dict(self):
+        return {
+            'total_papers': self.total_papers,
+            'papers_with_abstracts': self.papers_with_abstracts,
+            'papers_with_authors': self.papers_with_authors,
+            'average_title_length': (self.title_length_sum / self.total_papers
+                                     if self.total_papers else 0),
+        }
+
+
+class JsonlPaperWriter:
+    """
+    Incremental JSON Lines writer for paper datasets.
+
+    Every ``write`` is flushed, so the file is usable while a crawl is still
+    running. Use as a context manager, or call ``close`` to add the
+    statistics trailer.
+
+    Attributes:
+        path (Path): Output file
+        statistics (PaperStatistics): Statistics of the papers written so far
+    """
+
+    def __init__(self, path, metadata=None):
+        self.path = Path(path)
+        self.statistics = PaperStatistics()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        header = {'record_type': 'header', 'format': FORMAT_NAME, 'version': FORMAT_VERSION}
+        header.update(metadata or {})
+        self._write_line(header)
+
+    def _write_line(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def write(self, paper):
+        """Append one paper."""
+        self.statistics.add(paper)
+        self._write_line(paper)
+
+    def close(self):
+        """Write the statistics trailer and close the file."""
+        if self._file.closed:
+            return
+        self._write_line({'record_type': 'statistics', 'statistics': self.statistics.as_dict()})
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _iter_jsonl_records(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Torn final line from an interrupted write
+                continue
+
+
+def _read_jsonl_trailer(path, tail_bytes=65536):
+    """Read the statistics trailer from the end of the file, if present."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - tail_bytes))
+        lines = f.read().splitlines()
+    for line in reversed(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get('record_type') == 'statistics':
+            return record.get('statistics')
+        return None
+    return None
+
+
+def open_papers(path):
+    """
+    Open a paper dataset for streaming.
+
+    JSON Lines files are read lazily, line by line. Legacy JSON documents (a
+    ``{"papers": [...]}`` object or a bare list) have to be parsed whole, but
+    are exposed through the same interface. Parquet and Arrow files are read
+    batch by batch (see ``conferences.common.columnar``).
+
+    Args:
+        path (str): Dataset file
+
+    Returns:
+        tuple: ``(metadata, papers)`` where ``metadata`` is a dict of the
+               dataset-level fields (including ``statistics`` when known)
+               and ``papers`` is an iterator of paper dictionaries
+    """
+    if str(path).lower().endswith(('.parquet', '.arrow', '.feather')):
+        from conferences.common import columnar
+        return columnar.read_metadata(path), columnar.iter_papers(path)
+
+    if is_jsonl(path):
+        records = _iter_jsonl_records(path)
+        first = next(records, None)
+        metadata = {}
+        if isinstance(first, dict) and first.get('record_type') == 'header':
+            metadata = {k: v for k, v in first.items() if k != 'record_type'}
+            first = None
+        statistics = _read_jsonl_trailer(path)
+        if statistics is not None:
+            metadata['statistics'] = statistics
+
+        def papers():
+            if first is not None:
+                yield first
+            for record in records:
+                if 'record_type' not in record:
+                    yield record
+        return metadata, papers()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return {}, iter(data)
+    metadata = {k: v for k, v in data.items() if k != 'papers'}
+    return metadata, iter(data.get('papers', []))
+
+
+def iter_papers(path):
+    """
+    Yield the papers of a dataset one at a time.
+
+    Args:
+        path (str): Dataset file (``.json``, ``.jsonl``, ``.parquet`` or ``.arrow``)
+
+    Yields:
+        dict: Paper dictionaries in file order
+    """
+    _, papers = open_papers(path)
+    yield from papers
+
+
+def write_json_document(path, metadata, papers, trailer=None):
+    """
+    Write a single-document JSON dataset while streaming the papers.
+
+    Papers are serialized one at a time, so they can come from a generator.
+    Dataset-level values that depend on the papers (counts and the like) can
+    be supplied by ``trailer``, which is called after the last paper and
+    whose keys are written after ``papers``.
+
+    Args:
+        path (str): Output file
+        metadata (dict): Fields written before ``papers``
+        papers (iterable): Paper dictionaries
+        trailer (callable, optional): Returns a dict of fields for the end
+    """
+    def indent(value, level):
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+        return text.replace('\n', '\n' + ' ' * level)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n')
+        for key, value in metadata.items():
+            f.write(f'  {json.dumps(key, ensure_ascii=False)}: {indent(value, 2)},\n')
+        f.write('  "papers": [')
+        first = True
+        for paper in papers:
+            f.write(('\n' if first else ',\n') + '    ' + indent(paper, 4))
+            first = False
+        f.write('\n  ]' if not first else ']')
+        for key, value in (trailer() if trailer else {}).items():
+            f.write(f',\n  {json.dumps(key, ensure_ascii=False)}: {indent(value, 2)}')
+        f.write('\n}\n')
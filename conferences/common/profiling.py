@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Command Profiling
+
+This module runs a function (a CLI subcommand) under a profiler and reports
+where the time and memory went: a deterministic profile (cProfile, written
+as a pstats file) or a wall-clock sampling profile of every thread (written
+as collapsed stacks for flame graph tools), each with a top-N summary of hot
+functions and of time per package, so time spent in BeautifulSoup parsing,
+network waits and JSON serialization can be told apart. Allocations can be
+tracked with tracemalloc on request.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- ``cprofile`` mode: exact call counts and times of the calling thread (pstats file)
+- ``sample`` mode: low-overhead stack sampling of all threads (collapsed stacks),
+  showing where fetch workers wait as well as where they compute
+- Top-N hot functions plus time per package (bs4, socket, json, ...)
+- Optional tracemalloc: top allocation sites and peak traced memory
+
+Only the current process is profiled; parse worker processes
+(``--parse-workers``) are not.
+
+Usage:
+    result = profile_call(command, 'crawl.pstats')
+    result = profile_call(command, 'crawl.collapsed', mode='sample', memory=True)
+    # flamegraph.pl crawl.collapsed > crawl.svg  /  speedscope crawl.collapsed
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+MODES = ('cprofile', 'sample')
+DEFAULT_INTERVAL = 0.005
+
+_STDLIB_DIR = os.path.normcase(sysconfig.get_paths()['stdlib'])
+
+
+def package_name(filename):
+    """
+    Top-level package or module a source file belongs to.
+
+    Args:
+        filename (str): ``co_filename`` of a code object
+
+    Returns:
+        str: e.g. ``bs4``, ``requests``, ``json``, ``socket``; ``<builtin>``
+             for C functions and ``<unknown>`` for code without a file
+    """
+    if not filename or filename == '~':
+        return '<builtin>'
+    if filename.startswith('<'):
+        return '<unknown>'
+    path = os.path.normcase(os.path.abspath(filename))
+    parts = path.split(os.sep)
+    for marker in ('site-packages', 'dist-packages'):
+        if marker in parts:
+            rest = parts[parts.index(marker) + 1:]
+            return os.path.splitext(rest[0])[0] if rest else '<unknown>'
+    if path.startswith(_STDLIB_DIR + os.sep):
+        rest = path[len(_STDLIB_DIR) + 1:].split(os.sep)
+        return os.path.splitext(rest[0])[0]
+    try:
+        relative = os.path.relpath(path)
+    except ValueError:  # other drive on Windows
+        return os.path.splitext(parts[-1])[0]
+    if relative.startswith('..'):
+        return os.path.splitext(parts[-1])[0]
+    return os.path.splitext(relative.split(os.sep)[0])[0]
+
+
+def _frame_label(frame):
+    """``module:qualified.name`` of a frame, e.g. ``bs4.builder:TreeBuilder.feed``."""
+    code = frame.f_code
+    module = frame.f_globals.get('__name__') or os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """
+    Wall-clock sampling profiler over every thread of the process.
+
+    A background thread records the stack of each other thread every
+    ``interval`` seconds. Samples are kept as collapsed stacks
+    (``thread;outer;...;inner`` -> count), the input format of flame graph
+    tools.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.leaf_packages = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                labels = []
+                leaf = frame.f_code.co_filename
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                thread = names.get(ident, str(ident)).replace(';', '_').replace(' ', '_')
+                self.stacks[';'.join([thread] + labels[::-1])] += 1
+                self.leaf_packages[package_name(leaf)] += 1
+            self.samples += 1
+
+    def write(self, path):
+        """Write the collapsed stacks, one ``stack count`` line each."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def summary(self):
+        """
+        Hot functions by samples.
+
+        Returns:
+            tuple: ``(self_counts, total_counts)`` Counters of function label
+                   -> samples with the function on top of / anywhere in the stack
+        """
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            labels = stack.split(';')[1:]
+            if labels:
+                own[labels[-1]] += count
+            for label in set(labels):
+                total[label] += count
+        return own, total
+
+
+def _print_sample_report(sampler, elapsed, top, stream):
+    own, total = sampler.summary()
+    thread_samples = sum(sampler.stacks.values()) or 1
+    print(f"\n=== Profile: {sampler.samples} samples over {elapsed:.2f} s "
+          f"({thread_samples} thread samples) ===", file=stream)
+    print("Top functions by own samples (% of thread samples, own / total):", file=stream)
+    for label, count in own.most_common(top):
+        print(f"  {100 * count / thread_samples:5.1f}% {100 * total[label] / thread_samples:5.1f}%  {label}",
+              file=stream)
+    _print_packages(sampler.leaf_packages, thread_samples, top, '% of thread samples', stream)
+
+
+def _print_cprofile_report(stats, elapsed, top, stream):
+    print(f"\n=== Profile: {elapsed:.2f} s ===", file=stream)
+    stats.sort_stats('cumulative').print_stats(top)
+    packages = Counter()
+    for (filename, _, _), (_, _, own_time, _, _) in stats.stats.items():
+        packages[package_name(filename)] += own_time
+    _print_packages(packages, sum(packages.values()) or 1, top, 'own time', stream)
+
+
+def _print_packages(packages, whole, top, unit, stream):
+    print(f"Time by package ({unit}):", file=stream)
+    for package, amount in packages.most_common(top):
+        print(f"  {100 * amount / whole:5.1f}%  {package}", file=stream)
+
+
+def _print_memory_report(snapshot, peak, top, stream):
+    print(f"\n=== Memory: peak {peak / 1024 / 1024:.1f} MB traced ===", file=stream)
+    print("Top allocation sites (live at exit):", file=stream)
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        print(f"  {stat.size / 1024:10.1f} KB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}",
+              file=stream)
+
+
+def profile_call(func, output, mode='cprofile', top=20, interval=DEFAULT_INTERVAL,
+                 memory=False, stream=None):
+    """
+    Run ``func()`` under a profiler, write the profile and print a summary.
+
+    Args:
+        func (callable): Function to run without arguments
+        output (str): Profile file: pstats for ``cprofile`` (load with
+                      ``python -m pstats`` or snakeviz), collapsed stacks
+                      for ``sample`` (flamegraph.pl, speedscope)
+        mode (str): ``cprofile`` (deterministic) or ``sample``
+        top (int): Entries in each summary table
+        interval (float): Sampling interval in seconds (``sample`` mode)
+        memory (bool): Also trace allocations with tracemalloc (slows
+                       allocation-heavy code down noticeably)
+        stream (file, optional): Where the summary goes (default: stderr)
+
+    Returns:
+        The return value of ``func``
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown profile mode '{mode}', expected one of {', '.join(MODES)}")
+    stream = stream or sys.stderr
+    if memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if mode == 'cprofile' else StackSampler(interval)
+    start = time.perf_counter()
+    try:
+        if mode == 'cprofile':
+            result = profiler.runcall(func)
+        else:
+            profiler.start()
+            try:
+                result = func()
+            finally:
+                profiler.stop()
+    finally:
+        elapsed = time.perf_counter() - start
+        snapshot = peak = None
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        if mode == 'cprofile':
+            profiler.dump_stats(output)
+            _print_cprofile_report(pstats.Stats(profiler, stream=stream), elapsed, top, stream)
+        else:
+            profiler.write(output)
+            _print_sample_report(profiler, elapsed, top, stream)
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+            _print_memory_report(snapshot, peak, top, stream)
+        print(f"✓ Profile saved to: {output}", file=stream)
+    return result
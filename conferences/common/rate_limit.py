@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Per-Host Rate Limiting
+
+This module provides a reusable, thread-safe rate limiter for the conference
+crawlers: a token bucket per host plus status-aware backoff, so a crawl runs
+at the highest request rate a server allows without tripping its limits.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Token bucket per host with configurable requests-per-second and burst
+- Exponential backoff with full jitter for retryable status codes
+- Honors ``Retry-After`` and ``X-RateLimit-Remaining``/``X-RateLimit-Reset``
+- Adaptive rate: halves on 429/503 and recovers gradually on success
+- Per-host metrics including time spent throttled and backing off
+
+Usage:
+    limiter = RateLimiter(requests_per_second=2.0)
+    limiter.acquire(url)
+    response = session.get(url)
+    limiter.record_response(url, response.status_code, response.headers)
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Status codes worth retrying; everything else in 4xx fails immediately
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Status codes meaning "you are going too fast"
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value, now=None):
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value (str): Header value, either delay seconds or an HTTP date
+        now (float, optional): Current epoch time, for testing
+
+    Returns:
+        float: Delay in seconds (never negative), or None if unparseable
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, retry_at - now)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with reservation semantics.
+
+    Callers that find the bucket empty reserve a future token (the balance
+    may go negative) and sleep outside the lock, so concurrent workers are
+    spaced out evenly instead of waking up together.
+
+    Attributes:
+        rate (float): Current refill rate in tokens per second
+        burst (float): Maximum number of stored tokens
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Take one token and return how long the caller must wait for it.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        return self.reserve_split()[0]
+
+    def reserve_split(self):
+        """
+        Take one token, telling the rate-limit wait from a pause.
+
+        Returns:
+            tuple: ``(wait, rate_wait)``: seconds to wait before sending the
+                   request, and the part of it caused by the token deficit
+                   alone (the rest is a ``pause`` still in effect)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            rate_wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            wait = rate_wait
+            if self._blocked_until > now:
+                wait = max(wait, self._blocked_until - now)
+            return wait, rate_wait
+
+    def pause(self, seconds):
+        """Block the bucket for at least ``seconds`` from now."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def set_rate(self, rate):
+        """Change the refill rate, keeping tokens accrued so far."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+
+
+class RateLimiter:
+    """
+    Per-host rate limiter with adaptive, status-aware backoff.
+
+    Each host gets its own token bucket, created on first use. Throttling
+    responses (429/503) pause the whole host, not just the calling worker,
+    and temporarily lower its rate; successful responses restore it.
+
+    Per-host metrics are sums over all calling threads, not wall time:
+    ``throttled_seconds`` adds up the waits each worker spent on the request
+    rate alone, ``backoff_seconds`` the retry and server-requested delays
+    (each counted once, however many workers then wait out a host pause).
+
+    Attributes:
+        requests_per_second (float): Target rate for hosts without an override
+        host_rates (dict): Per-host overrides of the target rate
+        base_delay (float): First backoff step in seconds
+        max_delay (float): Upper bound for a single backoff
+    """
+
+    def __init__(self, requests_per_second=2.0, burst=None, host_rates=None,
+                 base_delay=1.0, max_delay=60.0, min_rate=0.1,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.requests_per_second = float(requests_per_second)
+        self.burst = burst
+        self.host_rates = dict(host_rates or {})
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_rate = min_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url):
+        """Return the ``host[:port]`` part of a URL."""
+        return urlparse(url).netloc.lower()
+
+    def target_rate(self, host):
+        return float(self.host_rates.get(host, self.requests_per_second))
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.target_rate(host), self.burst, clock=self._clock)
+                self._buckets[host] = bucket
+                self._metrics[host] = {
+                    'requests': 0,
+                    'throttled_seconds': 0.0,
+                    'backoff_seconds': 0.0,
+                    'retries': 0,
+                    'throttle_responses': 0,
+                    'status_counts': {},
+                }
+            return bucket
+
+    def _record(self, host, key, amount=1):
+        with self._lock:
+            self._metrics[host][key] += amount
+
+    def acquire(self, url):
+        """
+        Block until a request to ``url``'s host is allowed.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        host = self.host_of(url)
+        wait, rate_wait = self._bucket(host).reserve_split()
+        self._record(host, 'requests')
+        # Time spent waiting out a pause was already counted as backoff
+        if rate_wait > 0:
+            self._record(host, 'throttled_seconds', rate_wait)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    @staticmethod
+    def is_retryable(status):
+        """Return True if a response with this status should be retried."""
+        return status is None or status in RETRYABLE_STATUSES
+
+    def record_response(self, url, status, headers=None):
+        """
+        Feed a response back into the limiter.
+
+        Adapts the host rate to throttling signals and pauses the host when
+        the server reports an exhausted request budget.
+
+        Args:
+            url (str): Requested URL
+            status (int): HTTP status code
+            headers (Mapping, optional): Response headers
+        """
+        host = self.host_of(url)
+        bucket = self._bucket(host)
+        headers = headers or {}
+        with self._lock:
+            counts = self._metrics[host]['status_counts']
+            counts[str(status)] = counts.get(str(status), 0) + 1
+
+        target = self.target_rate(host)
+        if status in THROTTLE_STATUSES:
+            self._record(host, 'throttle_responses')
+            bucket.set_rate(max(self.min_rate, bucket.rate / 2))
+        elif 200 <= status < 400 and bucket.rate < target:
+            bucket.set_rate(min(target, bucket.rate + target * 0.1))
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            try:
+                remaining, reset = int(remaining), float(reset)
+            except ValueError:
+                return
+            if remaining <= 0:
+                # Reset is either a delay or an absolute epoch timestamp
+                delay = reset - time.time() if reset > 1e9 else reset
+                if delay > 0:
+                    delay = min(delay, self.max_delay)
+                    self._record(host, 'backoff_seconds', delay)
+                    bucket.pause(delay)
+
+    def backoff(self, url, attempt, status=None, headers=None):
+        """
+        Schedule a retry after a failed attempt.
+
+        The delay is exponential with full jitter, raised to ``Retry-After``
+        when the server sends one. Throttling statuses pause the whole host;
+        other failures only delay the calling worker.
+
+        Args:
+            url (str): URL that failed
+            attempt (int): Zero-based attempt number that just failed
+            status (int, optional): HTTP status, None for network errors
+            headers (Mapping, optional): Response headers
+
+        Returns:
+            float: Backoff delay in seconds
+        """
+        host = self.host_of(url)
+        bucket = self._bucket(host)
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = parse_retry_after((headers or {}).get('Retry-After'))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+
+        self._record(host, 'retries')
+        self._record(host, 'backoff_seconds', delay)
+        if status in THROTTLE_STATUSES:
+            bucket.pause(delay)
+        else:
+            self._sleep(delay)
+        return delay
+
+    def metrics(self):
+        """
+        Return a snapshot of per-host metrics.
+
+        Returns:
+            dict: Host -> counters, including the current adapted rate
+        """
+        with self._lock:
+            snapshot = {}
+            for host, values in self._metrics.items():
+                entry = dict(values)
+                entry['status_counts'] = dict(values['status_counts'])
+                entry['current_rate'] = self._buckets[host].rate
+                snapshot[host] = entry
+            return snapshot
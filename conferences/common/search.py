@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - BM25 Search
+
+This module provides ranked full-text search over a paper dataset for scripts
+and CI jobs. A one-time build writes a BM25F index (per-field term
+frequencies and lengths) as NumPy arrays; loading memory-maps them, so a
+query only touches the postings of its own terms.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- BM25F ranking over title, abstract, authors and keywords
+- Field boosts chosen at query time
+- Conference and category filters
+- Index rebuilt automatically when the dataset changes
+
+Index layout (``<dataset>.bm25/``):
+    meta.json         Fields, vocabulary, filter labels, dataset fingerprint
+    offsets.npy       int64 [terms + 1]   postings range of each term
+    postings.npy      int32 [postings]    document IDs, sorted per term
+    tf.npy            float32 [postings, fields]  term frequency per field
+    lengths.npy       float32 [docs, fields]      field lengths in tokens
+    conference.npy    int32 [docs]        code into meta["conferences"]
+    category.npy      int32 [docs]        code into meta["categories"]
+    docs.jsonl        Display fields of each paper, one line per document
+    doc_offsets.npy   int64 [docs]        byte offset of each line
+
+Usage:
+    index = SearchIndex.open('docs/data/papers-combined.json')
+    for hit in index.search('nb3sn cavity', conference='IPAC2025', top_k=5):
+        print(hit['score'], hit['paper']['title'])
+"""
+
+import json
+import math
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from conferences.common.paper_io import open_papers
+from conferences.common.text_index import tokenize
+
+INDEX_VERSION = 1
+SEARCH_FIELDS = ['title', 'abstract', 'authors', 'keywords']
+DEFAULT_BOOSTS = {'title': 2.0, 'abstract': 1.0, 'authors': 1.0, 'keywords': 1.5}
+# Paper fields kept in the index for displaying results
+DOC_FIELDS = ['contribution_id', 'paper_code', 'title', 'authors', 'conference',
+              'category', 'session', 'doi', 'url']
+
+K1 = 1.2
+B = 0.75
+
+
+def default_index_dir(dataset_path):
+    """Index directory used for a dataset unless one is given."""
+    return Path(f"{dataset_path}.bm25")
+
+
+def dataset_fingerprint(dataset_path):
+    stat = os.stat(dataset_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _field_tokens(paper, field):
+    value = paper.get(field)
+    if isinstance(value, (list, tuple)):
+        value = ' '.join(str(item) for item in value)
+    return tokenize(str(value)) if value else []
+
+
+def build_index(dataset_path, index_dir=None, fields=SEARCH_FIELDS):
+    """
+    Build and write the BM25 index of a dataset.
+
+    ``meta.json`` is written last, so an interrupted build is never loaded.
+
+    Args:
+        dataset_path (str): Any dataset file supported by ``paper_io.open_papers``
+        index_dir (str, optional): Output directory (default: ``<dataset>.bm25``)
+        fields (list): Paper fields to index
+
+    Returns:
+        dict: The index metadata
+    """
+    index_dir = Path(index_dir or default_index_dir(dataset_path))
+    index_dir.mkdir(parents=True, exist_ok=True)
+    meta_path = index_dir / 'meta.json'
+    if meta_path.exists():
+        meta_path.unlink()
+
+    fingerprint = dataset_fingerprint(dataset_path)
+    _, papers = open_papers(dataset_path)
+
+    term_ids = {}
+    # One entry per (term, document) pair, in document order
+    posting_terms, posting_docs, posting_tf = [], [], []
+    lengths = []
+    conference_codes, category_codes = [], []
+    conferences, categories = {}, {}
+    doc_offsets = []
+
+    with open(index_dir / 'docs.jsonl', 'wb') as docs_file:
+        for doc_id, paper in enumerate(papers):
+            frequencies = defaultdict(lambda: [0] * len(fields))
+            doc_lengths = []
+            for position, field in enumerate(fields):
+                tokens = _field_tokens(paper, field)
+                doc_lengths.append(len(tokens))
+                for token in tokens:
+                    frequencies[token][position] += 1
+            for term, tf in frequencies.items():
+                posting_terms.append(term_ids.setdefault(term, len(term_ids)))
+                posting_docs.append(doc_id)
+                posting_tf.extend(tf)
+            lengths.append(doc_lengths)
+
+            conference = str(paper.get('conference') or '')
+            category = str(paper.get('category') or '')
+            conference_codes.append(conferences.setdefault(conference, len(conferences)))
+            category_codes.append(categories.setdefault(category, len(categories)))
+
+            doc_offsets.append(docs_file.tell())
+            record = {key: paper[key] for key in DOC_FIELDS if paper.get(key) not in (None, '', [])}
+            docs_file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    doc_count = len(lengths)
+    # Group postings by term; the stable sort keeps document order within a term
+    posting_terms = np.asarray(posting_terms, dtype=np.int64)
+    order = np.argsort(posting_terms, kind='stable')
+    offsets = np.zeros(len(term_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(posting_terms, minlength=len(term_ids)), out=offsets[1:])
+    doc_ids = np.asarray(posting_docs, dtype=np.int32)[order]
+    tf = np.asarray(posting_tf, dtype=np.float32).reshape(-1, len(fields))[order]
+
+    lengths = np.asarray(lengths, dtype=np.float32).reshape(doc_count, len(fields))
+    np.save(index_dir / 'offsets.npy', offsets)
+    np.save(index_dir / 'postings.npy', doc_ids)
+    np.save(index_dir / 'tf.npy', tf)
+    np.save(index_dir / 'lengths.npy', lengths)
+    np.save(index_dir / 'conference.npy', np.asarray(conference_codes, dtype=np.int32))
+    np.save(index_dir / 'category.npy', np.asarray(category_codes, dtype=np.int32))
+    np.save(index_dir / 'doc_offsets.npy', np.asarray(doc_offsets, dtype=np.int64))
+
+    meta = {
+        'version': INDEX_VERSION,
+        'dataset': str(dataset_path),
+        'dataset_fingerprint': fingerprint,
+        'doc_count': doc_count,
+        'fields': list(fields),
+        'avg_lengths': [float(value) for value in lengths.mean(axis=0)] if doc_count
+                       else [0.0] * len(fields),
+        'conferences': list(conferences),
+        'categories': list(categories),
+        'vocabulary': list(term_ids),
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return meta
+
+
+class SearchIndex:
+    """Memory-mapped BM25 index of one dataset."""
+
+    def __init__(self, index_dir):
+        """
+        Load an index written by ``build_index``.
+
+        Args:
+            index_dir (str): Index directory
+        """
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.fields = self.meta['fields']
+        self.doc_count = self.meta['doc_count']
+        self.term_ids = {term: i for i, term in enumerate(self.meta['vocabulary'])}
+
+        def load(name):
+            return np.load(self.index_dir / name, mmap_mode='r')
+
+        self.offsets = load('offsets.npy')
+        self.postings = load('postings.npy')
+        self.tf = load('tf.npy')
+        self.conference = load('conference.npy')
+        self.category = load('category.npy')
+        self.doc_offsets = load('doc_offsets.npy')
+        # Per-document length normalization, computed once for every field
+        lengths = np.asarray(load('lengths.npy'), dtype=np.float32)
+        avg_lengths = np.maximum(np.asarray(self.meta['avg_lengths'], dtype=np.float32), 1e-9)
+        self.length_norm = (1 - B) + B * lengths / avg_lengths
+
+    @classmethod
+    def open(cls, dataset_path, index_dir=None, rebuild=False):
+        """
+        Load the index of a dataset, building it first if it is missing or stale.
+
+        Args:
+            dataset_path (str): Dataset file
+            index_dir (str, optional): Index directory (default: ``<dataset>.bm25``)
+            rebuild (bool): Rebuild even if the index is current
+
+        Returns:
+            SearchIndex: The loaded index
+        """
+        index_dir = Path(index_dir or default_index_dir(dataset_path))
+        if rebuild or not cls.is_current(dataset_path, index_dir):
+            print(f"Building search index for {dataset_path}...")
+            meta = build_index(dataset_path, index_dir)
+            print(f"✓ Indexed {meta['doc_count']} papers, {len(meta['vocabulary'])} terms")
+        return cls(index_dir)
+
+    @staticmethod
+    def is_current(dataset_path, index_dir):
+        """Whether the index exists and was built from the dataset as it is now."""
+        meta_path = Path(index_dir) / 'meta.json'
+        if not meta_path.exists():
+            return False
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return (meta.get('version') == INDEX_VERSION
+                and meta.get('dataset_fingerprint') == dataset_fingerprint(dataset_path))
+
+    def _label_mask(self, codes, labels, wanted):
+        """Documents whose label starts with one of the wanted values (case-insensitive)."""
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        wanted = [value.lower() for value in wanted]
+        matching = [code for code, label in enumerate(labels)
+                    if any(label.lower().startswith(value) for value in wanted)]
+        return np.isin(codes, matching)
+
+    def score(self, query, boosts=None, conference=None, category=None):
+        """
+        BM25F scores of every document for a query.
+
+        Args:
+            query (str): Free-text query; terms are combined with OR
+            boosts (dict, optional): Field -> weight (default: ``DEFAULT_BOOSTS``)
+            conference (str or list, optional): Keep only these conferences
+            category (str or list, optional): Keep only categories starting with these
+                                              values (e.g. ``'MC7'``)
+
+        Returns:
+            ndarray: float32 scores; 0 for non-matching or filtered documents
+        """
+        boosts = {**DEFAULT_BOOSTS, **(boosts or {})}
+        weights = np.array([boosts.get(field, 1.0) for field in self.fields], dtype=np.float32)
+        scores = np.zeros(self.doc_count, dtype=np.float32)
+
+        for term in set(tokenize(query)):
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            doc_ids = self.postings[start:end]
+            df = end - start
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            # BM25F: boosted, length-normalized frequencies summed over fields
+            weighted_tf = (self.tf[start:end] / self.length_norm[doc_ids]) @ weights
+            scores[doc_ids] += idf * weighted_tf * (K1 + 1) / (weighted_tf + K1)
+
+        if conference:
+            scores[~self._label_mask(self.conference, self.meta['conferences'], conference)] = 0
+        if category:
+            scores[~self._label_mask(self.category, self.meta['categories'], category)] = 0
+        return scores
+
+    def document(self, doc_id):
+        """Display fields of one indexed paper."""
+        with open(self.index_dir / 'docs.jsonl', 'rb') as f:
+            f.seek(int(self.doc_offsets[doc_id]))
+            return json.loads(f.readline())
+
+    def search(self, query, top_k=10, boosts=None, conference=None, category=None):
+        """
+        Rank papers for a query.
+
+        Args:
+            query (str): Free-text query
+            top_k (int): Maximum number of results
+            boosts, conference, category: See ``score``
+
+        Returns:
+            list: ``{'doc_id', 'score', 'paper'}`` dicts, best first
+        """
+        if top_k <= 0:
+            return []
+        scores = self.score(query, boosts=boosts, conference=conference, category=category)
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+        # Highest score first; ties in dataset order
+        ranked = matched[np.lexsort((matched, -scores[matched]))]
+        return [{'doc_id': int(doc_id), 'score': float(scores[doc_id]), 'paper': self.document(doc_id)}
+                for doc_id in ranked]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Static Full-Text Search Index
+
+This module builds the inverted index the web interface searches instead of
+scanning every paper on each keystroke. For each web dataset it writes a
+manifest plus postings shards keyed by the leading character(s) of each
+term, so the browser only downloads the shards a query touches.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Index layout (``docs/data/index/<dataset>/``):
+    manifest.json   {"version", "dataset", "paper_count", "fields", "shards": {key: file}}
+    <key>.json      {"term": [doc, +delta, +delta, ...], ...}
+
+Document IDs are positions in the dataset's ``papers`` array; postings are
+sorted and delta-encoded. The tokenizer (lowercase, maximal runs of Unicode
+letters and digits) is mirrored exactly by ``docs/app-simple.js``.
+
+Usage:
+    python build_search_index.py
+    build_index('docs/data/papers-combined.json', 'docs/data/index/papers-combined')
+"""
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from conferences.common.paper_io import open_papers
+
+INDEX_VERSION = 1
+# Fields searched by the web interface; lists are joined with spaces
+SEARCH_FIELDS = ['title', 'authors', 'abstract', 'keywords', 'affiliations', 'institutions']
+# Shard by one leading character until the vocabulary is large enough that
+# single-character shards would get big, then by two
+TWO_CHAR_SHARD_TERMS = 20000
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text):
+    """
+    Split text into index terms.
+
+    Equivalent to ``text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu)`` in the
+    browser: lowercase, then maximal runs of letters and digits.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def paper_terms(paper, fields=SEARCH_FIELDS):
+    """Return the set of terms a paper is indexed under."""
+    terms = set()
+    for field in fields:
+        value = paper.get(field)
+        if isinstance(value, list):
+            value = ' '.join(str(item) for item in value)
+        if value:
+            terms.update(tokenize(str(value)))
+    return terms
+
+
+def shard_prefix_length(term_count):
+    return 2 if term_count >= TWO_CHAR_SHARD_TERMS else 1
+
+
+def shard_filename(key):
+    """File name for a shard; non-ASCII prefixes are hex-encoded."""
+    if re.fullmatch(r'[a-z0-9]+', key):
+        return f"{key}.json"
+    return f"u{key.encode('utf-8').hex()}.json"
+
+
+def build_postings(papers, fields=SEARCH_FIELDS):
+    """
+    Build term -> sorted document ID postings.
+
+    Args:
+        papers (iterable): Paper dictionaries; their order defines doc IDs
+
+    Returns:
+        tuple: ``(postings dict, paper count)``
+    """
+    postings = defaultdict(list)
+    count = 0
+    for doc_id, paper in enumerate(papers):
+        for term in paper_terms(paper, fields):
+            postings[term].append(doc_id)
+        count += 1
+    return postings, count
+
+
+def delta_encode(doc_ids):
+    encoded, previous = [], 0
+    for doc_id in doc_ids:
+        encoded.append(doc_id - previous)
+        previous = doc_id
+    return encoded
+
+
+def build_index(dataset_path, output_dir, fields=SEARCH_FIELDS, prefix_length=None):
+    """
+    Build and write the sharded index for one dataset file.
+
+    Shards of a previous build that are no longer needed are removed.
+
+    Args:
+        dataset_path (str): Web dataset (``{"papers": [...]}``)
+        output_dir (str): Index directory to (re)write
+        fields (list): Paper fields to index
+        prefix_length (int, optional): Shard key length (default: by vocabulary size)
+
+    Returns:
+        dict: The manifest that was written
+    """
+    dataset_path, output_dir = Path(dataset_path), Path(output_dir)
+    _, papers = open_papers(dataset_path)
+    postings, paper_count = build_postings(papers, fields)
+
+    prefix_length = prefix_length or shard_prefix_length(len(postings))
+    shards = defaultdict(dict)
+    for term in sorted(postings):
+        shards[term[:prefix_length]][term] = delta_encode(postings[term])
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for key, terms in sorted(shards.items()):
+        filename = shard_filename(key)
+        files[key] = filename
+        with open(output_dir / filename, 'w', encoding='utf-8') as f:
+            json.dump(terms, f, ensure_ascii=False, separators=(',', ':'))
+
+    for stale in output_dir.glob('*.json'):
+        if stale.name != 'manifest.json' and stale.name not in files.values():
+            stale.unlink()
+
+    manifest = {
+        'version': INDEX_VERSION,
+        'dataset': dataset_path.name,
+        'dataset_sha256': hashlib.sha256(dataset_path.read_bytes()).hexdigest(),
+        'paper_count': paper_count,
+        'fields': list(fields),
+        'tokenizer': 'lowercase-unicode-alnum',
+        'prefix_length': prefix_length,
+        'term_count': len(postings),
+        'shards': files,
+    }
+    with open(output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def load_index(index_dir):
+    """
+    Load a sharded index back into term -> document ID lists.
+
+    Returns:
+        tuple: ``(manifest, postings dict)``
+    """
+    index_dir = Path(index_dir)
+    with open(index_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    postings = {}
+    for filename in manifest['shards'].values():
+        with open(index_dir / filename, 'r', encoding='utf-8') as f:
+            for term, deltas in json.load(f).items():
+                doc_ids, total = [], 0
+                for delta in deltas:
+                    total += delta
+                    doc_ids.append(total)
+                postings[term] = doc_ids
+    return manifest, postings
+
+
+def search(postings, query):
+    """
+    Reference implementation of the browser lookup.
+
+    Every query token is matched as a term prefix, and a paper must match
+    all tokens.
+
+    Returns:
+        list: Sorted document IDs
+    """
+    result = None
+    for token in tokenize(query):
+        matches = set()
+        for term, doc_ids in postings.items():
+            if term.startswith(token):
+                matches.update(doc_ids)
+        result = matches if result is None else result & matches
+    return sorted(result or ())
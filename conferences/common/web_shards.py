@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Tiered Web Data Shards
+
+This module splits a web dataset into the files the web interface loads in
+stages: a small list file with the fields the paper list, filters and
+statistics use, and detail files with complete records (including the
+extracted ``sections`` text) that are fetched only when a paper is opened.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- List file with list-view fields only; abstracts shortened to a snippet
+- Paged detail shards (``PAGE_SIZE`` full records each) and per-paper detail files
+- Content-hashed file names for long-term caching; only ``manifest.json`` changes name-stably
+- Precompressed ``.gz`` copies (and ``.br`` when ``brotli`` is installed)
+- Files of previous builds that are no longer referenced are removed
+
+Dependencies:
+- brotli (optional): Brotli-compressed copies
+
+Shard layout (``docs/data/shards/<dataset>/``):
+    manifest.json                  {"dataset", "paper_count", "list", "page_size", "pages", ...}
+    list.<hash>.json               {"papers": [list entry, ...]}, entry["detail"] -> detail file
+    pages/page-000.<hash>.json     {"start": 0, "papers": [full record, ...]}
+    papers/<id>.<hash>.json        One full record
+
+Paper IDs are positions in the dataset's ``papers`` array, the same document
+IDs the search index (``text_index``) uses.
+
+Usage:
+    build_shards('docs/data/papers.json', 'docs/data/shards/papers')
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from conferences.common.paper_io import open_papers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SHARD_VERSION = 1
+PAGE_SIZE = 50
+HASH_LENGTH = 10
+SNIPPET_LENGTH = 200
+# Fields copied into list entries when present
+LIST_FIELDS = ['paper_number', 'contribution_id', 'paper_code', 'title', 'authors', 'conference',
+               'affiliations', 'institutions', 'keywords', 'category', 'session',
+               'page_count', 'pages']
+# Fields that may be lists in the source; list entries carry their lengths
+COUNT_FIELDS = ['figures', 'tables', 'references']
+
+
+def list_entry(paper_id, paper, detail_file):
+    """
+    List-view record of a paper.
+
+    Args:
+        paper_id (int): Position of the paper in the dataset
+        paper (dict): Full record
+        detail_file (str): Detail file path, relative to the manifest
+
+    Returns:
+        dict: ``id``, the present ``LIST_FIELDS``, counts, an abstract
+              snippet and ``detail``
+    """
+    entry = {'id': paper_id}
+    for field in LIST_FIELDS:
+        if paper.get(field) not in (None, '', []):
+            entry[field] = paper[field]
+    for field in COUNT_FIELDS:
+        value = paper.get(field)
+        if isinstance(value, list):
+            value = len(value)
+        if value:
+            entry[field] = value
+    abstract = paper.get('abstract') or ''
+    if abstract:
+        entry['abstract'] = abstract if len(abstract) <= SNIPPET_LENGTH else abstract[:SNIPPET_LENGTH] + '...'
+    entry['detail'] = detail_file
+    return entry
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_hashed(output_dir, stem, data, written):
+    """
+    Write ``<stem>.<hash>.json`` plus compressed copies.
+
+    Returns:
+        str: File name relative to ``output_dir``
+    """
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    name = f"{stem}.{digest}.json"
+    path = output_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() or path.read_bytes() != data:
+        path.write_bytes(data)
+        # mtime=0 keeps the gzip output identical between builds
+        Path(f"{path}.gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            Path(f"{path}.br").write_bytes(brotli.compress(data, quality=11))
+    written.update({name, f"{name}.gz", f"{name}.br"})
+    return name
+
+
+def build_shards(dataset_path, output_dir, page_size=PAGE_SIZE):
+    """
+    Build the tiered shards of a web dataset.
+
+    Args:
+        dataset_path (str): Web dataset (``{"papers": [...]}``)
+        output_dir (str): Shard directory to (re)write
+        page_size (int): Full records per detail page
+
+    Returns:
+        dict: The manifest that was written
+    """
+    dataset_path, output_dir = Path(dataset_path), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _, papers = open_papers(dataset_path)
+
+    written = set()
+    entries, pages, page = [], [], []
+    list_bytes = detail_bytes = 0
+
+    def flush_page():
+        start = len(entries) - len(page)
+        pages.append(_write_hashed(output_dir, f"pages/page-{len(pages):03d}",
+                                   _encode({'start': start, 'papers': page}), written))
+
+    for paper_id, paper in enumerate(papers):
+        data = _encode(paper)
+        detail_bytes += len(data)
+        detail_file = _write_hashed(output_dir, f"papers/{paper_id}", data, written)
+        entries.append(list_entry(paper_id, paper, detail_file))
+        page.append(paper)
+        if len(page) == page_size:
+            flush_page()
+            page = []
+    if page:
+        flush_page()
+
+    list_data = _encode({'papers': entries})
+    list_bytes = len(list_data)
+    list_file = _write_hashed(output_dir, 'list', list_data, written)
+
+    manifest = {
+        'version': SHARD_VERSION,
+        'dataset': dataset_path.name,
+        'dataset_sha256': hashlib.sha256(dataset_path.read_bytes()).hexdigest(),
+        'paper_count': len(entries),
+        'list': list_file,
+        'list_bytes': list_bytes,
+        'list_gzip_bytes': (output_dir / f"{list_file}.gz").stat().st_size,
+        'detail_bytes': detail_bytes,
+        'page_size': page_size,
+        'pages': pages,
+        'compression': ['gzip'] + (['br'] if brotli is not None else []),
+    }
+    manifest_data = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    (output_dir / 'manifest.json').write_bytes(manifest_data)
+    (output_dir / 'manifest.json.gz').write_bytes(gzip.compress(manifest_data, compresslevel=9, mtime=0))
+    written.update({'manifest.json', 'manifest.json.gz'})
+
+    for path in output_dir.rglob('*'):
+        if path.is_file() and path.relative_to(output_dir).as_posix() not in written:
+            path.unlink()
+    return manifest
+
+
+def load_shards(shard_dir):
+    """
+    Read shards back as ``(manifest, list entries, full records)``.
+
+    Used to verify a build; the web interface reads the same files.
+    """
+    shard_dir = Path(shard_dir)
+    with open(shard_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    with open(shard_dir / manifest['list'], 'r', encoding='utf-8') as f:
+        entries = json.load(f)['papers']
+    records = []
+    for page in manifest['pages']:
+        with open(shard_dir / page, 'r', encoding='utf-8') as f:
+            records.extend(json.load(f)['papers'])
+    return manifest, entries, records
@@ -10,6 +10,9 @@
  * 
  * Features:
  * - Real-time paper search and filtering
+ * - Prebuilt inverted index lookups (build_search_index.py), linear scan fallback
+ * - Tiered data shards (build_web_shards.py): list file first, details on demand
+ * - Deduplicated WebP figure thumbnails (build_web_images.py) in paper details
  * - Dynamic data visualization with statistics
  * - Responsive design for multiple devices
  * - Fallback to mock data when real data is unavailable
@@ -25,6 +28,9 @@
  * - v1.1: Added advanced filtering and statistics
  * - v1.2: Enhanced responsive design and error handling
  * - v1.3: Integrated real-time data loading with fallback mechanisms
+ * - v1.4: Search answered from the prebuilt sharded inverted index
+ * - v1.5: First paint from the list shard; paper details loaded lazily
+ * - v1.6: Figure thumbnails from the image manifest, full size on click
  * 
  * Usage:
  *   Include this script in an HTML page with proper Bootstrap and
@@ -44,6 +50,11 @@ class PaperAnalysisApp {
         this.filteredPapers = [];
         this.currentPage = 1;
         this.papersPerPage = 10;
+        this.searchIndex = null;
+        this.searchSeq = 0;
+        this.shardDir = null;
+        this.detailRequests = new Map();
+        this.figureManifest = null;
         this.init();
     }
 
@@ -66,6 +77,12 @@ class PaperAnalysisApp {
     async loadData() {
         this.showLoading('正在加载论文数据...');
         
+        if (await this.loadShards('data/shards/papers/')) {
+            this.filteredPapers = [...this.papers];
+            this.updateStats();
+            return;
+        }
+        
         try {
             // 尝试多个可能的路径，优先使用较小的文件
             const possiblePaths = [
@@ -102,6 +119,7 @@ class PaperAnalysisApp {
             if (data && data.papers) {
                 this.papers = data.papers;
                 console.log('数据加载成功，共', this.papers.length, '篇论文，来源:', loadedPath);
+                await this.loadSearchIndex(loadedPath);
                 this.hideLoading();
             } else {
                 throw lastError || new Error('所有路径都失败了，没有找到有效数据');
@@ -117,6 +135,205 @@ class PaperAnalysisApp {
         this.updateStats();
     }
 
+    /**
+     * Load the list shard of a sharded dataset (see build_web_shards.py).
+     * 
+     * The list holds only the fields the paper list, filters and statistics
+     * use; full records are fetched per paper by loadPaperDetail().
+     * Returns false if the shards are unavailable.
+     */
+    async loadShards(shardDir) {
+        try {
+            const manifestResponse = await fetch(shardDir + 'manifest.json', { cache: 'no-cache' });
+            if (!manifestResponse.ok) return false;
+            const manifest = await manifestResponse.json();
+            
+            // 内容哈希文件名，可长期缓存
+            const listResponse = await fetch(shardDir + manifest.list);
+            if (!listResponse.ok) return false;
+            const list = await listResponse.json();
+            
+            this.papers = list.papers;
+            this.shardDir = shardDir;
+            console.log('列表分片加载成功，共', this.papers.length, '篇论文，来源:', shardDir + manifest.list);
+            await this.loadSearchIndex(`data/${manifest.dataset}`);
+            this.hideLoading();
+            return true;
+        } catch (error) {
+            console.log('分片数据不可用，加载完整数据:', error.message);
+            return false;
+        }
+    }
+
+    /**
+     * Fetch the full record of a paper from its detail shard and merge it in.
+     * 
+     * Papers loaded from a complete dataset (or mock data) are returned as is.
+     */
+    loadPaperDetail(paper) {
+        if (!paper.detail || !this.shardDir) return Promise.resolve(paper);
+        if (!this.detailRequests.has(paper.detail)) {
+            const request = fetch(this.shardDir + paper.detail).then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            }).then(detail => Object.assign(paper, detail));
+            request.catch(() => this.detailRequests.delete(paper.detail));
+            this.detailRequests.set(paper.detail, request);
+        }
+        return this.detailRequests.get(paper.detail);
+    }
+
+    /**
+     * Figures of a paper from the image manifest (build_web_images.py).
+     * 
+     * The manifest is fetched on first use; returns [] when it is unavailable.
+     */
+    async loadFigures(paper, imageDir = 'images/hiat2025/') {
+        if (!this.figureManifest) {
+            this.figureManifest = fetch(imageDir + 'manifest.json', { cache: 'no-cache' })
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => null);
+        }
+        const manifest = await this.figureManifest;
+        if (!manifest || paper.paper_number === undefined) return [];
+        
+        // 重复的图片（如各页的会议标志）只显示一次
+        const seen = new Set();
+        return (manifest.papers[String(paper.paper_number)] || []).filter(figure => {
+            if (seen.has(figure.image)) return false;
+            seen.add(figure.image);
+            return true;
+        }).map(figure => {
+            const image = manifest.images[figure.image];
+            const variants = image.variants;
+            const srcset = Object.keys(variants)
+                .map(name => `${imageDir}${variants[name]} ${manifest.variants[name] || image.width}w`);
+            return {
+                page: figure.page,
+                src: imageDir + (variants.thumb || variants.full),
+                srcset: srcset.join(', '),
+                full: imageDir + variants.full,
+                width: image.width,
+                height: image.height
+            };
+        });
+    }
+
+    /**
+     * Load the prebuilt search index of the loaded dataset.
+     * 
+     * The index lives in data/index/<dataset>/ (see build_search_index.py).
+     * Without it, or if it was built for different data, search falls back
+     * to linear scans.
+     */
+    async loadSearchIndex(dataPath) {
+        const slash = dataPath.lastIndexOf('/');
+        const dataset = dataPath.slice(slash + 1).replace(/\.json$/, '');
+        const dir = `${dataPath.slice(0, slash + 1)}index/${dataset}/`;
+        
+        try {
+            const response = await fetch(dir + 'manifest.json');
+            if (!response.ok) {
+                console.log('未找到搜索索引，使用线性搜索');
+                return;
+            }
+            const manifest = await response.json();
+            if (manifest.paper_count !== this.papers.length) {
+                console.warn('搜索索引与数据不一致，使用线性搜索');
+                return;
+            }
+            this.searchIndex = { dir, manifest, shards: new Map() };
+            console.log('搜索索引已加载:', manifest.term_count, '个词项');
+        } catch (error) {
+            console.log('搜索索引加载失败，使用线性搜索:', error.message);
+        }
+    }
+
+    // Same tokenizer as conferences/common/text_index.py
+    static tokenize(text) {
+        return (text || '').toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+    }
+
+    // Fetch a postings shard once; concurrent queries share the request
+    loadShard(key) {
+        const { dir, manifest, shards } = this.searchIndex;
+        if (!shards.has(key)) {
+            const request = fetch(dir + manifest.shards[key]).then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            });
+            request.catch(() => shards.delete(key));
+            shards.set(key, request);
+        }
+        return shards.get(key);
+    }
+
+    /**
+     * Resolve a query to the positions of matching papers via the index.
+     * 
+     * Each query token matches indexed terms by prefix, and a paper must
+     * match every token. Returns null when no index is available or the
+     * query has no indexable tokens.
+     */
+    async lookupIndex(query) {
+        if (!this.searchIndex) return null;
+        const { manifest } = this.searchIndex;
+        const prefixLength = manifest.prefix_length;
+        let result = null;
+        
+        for (const token of PaperAnalysisApp.tokenize(query)) {
+            const keys = Object.keys(manifest.shards).filter(key =>
+                token.length >= prefixLength ? key === token.slice(0, prefixLength) : key.startsWith(token));
+            const shards = await Promise.all(keys.map(key => this.loadShard(key)));
+            
+            const matches = new Set();
+            for (const shard of shards) {
+                for (const [term, deltas] of Object.entries(shard)) {
+                    if (!term.startsWith(token)) continue;
+                    let id = 0;
+                    for (const delta of deltas) {
+                        id += delta;
+                        matches.add(id);
+                    }
+                }
+            }
+            result = result === null ? matches : new Set([...result].filter(id => matches.has(id)));
+            if (result.size === 0) break;
+        }
+        return result;
+    }
+
+    /**
+     * Build the search predicate for a query: an index lookup when the
+     * prebuilt index is available, otherwise a linear substring scan.
+     */
+    async searchMatcher(query) {
+        if (!query) return () => true;
+        
+        try {
+            const ids = await this.lookupIndex(query);
+            if (ids) return (paper, index) => ids.has(index);
+        } catch (error) {
+            console.warn('索引查询失败，使用线性搜索:', error);
+        }
+        
+        query = query.toLowerCase();
+        return paper => {
+            // 安全检查每个字段
+            const title = (paper.title || '').toLowerCase();
+            const abstract = (paper.abstract || '').toLowerCase();
+            const authors = Array.isArray(paper.authors) ? paper.authors.join(' ').toLowerCase() : '';
+            const affiliations = Array.isArray(paper.affiliations) ? paper.affiliations.join(' ').toLowerCase() : '';
+            const keywords = Array.isArray(paper.keywords) ? paper.keywords.join(' ').toLowerCase() : '';
+            
+            return title.includes(query) ||
+                   abstract.includes(query) ||
+                   authors.includes(query) ||
+                   affiliations.includes(query) ||
+                   keywords.includes(query);
+        };
+    }
+
     generateMockData() {
         const institutions = [
             'Facility for Rare Isotope Beams, Michigan State University',
@@ -283,40 +500,22 @@ class PaperAnalysisApp {
         }
     }
     
-    searchPapers() {
-        const searchTerm = document.getElementById('searchInput')?.value.toLowerCase() || '';
-        
-        this.filteredPapers = this.papers.filter(paper => {
-            const title = (paper.title || '').toLowerCase();
-            const authors = (paper.authors || []).join(' ').toLowerCase();
-            const abstract = (paper.abstract || '').toLowerCase();
-            const keywords = (paper.keywords || []).join(' ').toLowerCase();
-            
-            return title.includes(searchTerm) || 
-                   authors.includes(searchTerm) || 
-                   abstract.includes(searchTerm) ||
-                   keywords.includes(searchTerm);
-        });
-        
-        this.applyFilters();
-    }
-    
     filterPapers() {
         this.applyFilters();
     }
     
-    applyFilters() {
+    async applyFilters() {
         const institutionFilter = document.getElementById('institutionFilter')?.value || '';
         const topicFilter = document.getElementById('topicFilter')?.value || '';
-        const searchTerm = document.getElementById('searchInput')?.value.toLowerCase() || '';
+        const searchTerm = document.getElementById('searchInput')?.value || '';
         
-        this.filteredPapers = this.papers.filter(paper => {
+        const seq = ++this.searchSeq;
+        const matchesQuery = await this.searchMatcher(searchTerm);
+        if (seq !== this.searchSeq) return;  // 已有更新的查询
+        
+        this.filteredPapers = this.papers.filter((paper, index) => {
             // 搜索过滤
-            const matchesSearch = !searchTerm || 
-                (paper.title || '').toLowerCase().includes(searchTerm) ||
-                (paper.authors || []).join(' ').toLowerCase().includes(searchTerm) ||
-                (paper.abstract || '').toLowerCase().includes(searchTerm) ||
-                (paper.keywords || []).join(' ').toLowerCase().includes(searchTerm);
+            const matchesSearch = matchesQuery(paper, index);
             
             // 机构过滤
             const matchesInstitution = !institutionFilter || 
@@ -461,28 +660,17 @@ class PaperAnalysisApp {
         }
     }
 
-    // 搜索功能
-    searchPapers(query) {
-        if (!query) {
-            this.filteredPapers = [...this.papers];
-        } else {
-            query = query.toLowerCase();
-            this.filteredPapers = this.papers.filter(paper => {
-                // 安全检查每个字段
-                const title = (paper.title || '').toLowerCase();
-                const abstract = (paper.abstract || '').toLowerCase();
-                const authors = Array.isArray(paper.authors) ? paper.authors.join(' ').toLowerCase() : '';
-                const affiliations = Array.isArray(paper.affiliations) ? paper.affiliations.join(' ').toLowerCase() : '';
-                const keywords = Array.isArray(paper.keywords) ? paper.keywords.join(' ').toLowerCase() : '';
-                
-                return title.includes(query) ||
-                       abstract.includes(query) ||
-                       authors.includes(query) ||
-                       affiliations.includes(query) ||
-                       keywords.includes(query);
-            });
+    // 搜索功能：优先使用预建索引
+    async searchPapers(query) {
+        if (query === undefined) {
+            query = document.getElementById('searchInput')?.value || '';
         }
         
+        const seq = ++this.searchSeq;
+        const matchesQuery = await this.searchMatcher(query);
+        if (seq !== this.searchSeq) return;  // 已有更新的查询
+        
+        this.filteredPapers = this.papers.filter((paper, index) => matchesQuery(paper, index));
         this.currentPage = 1;
         this.renderPapers();
     }
@@ -559,10 +747,18 @@ function clearFilters() {
     app.clearFilters();
 }
 
-function showPaperDetails(paperNumber) {
-    const paper = app.papers.find(p => p.paper_number === paperNumber);
+async function showPaperDetails(paperNumber) {
+    let paper = app.papers.find(p => p.paper_number === paperNumber);
     if (!paper) return;
     
+    // 按需加载详情（完整机构列表、摘要、文件信息）
+    try {
+        paper = await app.loadPaperDetail(paper);
+    } catch (error) {
+        console.warn('论文详情加载失败，显示列表数据:', error);
+    }
+    const figures = await app.loadFigures(paper);
+    
     // 安全处理数据
     const authors = paper.authors && paper.authors.length > 0 ? paper.authors.join(', ') : '未知作者';
     const affiliations = paper.affiliations && paper.affiliations.length > 0 ? paper.affiliations.join('; ') : '未知机构';
@@ -601,6 +797,21 @@ function showPaperDetails(paperNumber) {
             <p class="text-muted mt-2">${abstract}</p>
         </div>
         
+        ${figures.length > 0 ? `
+        <div class="mb-3">
+            <strong>图片预览:</strong><br>
+            <div class="d-flex flex-wrap gap-2 mt-2">
+                ${figures.map(figure => `
+                <a href="${figure.full}" target="_blank" title="第 ${figure.page || '?'} 页">
+                    <img src="${figure.src}" srcset="${figure.srcset}" sizes="160px"
+                         width="160" height="${Math.max(1, Math.round(160 * figure.height / figure.width))}"
+                         loading="lazy" decoding="async" class="img-thumbnail"
+                         style="max-height: 160px; object-fit: contain;" alt="Figure, page ${figure.page || '?'}">
+                </a>`).join('')}
+            </div>
+        </div>
+        ` : ''}
+        
         <div class="mb-3">
             <strong>文件信息:</strong><br>
             <small class="text-muted">
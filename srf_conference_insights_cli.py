@@ -19,14 +19,38 @@ Development Log:
 - v1.0: Initial CLI implementation
 - v1.1: Added comprehensive command support
 - v1.2: Enhanced error handling and logging
+- v1.3: Built-in profiling of any command (--profile)
+- v1.4: Any registered Indico conference can be crawled (--adapters, crawl --list)
+- v1.5: Batch crawl of many conferences under one connection budget
 
 Usage:
     srf-insights --help
     srf-insights crawl ipac2025
+    srf-insights crawl ipac2025 --workers 8
+    srf-insights crawl ipac2025 --workers 16 --parse-workers 8
+    srf-insights crawl ipac2025 --resume
+    srf-insights crawl ipac2025 --incremental --cache-dir .crawl-cache
+    srf-insights crawl ipac2025 --archive ipac2025.warc.gz
+    srf-insights crawl ipac2025 --output papers.jsonl
+    srf-insights crawl --list
+    srf-insights --adapters conferences.json crawl linac2026 --output linac2026_papers.json
+    srf-insights crawl ipac2025 --output ipac2025_real_papers.parquet
+    srf-insights -v crawl ipac2025 --workers 8 --metrics crawl-metrics.prom
+    srf-insights --profile crawl.pstats crawl ipac2025 --limit 100
+    srf-insights --profile crawl.collapsed --profile-mode sample --profile-memory crawl ipac2025
+    srf-insights batch --all --max-connections 16 --rate 8 --output-dir data/
+    srf-insights batch ipac2025 linac2026 --resume --summary batch.json
+    srf-insights reextract --archive ipac2025.warc.gz --output papers.json
     srf-insights analyze --input data.json
+    srf-insights analyze --input conferences/HIAT2025/papers.json --output statistics.json
+    srf-insights combine
+    srf-insights combine --list
+    srf-insights search "nb3sn cavity"
+    srf-insights search "beam loss" --conference IPAC2025 --category MC4 --boost title=3
 """
 
 import argparse
+import json
 import sys
 import logging
 from pathlib import Path
@@ -39,17 +63,152 @@ def setup_logging(verbose: bool = False):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+def write_metrics(crawler, filename):
+    """Write the crawler's run metrics, if a metrics file was requested."""
+    if filename:
+        crawler.metrics.write(filename)
+        print(f"✓ Metrics saved to: {filename}")
+
+def list_adapters():
+    """Print the registered conference adapters."""
+    from conferences.common.adapters import ADAPTER_REGISTRY
+    for adapter in ADAPTER_REGISTRY.values():
+        print(f"{adapter.name}: {adapter.event_url} -> {adapter.output}")
+
+def find_adapter(name):
+    """Return the adapter registered as ``name``, or print the known ones and return None."""
+    from conferences.common.adapters import ADAPTER_REGISTRY, get_adapter
+    adapter = get_adapter(name)
+    if adapter is None:
+        print(f"Error: Conference '{name}' not supported yet. "
+              f"Registered: {', '.join(a.name for a in ADAPTER_REGISTRY.values())}")
+    return adapter
+
 def crawl_command(args):
     """Execute crawling command."""
-    print(f"Starting crawl for conference: {args.conference}")
+    if args.list:
+        list_adapters()
+        return 0
+    if not args.conference:
+        print("Error: No conference given (see crawl --list)")
+        return 1
     
-    if args.conference.lower() == 'ipac2025':
-        from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
-        crawler = ImprovedIPAC2025Crawler()
-        papers = crawler.crawl_conference(max_papers=args.limit)
+    adapter = find_adapter(args.conference)
+    if adapter is not None:
+        print(f"Starting crawl for conference: {adapter.name}")
+        from conferences.common.indico import IndicoCrawler
+        from conferences.common.http_cache import HTTPCache
+        from conferences.common.rate_limit import RateLimiter
+        rate_limiter = RateLimiter(requests_per_second=args.rate, burst=max(1, args.workers))
+        cache = None
+        if args.cache_dir:
+            cache = HTTPCache(args.cache_dir, ttl=args.cache_ttl,
+                              max_bytes=int(args.cache_max_mb * 1024 * 1024))
+        from conferences.common.journal import CrawlJournal
+        from conferences.common.paper_io import is_jsonl
+        crawler = IndicoCrawler(adapter, base_url=args.base_url, workers=args.workers,
+                                rate_limiter=rate_limiter, cache=cache, archive=args.archive)
+        output = args.output or adapter.output
+        journal = CrawlJournal(args.journal or f"{output}.journal.jsonl")
+        previous = None
+        if args.incremental:
+            if Path(output).exists():
+                previous = crawler.load_papers(output)
+            else:
+                print(f"No previous output at {output}; running a full crawl")
+        crawl_options = dict(max_papers=args.limit, journal=journal, resume=args.resume,
+                             previous=previous, parse_workers=args.parse_workers)
+        if is_jsonl(output):
+            # JSON Lines output is written as papers are extracted
+            with crawler.open_writer(output) as writer:
+                extracted = crawler.crawl_conference(writer=writer, **crawl_options)['extracted']
+            print(f"\n✓ Data saved to: {output}")
+        else:
+            papers = crawler.crawl_conference(**crawl_options)
+            crawler.save_papers(papers, output)
+            extracted = len(papers)
+        # The default journal only matters for resuming a crawl that did not
+        # finish cleanly; an explicit --journal is always kept
+        if not args.journal and extracted and not journal.failed():
+            journal.reset()
+        write_metrics(crawler, args.metrics)
+    else:
+        return 1
+    
+    return 0
+
+def parse_host_rates(values):
+    """Parse repeated ``host=rate`` options into a per-host rate dictionary."""
+    rates = {}
+    for value in values or []:
+        host, sep, rate = value.partition('=')
+        try:
+            rates[host.strip().lower()] = float(rate)
+        except ValueError:
+            sep = ''
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Invalid host rate '{value}', expected host=rate")
+    return rates
+
+def batch_command(args):
+    """Execute batch crawl of several conferences."""
+    from conferences.common.adapters import ADAPTER_REGISTRY
+    if args.all:
+        adapters = list(ADAPTER_REGISTRY.values())
+    elif args.conferences:
+        adapters = [find_adapter(name) for name in args.conferences]
+        if None in adapters:
+            return 1
+    else:
+        print("Error: No conferences given (name them or use --all)")
+        return 1
+    
+    from conferences.common.batch import BatchCrawler, write_summary
+    from conferences.common.http_cache import HTTPCache
+    cache = None
+    if args.cache_dir:
+        cache = HTTPCache(args.cache_dir, ttl=args.cache_ttl,
+                          max_bytes=int(args.cache_max_mb * 1024 * 1024))
+    try:
+        batch = BatchCrawler(adapters, max_connections=args.max_connections, per_host=args.per_host,
+                             rate=args.rate, host_rates=parse_host_rates(args.host_rate),
+                             output_dir=args.output_dir, output_format=args.format, cache=cache,
+                             parse_workers=args.parse_workers,
+                             progress_interval=args.progress_interval)
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}")
+        return 1
+    summary = batch.run(max_papers=args.limit, resume=args.resume, incremental=args.incremental)
+    
+    print(f"\n=== Batch crawl: {summary['elapsed_seconds']:.1f}s, "
+          f"peak {summary['peak_connections']}/{summary['max_connections']} connections ===")
+    for name, event in summary['events'].items():
+        mark = '✓' if event['status'] == 'done' else '❌'
+        print(f"{mark} {name}: {event['papers']} papers, {event['failed']} failed, "
+              f"{event['requests']} requests in {event['seconds']:.1f}s -> {event['output']}"
+              + (f" ({event['error']})" if event['error'] else ''))
+    if args.summary:
+        write_summary(summary, args.summary)
+        print(f"✓ Summary saved to: {args.summary}")
+    if args.metrics:
+        batch.write_metrics(args.metrics)
+        print(f"✓ Metrics saved to: {args.metrics}")
+    return 0 if all(event['status'] == 'done' for event in summary['events'].values()) else 1
+
+def reextract_command(args):
+    """Execute re-extraction from a raw-HTML archive."""
+    if not Path(args.archive).exists():
+        print(f"Error: Archive not found: {args.archive}")
+        return 1
+    
+    adapter = find_adapter(args.conference)
+    if adapter is not None:
+        from conferences.common.indico import IndicoCrawler
+        crawler = IndicoCrawler(adapter, base_url=args.base_url)
+        papers = crawler.reextract_from_archive(args.archive, parse_workers=args.parse_workers)
         crawler.save_papers(papers, args.output)
+        write_metrics(crawler, args.metrics)
     else:
-        print(f"Error: Conference '{args.conference}' not supported yet.")
         return 1
     
     return 0
@@ -58,13 +217,84 @@ def analyze_command(args):
     """Execute analysis command."""
     print(f"Analyzing data from: {args.input}")
     
-    if args.input.endswith('ipac2025_real_papers.json'):
-        from conferences.IPAC2025.analyze_real_data import analyze_papers
-        success = analyze_papers(args.input)
-        return 0 if success else 1
-    else:
-        print("Error: Unsupported data format.")
+    if not Path(args.input).exists():
+        print(f"Error: Input file not found: {args.input}")
+        return 1
+    
+    from conferences.IPAC2025.analyze_real_data import analyze_papers
+    success = analyze_papers(args.input, output=args.output, top_n=args.top)
+    return 0 if success else 1
+
+def combine_command(args):
+    """Execute combine command."""
+    from conferences.common.combine import SOURCE_REGISTRY, combine
+    
+    if args.list:
+        for source in SOURCE_REGISTRY.values():
+            path = source.discover()
+            print(f"{source.name}: {path if path else 'no input found'}")
+            for candidate in source.candidates:
+                print(f"    {candidate}")
+        return 0
+    
+    sources = None
+    if args.source:
+        unknown = [name for name in args.source if name not in SOURCE_REGISTRY]
+        if unknown:
+            print(f"Error: Unknown source(s): {', '.join(unknown)}")
+            return 1
+        sources = [SOURCE_REGISTRY[name] for name in args.source]
+    
+    summary = combine(args.output, columnar_file=args.columnar, sources=sources, force=args.force,
+                      remove=args.remove)
+    return 0 if summary['converted'] or summary['skipped'] or summary['removed'] else 1
+
+def parse_boosts(values):
+    """Parse repeated ``field=weight`` options into a boost dictionary."""
+    boosts = {}
+    for value in values or []:
+        field, sep, weight = value.partition('=')
+        try:
+            boosts[field.strip()] = float(weight)
+        except ValueError:
+            sep = ''
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Invalid boost '{value}', expected field=weight")
+    return boosts
+
+def search_command(args):
+    """Execute search command."""
+    if not Path(args.data).exists():
+        print(f"Error: Data file not found: {args.data}")
         return 1
+    
+    try:
+        boosts = parse_boosts(args.boost)
+    except argparse.ArgumentTypeError as e:
+        print(f"Error: {e}")
+        return 1
+    
+    from conferences.common.search import SearchIndex
+    index = SearchIndex.open(args.data, index_dir=args.index, rebuild=args.rebuild)
+    hits = index.search(args.query, top_k=args.top, boosts=boosts,
+                        conference=args.conference, category=args.category)
+    
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=2))
+        return 0
+    
+    if not hits:
+        print(f"No papers match: {args.query}")
+        return 0
+    for rank, hit in enumerate(hits, 1):
+        paper = hit['paper']
+        print(f"{rank:2d}. [{hit['score']:.2f}] {paper.get('title', '')}")
+        details = [paper.get('conference'), paper.get('paper_code') or paper.get('contribution_id')]
+        authors = paper.get('authors') or []
+        if authors:
+            details.append(', '.join(authors[:3]) + (' et al.' if len(authors) > 3 else ''))
+        print(f"    {' | '.join(str(item) for item in details if item)}")
+    return 0
 
 def main():
     """Main CLI entry point."""
@@ -78,29 +308,173 @@ def main():
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument('--profile', metavar='FILE',
+                        help='Profile the command and write the profile to FILE '
+                             '(pstats for cprofile mode, collapsed stacks for sample mode)')
+    parser.add_argument('--profile-mode', choices=['cprofile', 'sample'], default='cprofile',
+                        help='cprofile: deterministic, calling thread only; '
+                             'sample: stack sampling of all threads (default: cprofile)')
+    parser.add_argument('--profile-top', type=int, default=20,
+                        help='Entries in the profile summary tables (default: 20)')
+    parser.add_argument('--profile-interval', type=float, default=0.005,
+                        help='Sampling interval in seconds for sample mode (default: 0.005)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Also track allocations with tracemalloc while profiling')
+    parser.add_argument('--adapters', metavar='FILE',
+                        help='Register the conference adapters in this JSON file')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Crawl command
     crawl_parser = subparsers.add_parser('crawl', help='Crawl conference papers')
-    crawl_parser.add_argument('conference', help='Conference name (e.g., ipac2025)')
+    crawl_parser.add_argument('conference', nargs='?', help='Conference name (e.g., ipac2025)')
+    crawl_parser.add_argument('--list', action='store_true', help='List the registered conferences')
     crawl_parser.add_argument('--limit', type=int, help='Limit number of papers to crawl')
-    crawl_parser.add_argument('--output', default='papers.json', help='Output file name')
+    crawl_parser.add_argument('--output',
+                              help="Output file name (default: the conference's output file; "
+                                   '.jsonl streams papers as they are extracted; '
+                                   '.parquet/.arrow write a columnar dataset)')
+    crawl_parser.add_argument('--base-url',
+                              help="Indico server to crawl instead of the conference's (e.g. a mirror)")
+    crawl_parser.add_argument('--workers', type=int, default=1,
+                              help='Number of concurrent fetch workers (default: 1)')
+    crawl_parser.add_argument('--parse-workers', type=int, default=0,
+                              help='Parse pages in N worker processes fed by the fetch workers (default: 0, parse in the fetch workers)')
+    crawl_parser.add_argument('--rate', type=float, default=2.0,
+                              help='Maximum requests per second per host (default: 2.0)')
+    crawl_parser.add_argument('--cache-dir',
+                              help='Directory for the on-disk HTTP cache (disabled if omitted)')
+    crawl_parser.add_argument('--cache-ttl', type=float, default=0,
+                              help='Seconds to serve cached pages without revalidation (default: 0)')
+    crawl_parser.add_argument('--cache-max-mb', type=float, default=512,
+                              help='Maximum cache size in MB (default: 512)')
+    crawl_parser.add_argument('--journal',
+                              help='Crawl journal file, kept after the crawl (default: '
+                                   '<output>.journal.jsonl, removed once a crawl completes '
+                                   'without failures)')
+    crawl_parser.add_argument('--resume', action='store_true',
+                              help='Resume from the journal, fetching only unfinished or failed papers')
+    crawl_parser.add_argument('--incremental', action='store_true',
+                              help='Diff against the existing output file and re-parse only new or changed papers')
+    crawl_parser.add_argument('--archive',
+                              help='Append every fetched page to this WARC archive (e.g. ipac2025.warc.gz)')
+    crawl_parser.add_argument('--metrics',
+                              help='Write run metrics to this file (.json for a JSON report, '
+                                   'otherwise Prometheus text format)')
     crawl_parser.set_defaults(func=crawl_command)
     
+    # Batch command
+    batch_parser = subparsers.add_parser('batch',
+                                         help='Crawl several conferences in one process under one connection budget')
+    batch_parser.add_argument('conferences', nargs='*', help='Conference names (see crawl --list)')
+    batch_parser.add_argument('--all', action='store_true', help='Crawl every registered conference')
+    batch_parser.add_argument('--max-connections', type=int, default=8,
+                              help='Concurrent requests over all conferences (default: 8)')
+    batch_parser.add_argument('--per-host', type=int,
+                              help='Concurrent requests to one host (default: --max-connections)')
+    batch_parser.add_argument('--rate', type=float, default=2.0,
+                              help='Maximum requests per second per host (default: 2.0)')
+    batch_parser.add_argument('--host-rate', action='append', metavar='HOST=RATE',
+                              help='Requests per second for one host, e.g. indico.jacow.org=8 (repeatable)')
+    batch_parser.add_argument('--output-dir', default='.',
+                              help="Directory for each conference's output file (default: .)")
+    batch_parser.add_argument('--format', choices=['json', 'jsonl', 'parquet', 'arrow'],
+                              help="Output format (default: each conference's output file)")
+    batch_parser.add_argument('--limit', type=int, help='Limit number of papers per conference')
+    batch_parser.add_argument('--parse-workers', type=int, default=0,
+                              help='Parse processes per conference (default: 0, parse in the fetch threads)')
+    batch_parser.add_argument('--cache-dir', help='Persistent HTTP cache shared by all conferences')
+    batch_parser.add_argument('--cache-ttl', type=float, default=0,
+                              help='Seconds a cached page is reused without revalidation (default: 0)')
+    batch_parser.add_argument('--cache-max-mb', type=float, default=512,
+                              help='Maximum cache size in MB (default: 512)')
+    batch_parser.add_argument('--resume', action='store_true',
+                              help="Resume each conference from its journal (<output>.journal.jsonl)")
+    batch_parser.add_argument('--incremental', action='store_true',
+                              help='Only re-parse new or changed contributions of existing outputs')
+    batch_parser.add_argument('--progress-interval', type=float, default=10,
+                              help='Seconds between progress reports (default: 10, 0 to disable)')
+    batch_parser.add_argument('--summary', help='Write a JSON summary of the run to this file')
+    batch_parser.add_argument('--metrics', metavar='DIR',
+                              help='Write each conference\'s run metrics to DIR/<conference>.prom')
+    batch_parser.set_defaults(func=batch_command)
+    
+    # Re-extract command
+    reextract_parser = subparsers.add_parser('reextract',
+                                             help='Re-run extraction on a raw-HTML archive without network access')
+    reextract_parser.add_argument('--archive', required=True, help='WARC archive written by crawl --archive')
+    reextract_parser.add_argument('--conference', default='ipac2025',
+                                  help='Conference the archive belongs to (default: ipac2025)')
+    reextract_parser.add_argument('--output', default='papers.json', help='Output file name')
+    reextract_parser.add_argument('--base-url',
+                                  help="Indico server the archive was crawled from, if not the conference's")
+    reextract_parser.add_argument('--parse-workers', type=int, default=0,
+                                  help='Parse pages in N worker processes (default: 0, parse in-process)')
+    reextract_parser.add_argument('--metrics',
+                                  help='Write run metrics to this file (.json or Prometheus text)')
+    reextract_parser.set_defaults(func=reextract_command)
+    
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze paper data')
-    analyze_parser.add_argument('--input', required=True, help='Input data file')
+    analyze_parser.add_argument('--input', required=True,
+                                help='Input data file (any conference; .json, .jsonl, .parquet or .arrow)')
+    analyze_parser.add_argument('--output', help='Also write the statistics as JSON to this file')
+    analyze_parser.add_argument('--top', type=int, default=10,
+                                help='Entries in the top institution/keyword lists (default: 10)')
     analyze_parser.set_defaults(func=analyze_command)
     
+    # Combine command
+    combine_parser = subparsers.add_parser('combine',
+                                           help='Merge the per-conference datasets into the combined web dataset')
+    combine_parser.add_argument('--output', default='docs/data/papers-combined.json',
+                                help='Combined dataset (default: docs/data/papers-combined.json)')
+    combine_parser.add_argument('--columnar',
+                                help='Also write a .parquet or .arrow copy (requires pyarrow)')
+    combine_parser.add_argument('--source', action='append',
+                                help='Only update this registered source, keeping the others (repeatable)')
+    combine_parser.add_argument('--remove', action='append',
+                                help='Drop this source from the combined dataset (repeatable)')
+    combine_parser.add_argument('--force', action='store_true',
+                                help='Reconvert every source even if its input is unchanged')
+    combine_parser.add_argument('--list', action='store_true',
+                                help='List registered sources and their discovered inputs')
+    combine_parser.set_defaults(func=combine_command)
+    
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Ranked full-text search over paper data')
+    search_parser.add_argument('query', help='Search terms')
+    search_parser.add_argument('--data', default='docs/data/papers-combined.json',
+                               help='Dataset to search (default: docs/data/papers-combined.json)')
+    search_parser.add_argument('--index',
+                               help='Index directory (default: <data>.bm25, built on first use)')
+    search_parser.add_argument('--rebuild', action='store_true', help='Rebuild the index before searching')
+    search_parser.add_argument('--conference', action='append',
+                               help='Only papers from this conference (repeatable)')
+    search_parser.add_argument('--category', action='append',
+                               help='Only categories starting with this value, e.g. MC7 (repeatable)')
+    search_parser.add_argument('--boost', action='append', metavar='FIELD=WEIGHT',
+                               help='Field boost, e.g. title=3 (fields: title, abstract, authors, keywords)')
+    search_parser.add_argument('--top', type=int, default=10, help='Number of results (default: 10)')
+    search_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    search_parser.set_defaults(func=search_command)
+    
     # Parse arguments
     args = parser.parse_args()
     
     # Setup logging
     setup_logging(args.verbose)
     
+    if args.adapters:
+        from conferences.common.adapters import load_adapters
+        load_adapters(args.adapters)
+    
     # Execute command
     if hasattr(args, 'func'):
+        if args.profile:
+            from conferences.common.profiling import profile_call
+            return profile_call(lambda: args.func(args), args.profile, mode=args.profile_mode,
+                                top=args.profile_top, interval=args.profile_interval,
+                                memory=args.profile_memory)
         return args.func(args)
     else:
         parser.print_help()
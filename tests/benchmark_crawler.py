@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Crawler Throughput Benchmark
+
+This script runs ``ImprovedIPAC2025Crawler`` end to end against the local
+Indico stand-in server (``tests/indico_stub.py``) at a configurable scale,
+server latency and fault rate, and reports crawl throughput, HTTP fetch
+latency, parse time per page and peak memory. Run it before and after a
+crawler change and compare the numbers (``--json`` keeps them for later).
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Measurements:
+- pages/s: contribution pages extracted per second of crawl wall time
+- fetch latency: p50/p99/max of every HTTP request, including failed attempts
+- parse time: per page, timed in-process (``--parse-workers 0`` only)
+- peak RSS: maximum resident set size of this process and its parse processes
+
+Each run should be a fresh process, since peak RSS never goes down.
+
+Usage:
+    python tests/benchmark_crawler.py [--papers 500] [--workers 8] [--latency 0.02]
+    python tests/benchmark_crawler.py --error-rate 0.05 --timeout-rate 0.01 --json bench.json
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process and its finished children, in MB."""
+    if resource is None:
+        return None
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak * scale / (1024 * 1024)
+
+
+class _Timings:
+    """Thread-safe duration lists, filled by the crawler method wrappers."""
+
+    def __init__(self):
+        self.fetch = []
+        self.parse = []
+        self.fetch_errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        with self._lock:
+            getattr(self, name).append(seconds)
+
+    def error(self):
+        with self._lock:
+            self.fetch_errors += 1
+
+
+def _instrument(crawler, timings):
+    """Time every HTTP request and every in-process page parse of ``crawler``."""
+    get, parse = crawler.session.get, crawler.parse_paper_info
+
+    def timed_get(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return get(*args, **kwargs)
+        except Exception:
+            timings.error()
+            raise
+        finally:
+            timings.add('fetch', time.perf_counter() - start)
+
+    def timed_parse(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return parse(*args, **kwargs)
+        finally:
+            timings.add('parse', time.perf_counter() - start)
+
+    crawler.session.get = timed_get
+    crawler.parse_paper_info = timed_parse
+
+
+@contextlib.contextmanager
+def _silenced(enabled=True):
+    """Send stdout and log records, including spawned parse processes' output, to /dev/null."""
+    if not enabled:
+        yield
+        return
+    logging.disable(logging.CRITICAL)
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    devnull = open(os.devnull, 'w')
+    stdout, sys.stdout = sys.stdout, devnull
+    os.dup2(devnull.fileno(), 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+        sys.stdout = stdout
+        devnull.close()
+        logging.disable(logging.NOTSET)
+
+
+def run_benchmark(papers=200, workers=8, parse_workers=0, latency=0.01, jitter=0.0,
+                  error_rate=0.0, timeout_rate=0.0, timeout=0.5, seed=0, quiet=True):
+    """
+    Crawl a synthetic event once and measure it.
+
+    Args:
+        papers (int): Contributions on the synthetic event
+        workers (int): Crawler fetch workers
+        parse_workers (int): Crawler parse processes (0 parses in the fetch threads)
+        latency (float): Server latency per response, seconds
+        jitter (float): Extra random server latency, up to this many seconds
+        error_rate (float): Fraction of contribution requests answered with 429
+        timeout_rate (float): Fraction of contribution requests left hanging
+        timeout (float): Crawler request timeout, seconds
+        seed (int): Seed for the server's latency and fault choices
+        quiet (bool): Suppress the crawler's progress output
+
+    Returns:
+        dict: ``config`` and ``results`` (counts, rates in pages/s, times in ms, RSS in MB)
+    """
+    config = {'papers': papers, 'workers': workers, 'parse_workers': parse_workers,
+              'latency': latency, 'jitter': jitter, 'error_rate': error_rate,
+              'timeout_rate': timeout_rate, 'timeout': timeout, 'seed': seed}
+    timings = _Timings()
+    # Hung requests are held a little past the crawler's timeout
+    with IndicoStubServer(paper_count=papers, latency=latency, jitter=jitter, error_rate=error_rate,
+                          timeout_rate=timeout_rate, hang=timeout * 2, seed=seed) as server:
+        limiter = RateLimiter(requests_per_second=100000, base_delay=0.01, max_delay=0.5)
+        crawler = ImprovedIPAC2025Crawler(base_url=server.base_url, workers=workers,
+                                          rate_limiter=limiter, timeout=timeout)
+        _instrument(crawler, timings)
+
+        with _silenced(quiet):
+            start = time.perf_counter()
+            results = crawler.crawl_conference(parse_workers=parse_workers)
+            elapsed = time.perf_counter() - start
+
+        limiter_metrics = next(iter(limiter.metrics().values()), {})
+        results = {
+            'papers_extracted': len(results),
+            'requests': len(server.requests),
+            'injected_429': server.fault_counts['429'],
+            'injected_timeouts': server.fault_counts['timeout'],
+            'fetch_errors': timings.fetch_errors,
+            'retries': limiter_metrics.get('retries', 0),
+            'elapsed_s': elapsed,
+            'pages_per_s': len(results) / elapsed if elapsed else 0.0,
+            'fetch_p50_ms': percentile(timings.fetch, 0.50) * 1000,
+            'fetch_p99_ms': percentile(timings.fetch, 0.99) * 1000,
+            'fetch_max_ms': max(timings.fetch, default=0.0) * 1000,
+            'parse_mean_ms': sum(timings.parse) / len(timings.parse) * 1000 if timings.parse else None,
+            'parse_p99_ms': percentile(timings.parse, 0.99) * 1000 if timings.parse else None,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+    return {'config': config, 'results': results}
+
+
+def print_report(report):
+    config, results = report['config'], report['results']
+    print("Crawler benchmark: " + ", ".join(f"{key}={value}" for key, value in config.items()))
+    print(f"  papers extracted:  {results['papers_extracted']}/{config['papers']} "
+          f"in {results['elapsed_s']:.2f} s ({results['pages_per_s']:.1f} pages/s)")
+    print(f"  requests:          {results['requests']} ({results['retries']} retries, "
+          f"{results['injected_429']} injected 429s, {results['injected_timeouts']} injected timeouts)")
+    print(f"  fetch latency:     p50 {results['fetch_p50_ms']:.1f} ms, p99 {results['fetch_p99_ms']:.1f} ms, "
+          f"max {results['fetch_max_ms']:.1f} ms")
+    if results['parse_mean_ms'] is not None:
+        print(f"  parse time/page:   mean {results['parse_mean_ms']:.2f} ms, p99 {results['parse_p99_ms']:.2f} ms")
+    else:
+        print("  parse time/page:   not measured (parsing in worker processes)")
+    if results['peak_rss_mb'] is not None:
+        print(f"  peak RSS:          {results['peak_rss_mb']:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the crawler against a local Indico stand-in')
+    parser.add_argument('--papers', type=int, default=200, help='Contributions on the synthetic event')
+    parser.add_argument('--workers', type=int, default=8, help='Crawler fetch workers')
+    parser.add_argument('--parse-workers', type=int, default=0, help='Crawler parse processes')
+    parser.add_argument('--latency', type=float, default=0.01, help='Server latency per response (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random server latency (s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of pages answered with 429')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='Fraction of pages left hanging')
+    parser.add_argument('--timeout', type=float, default=0.5, help='Crawler request timeout (s)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for latency and faults')
+    parser.add_argument('--json', help='Also write the report to this JSON file')
+    args = parser.parse_args()
+
+    report = run_benchmark(papers=args.papers, workers=args.workers, parse_workers=args.parse_workers,
+                           latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           timeout_rate=args.timeout_rate, timeout=args.timeout, seed=args.seed)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
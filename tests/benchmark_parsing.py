@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - HTML Parsing Micro-Benchmark
+
+This script times contribution-page parsing on the saved Indico fixture pages
+in ``tests/fixtures``. It compares the original BeautifulSoup implementation
+(one ``find_all``/``select_one`` tree walk per selector) with the single-pass
+extractor on each available backend.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+The ``legacy_*`` functions are kept verbatim as the reference behaviour; the
+test suite checks that the fast path returns identical fields.
+
+Usage:
+    python tests/benchmark_parsing.py [--repeat 50]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common import html_parser
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+BASE_URL = 'https://indico.jacow.org'
+
+
+def fixture_pages():
+    """Return ``[(name, html)]`` for all saved contribution pages."""
+    return [(path.name, path.read_text(encoding='utf-8'))
+            for path in sorted(FIXTURES.glob('indico_contribution_*.html'))]
+
+
+def list_page():
+    return (FIXTURES / 'indico_contributions_list.html').read_text(encoding='utf-8')
+
+
+def legacy_parse_fields(html_content):
+    """Original per-selector BeautifulSoup extraction (v1.3)."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    fields = {'title': '', 'authors': [], 'abstract': '', 'category': '', 'datetime': ''}
+
+    title_elem = soup.find('h1') or soup.find('title')
+    if title_elem:
+        fields['title'] = title_elem.get_text().strip()
+
+    author_patterns = [
+        soup.find_all('span', class_=re.compile(r'author', re.I)),
+        soup.find_all('div', class_=re.compile(r'author', re.I)),
+        soup.find_all('a', href=re.compile(r'/person/')),
+    ]
+    for pattern in author_patterns:
+        if pattern:
+            for elem in pattern:
+                author_name = elem.get_text().strip()
+                if author_name and len(author_name) > 2:
+                    fields['authors'].append(author_name)
+            if fields['authors']:
+                break
+
+    for field, selectors in (
+        ('abstract', ['div.abstract', 'div.description', 'div.summary',
+                      'div[class*="abstract"]', 'div[class*="description"]']),
+        ('category', ['span.category', 'div.category', 'span[class*="category"]',
+                      'div[class*="track"]', 'div[class*="session"]']),
+        ('datetime', ['time', 'span.datetime', 'div.datetime',
+                      'span[class*="time"]', 'div[class*="time"]']),
+    ):
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                fields[field] = elem.get_text().strip()
+                break
+    return fields
+
+
+def legacy_find_links(html_content, base_url=BASE_URL):
+    """Original tree walk plus regex link discovery (v1.3)."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    links = set()
+    for link in soup.find_all('a', href=True):
+        href = link.get('href')
+        if href and '/event/81/contributions/' in href:
+            if re.match(r'.*/event/81/contributions/\d+/?$', href):
+                links.add(urljoin(base_url, href))
+    pattern = re.compile(re.escape(base_url) + r'/event/81/contributions/(\d+)/?')
+    for match in pattern.finditer(html_content):
+        links.add(match.group(0))
+    return links
+
+
+def fast_parse_fields(crawler, html_content):
+    """Fields produced by the crawler's single-pass extraction."""
+    paper = crawler.parse_paper_info(f'{BASE_URL}/event/81/contributions/1/', html_content)
+    return {key: paper[key] for key in ('title', 'authors', 'abstract', 'category', 'datetime')}
+
+
+def time_per_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark contribution page parsing')
+    parser.add_argument('--repeat', type=int, default=50, help='Iterations per page')
+    args = parser.parse_args()
+
+    pages = fixture_pages()
+    backends = ['html.parser'] + (['lxml'] if html_parser.lxml_html is not None else [])
+    crawlers = {backend: ImprovedIPAC2025Crawler(parser_backend=backend) for backend in backends}
+
+    # Silence per-page progress output from the crawler while timing
+    devnull = open(os.devnull, 'w')
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        rows = []
+        for name, html in pages:
+            row = {'page': name,
+                   'legacy': time_per_call(lambda: legacy_parse_fields(html), args.repeat)}
+            for backend, crawler in crawlers.items():
+                row[backend] = time_per_call(lambda: fast_parse_fields(crawler, html), args.repeat)
+            rows.append(row)
+
+        html = list_page()
+        links_legacy = time_per_call(lambda: legacy_find_links(html), args.repeat)
+        links_fast = time_per_call(
+            lambda: crawlers['html.parser'].find_contribution_links(html), args.repeat)
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+
+    print(f"Per-page parse time (ms, mean of {args.repeat} runs)")
+    header = f"{'page':<36}{'legacy':>10}" + ''.join(f"{b:>14}" for b in backends)
+    print(header)
+    for row in rows:
+        line = f"{row['page']:<36}{row['legacy'] * 1000:>10.2f}"
+        for backend in backends:
+            speedup = row['legacy'] / row[backend]
+            line += f"{row[backend] * 1000:>8.2f} ({speedup:.1f}x)"
+        print(line)
+    print(f"\nfind_contribution_links on list page: legacy {links_legacy * 1000:.2f} ms, "
+          f"regex scan {links_fast * 1000:.2f} ms ({links_legacy / links_fast:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - CLI Startup Budget
+
+This script measures what each ``srf-insights`` entry point costs to import,
+with ``python -X importtime`` in a fresh interpreter, and checks it against
+the startup budget below. Subcommands import their modules lazily, so a
+quick ``search`` or ``combine`` never pays for pandas, pyarrow, requests,
+BeautifulSoup, PyMuPDF or Pillow. ``tests/test_startup.py`` checks the heavy
+modules on every run, and the millisecond budgets only when
+``SRF_STARTUP_BUDGET=1`` is set (timings vary with machine load); update the
+budget here when an entry point legitimately needs more.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Measurements:
+- import ms: cumulative ``-X importtime`` of the module (best of ``--runs``),
+  excluding interpreter startup and ``site``
+- heavy modules: which of ``HEAVY_MODULES`` the import loaded
+
+Usage:
+    python tests/benchmark_startup.py [--runs 5] [--json startup.json]
+    python -X importtime srf_conference_insights_cli.py --help 2> importtime.log
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Third-party packages that are expensive to import
+HEAVY_MODULES = ('numpy', 'pandas', 'pyarrow', 'requests', 'bs4', 'lxml', 'pymupdf', 'fitz', 'PIL')
+
+# Entry point -> (module, import budget in ms, heavy modules it may load)
+STARTUP_BUDGET = {
+    'cli': ('srf_conference_insights_cli', 60, ()),
+    'search': ('conferences.common.search', 250, ('numpy',)),
+    'combine': ('conferences.common.combine', 60, ()),
+    'crawl': ('conferences.IPAC2025.improved_real_crawler', 150, ('lxml',)),
+    'hiat2025': ('conferences.HIAT2025.hiat2025_extractor', 60, ()),
+    'analyze': ('conferences.IPAC2025.analyze_real_data', 1500, ('numpy', 'pandas', 'pyarrow')),
+}
+
+_PROBE = ("import json, sys\n"
+          "import {module}\n"
+          "print(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))\n")
+
+
+def measure(module, runs=3):
+    """
+    Import ``module`` in fresh interpreters under ``-X importtime``.
+
+    Returns:
+        dict: ``import_ms`` (best of ``runs``) and ``heavy`` (heavy modules loaded)
+    """
+    best, heavy = None, []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative_ms = int(fields[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+        heavy = json.loads(result.stdout)
+    return {'import_ms': best, 'heavy': heavy}
+
+
+def check_budget(runs=3, budget=None, timing=True):
+    """
+    Measure every entry point against its budget.
+
+    Args:
+        runs (int): Interpreters per entry point (best time is kept)
+        budget (dict, optional): Entry points to check (default: ``STARTUP_BUDGET``)
+        timing (bool): Also report imports slower than their budget; without
+                       it only unexpected heavy modules are problems
+
+    Returns:
+        dict: Entry point -> measurement plus ``budget_ms``, ``allowed`` and
+              ``problems`` (empty when within budget)
+    """
+    report = {}
+    for name, (module, budget_ms, allowed) in (budget or STARTUP_BUDGET).items():
+        entry = measure(module, runs)
+        entry.update(module=module, budget_ms=budget_ms, allowed=list(allowed), problems=[])
+        unexpected = [heavy for heavy in entry['heavy'] if heavy not in allowed]
+        if unexpected:
+            entry['problems'].append(f"imports {', '.join(unexpected)}")
+        if timing and entry['import_ms'] > budget_ms:
+            entry['problems'].append(f"{entry['import_ms']:.1f} ms exceeds the {budget_ms} ms budget")
+        report[name] = entry
+    return report
+
+
+def print_report(report):
+    print(f"{'entry point':<12} {'import ms':>10} {'budget':>8}  heavy modules")
+    for name, entry in report.items():
+        status = '❌ ' + '; '.join(entry['problems']) if entry['problems'] else '✓'
+        print(f"{name:<12} {entry['import_ms']:>10.1f} {entry['budget_ms']:>8}  "
+              f"{', '.join(entry['heavy']) or '-':<28} {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure srf-insights import time against its budget')
+    parser.add_argument('--runs', type=int, default=5, help='Interpreters per entry point (best is kept)')
+    parser.add_argument('--json', help='Also write the report to this JSON file')
+    args = parser.parse_args()
+
+    report = check_budget(args.runs)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Report saved to: {args.json}")
+    return 1 if any(entry['problems'] for entry in report.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Local Indico Stand-in Server
+
+This module provides a minimal in-process HTTP server that mimics the parts of
+an Indico event site used by the crawlers, so crawler tests never touch
+indico.jacow.org.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Features:
+- Contributions list page and per-contribution detail pages
+- HTTP/1.1 keep-alive so connection reuse can be observed
+- Request and connection counters for assertions
+- Injectable error responses (e.g. 429 with Retry-After) and hung responses
+- ETag validators with ``304 Not Modified`` and editable pages
+- Benchmark mode: response latency and random 429s / timeouts on contribution pages
+
+Usage:
+    with IndicoStubServer(paper_count=20) as server:
+        crawler = ImprovedIPAC2025Crawler(base_url=server.base_url)
+"""
+
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def contribution_html(event_id, contribution_id, revision=0):
+    """Render a synthetic contribution detail page."""
+    suffix = f" (rev {revision})" if revision else ""
+    return f"""<!DOCTYPE html>
+<html>
+<head><title>Contribution {contribution_id}</title></head>
+<body>
+<h1>Synthetic Paper {contribution_id}{suffix}</h1>
+<div class="people">
+  <span class="author-name">Alice Author{contribution_id}</span>
+  <span class="author-name">Bob Builder{contribution_id}</span>
+</div>
+<div class="abstract">Abstract text for paper {contribution_id} on SRF cavities.</div>
+<div class="track">MC{contribution_id % 7}: Accelerator Technology</div>
+<time>2025-06-0{contribution_id % 5 + 1} 10:00</time>
+</body>
+</html>"""
+
+
+def contributions_list_html(event_id, contribution_ids):
+    """Render a synthetic contributions list page."""
+    items = "\n".join(
+        f'<li><a href="/event/{event_id}/contributions/{cid}/">Paper {cid}</a></li>'
+        for cid in contribution_ids
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head><title>Contribution List</title></head>
+<body>
+<ul class="contribution-list">
+{items}
+</ul>
+<a href="/event/{event_id}/contributions/">All contributions</a>
+</body>
+</html>"""
+
+
+# Pseudo-status for injected faults that never answer
+TIMEOUT = "timeout"
+
+
+class _IndicoHandler(BaseHTTPRequestHandler):
+    """Request handler serving pages from the owning IndicoStubServer."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub.record_request(self.path, self.client_address)
+        delay = stub.latency_for(self.path)
+        if delay:
+            time.sleep(delay)
+        status, body, headers = stub.respond(self.path)
+        if status == TIMEOUT:
+            # Hold the request past the client's timeout; the client has
+            # usually given up and closed the connection by then
+            time.sleep(stub.hang)
+            self.close_connection = True
+            return
+        payload = body.encode("utf-8")
+        if status == 200:
+            etag = '"%s"' % hashlib.sha1(payload).hexdigest()
+            headers = dict(headers, ETag=etag)
+            if self.headers.get("If-None-Match") == etag:
+                status, payload = 304, b""
+                stub.record_not_modified(self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class IndicoStubServer:
+    """
+    Threaded local HTTP server serving a synthetic Indico event.
+
+    Attributes:
+        event_id (int): Indico event number used in all paths
+        contribution_ids (list): Contribution IDs listed on the event
+        requests (list): Paths requested so far, in arrival order
+        not_modified (list): Paths answered with ``304 Not Modified``
+        connections (set): Distinct client (host, port) pairs seen
+        revisions (dict): Contribution ID -> edit count, changes the page
+        latency (float): Seconds added to every response
+        jitter (float): Extra uniformly random latency, up to this many seconds
+        error_rate (float): Fraction of contribution page requests answered with 429
+        timeout_rate (float): Fraction of contribution page requests left hanging
+        hang (float): Seconds a hanging request is held before the connection closes
+        fault_counts (dict): Random faults served so far, by kind
+    """
+
+    def __init__(self, paper_count=10, event_id=81, first_id=1000, latency=0.0, jitter=0.0,
+                 error_rate=0.0, timeout_rate=0.0, hang=1.0, seed=0):
+        self.event_id = event_id
+        self.contribution_ids = list(range(first_id, first_id + paper_count))
+        self.requests = []
+        self.not_modified = []
+        self.connections = set()
+        self.revisions = {}
+        self._faults = {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang = hang
+        self.fault_counts = {'429': 0, 'timeout': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record_request(self, path, client_address):
+        with self._lock:
+            self.requests.append(path)
+            self.connections.add(client_address)
+
+    def record_not_modified(self, path):
+        with self._lock:
+            self.not_modified.append(path)
+
+    def edit(self, contribution_id):
+        """Change a contribution page so its content and ETag differ."""
+        with self._lock:
+            self.revisions[contribution_id] = self.revisions.get(contribution_id, 0) + 1
+
+    def contribution_path(self, contribution_id):
+        return f"/event/{self.event_id}/contributions/{contribution_id}/"
+
+    def latency_for(self, path):
+        """Seconds to delay the response to ``path``."""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def inject(self, path, status, count=1, headers=None):
+        """
+        Answer the next ``count`` requests for ``path`` with ``status``.
+
+        ``status`` may be ``TIMEOUT`` to hold the requests without answering.
+        """
+        with self._lock:
+            self._faults.setdefault(path, []).extend([(status, headers or {})] * count)
+
+    def respond(self, path):
+        """Return ``(status, html, headers)``, applying injected faults first."""
+        with self._lock:
+            pending = self._faults.get(path)
+            fault = pending.pop(0) if pending else None
+            if fault is None and (self.error_rate or self.timeout_rate) and self._is_contribution(path):
+                roll = self._random.random()
+                if roll < self.timeout_rate:
+                    fault = (TIMEOUT, {})
+                    self.fault_counts['timeout'] += 1
+                elif roll < self.timeout_rate + self.error_rate:
+                    fault = (429, {'Retry-After': '0'})
+                    self.fault_counts['429'] += 1
+        if fault:
+            status, headers = fault
+            return status, f"<html><body>Error {status}</body></html>", headers
+        status, body = self.render(path)
+        return status, body, {}
+
+    def _is_contribution(self, path):
+        rest = path[len(f"/event/{self.event_id}/contributions/"):].strip("/")
+        return path.startswith(f"/event/{self.event_id}/contributions/") and rest.isdigit()
+
+    def render(self, path):
+        """Return ``(status, html)`` for a request path."""
+        prefix = f"/event/{self.event_id}/contributions/"
+        if not path.startswith(prefix):
+            return 404, "<html><body>Not found</body></html>"
+
+        rest = path[len(prefix):].strip("/")
+        if not rest:
+            return 200, contributions_list_html(self.event_id, self.contribution_ids)
+        if rest.isdigit() and int(rest) in self.contribution_ids:
+            cid = int(rest)
+            return 200, contribution_html(self.event_id, cid, self.revisions.get(cid, 0))
+        return 404, "<html><body>Not found</body></html>"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _IndicoHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Conference Adapter Tests
+
+Tests for the conference adapter registry, JSON adapter configs and crawls
+of a non-IPAC event through the shared Indico crawl engine and the CLI.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_adapters.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import srf_conference_insights_cli as cli
+from conferences.common import adapters
+from conferences.common.indico import IndicoCrawler
+from conferences.common.journal import CrawlJournal
+from conferences.common.paper_io import iter_papers
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+
+class TestAdapterRegistry(unittest.TestCase):
+    """Test cases for registering and loading conference adapters."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        registry = dict(adapters.ADAPTER_REGISTRY)
+        self.addCleanup(lambda: (adapters.ADAPTER_REGISTRY.clear(),
+                                 adapters.ADAPTER_REGISTRY.update(registry)))
+
+    def test_ipac2025_is_registered(self):
+        adapter = adapters.get_adapter('ipac2025')
+        self.assertIs(adapter, adapters.get_adapter('IPAC2025'))
+        self.assertEqual(adapter.event_url, 'https://indico.jacow.org/event/81/')
+        self.assertEqual(adapter.output, 'ipac2025_real_papers.json')
+        self.assertIsNone(adapters.get_adapter('unknown'))
+
+    def test_load_adapters_from_config(self):
+        config = os.path.join(self.tmpdir.name, 'conferences.json')
+        with open(config, 'w', encoding='utf-8') as f:
+            json.dump({'adapters': [
+                {'name': 'LINAC2026', 'event_id': 95, 'base_url': 'https://indico.example.org/',
+                 'field_selectors': {'abstract': ['div.summary']},
+                 'field_map': {'track': 'category'}, 'static_fields': {'series': 'LINAC'}},
+            ]}, f)
+
+        [adapter] = adapters.load_adapters(config)
+
+        self.assertIs(adapters.get_adapter('linac2026'), adapter)
+        self.assertEqual(adapter.event_url, 'https://indico.example.org/event/95/')
+        self.assertEqual(adapter.output, 'linac2026_papers.json')
+        # Overridden fields replace the defaults, the others are kept
+        self.assertEqual(adapter.field_selectors['abstract'], ['div.summary'])
+        self.assertEqual(adapter.field_selectors['title'], ['h1', 'title'])
+        self.assertEqual(adapter.map_record({'category': 'MC7'}),
+                         {'category': 'MC7', 'track': 'MC7', 'series': 'LINAC'})
+
+    def test_unknown_adapter_name(self):
+        with self.assertRaises(ValueError):
+            IndicoCrawler('LINAC1999')
+
+
+class TestAdapterCrawl(unittest.TestCase):
+    """Test cases for crawling a registered non-IPAC event."""
+
+    def setUp(self):
+        self.server = IndicoStubServer(paper_count=6, event_id=95, first_id=500).start()
+        self.addCleanup(self.server.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(adapters.ADAPTER_REGISTRY.pop, 'linac2026', None)
+        self.adapter = adapters.register_adapter(
+            'LINAC2026', event_id=95, base_url=self.server.base_url,
+            field_map={'track': 'category'}, static_fields={'series': 'LINAC'})
+
+    def test_crawl_maps_records(self):
+        crawler = IndicoCrawler('linac2026', workers=3,
+                                rate_limiter=RateLimiter(requests_per_second=10000, base_delay=0.01))
+        self.assertEqual(crawler.event_url, f"{self.server.base_url}/event/95/")
+
+        papers = crawler.crawl_conference()
+        # Worker processes receive the adapter and map records the same way
+        pipelined = crawler.crawl_conference(parse_workers=1)
+
+        self.assertEqual([p['contribution_id'] for p in papers],
+                         [str(cid) for cid in self.server.contribution_ids])
+        self.assertEqual(pipelined, papers)
+        self.assertEqual({p['conference'] for p in papers}, {'LINAC2026'})
+        self.assertEqual({p['series'] for p in papers}, {'LINAC'})
+        self.assertTrue(all(p['track'] == p['category'] != '' for p in papers))
+        self.assertTrue(papers[0]['url'].startswith(f"{self.server.base_url}/event/95/contributions/"))
+
+        output = os.path.join(self.tmpdir.name, 'linac.json')
+        crawler.save_papers(papers, output)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['conference'], 'LINAC2026')
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['srf-insights', *argv]), redirect_stdout(output):
+            status = cli.main()
+        return status, output.getvalue()
+
+    def test_cli_crawl_list_and_unknown(self):
+        status, output = self.run_cli('crawl', '--list')
+        self.assertEqual(status, 0)
+        self.assertIn(f"LINAC2026: {self.server.base_url}/event/95/", output)
+        self.assertIn('IPAC2025: https://indico.jacow.org/event/81/', output)
+
+        status, output = self.run_cli('crawl', 'LINAC1999')
+        self.assertEqual(status, 1)
+        self.assertIn('Registered: IPAC2025', output)
+
+    def test_cli_crawl_from_config(self):
+        adapters.ADAPTER_REGISTRY.pop('linac2026')
+        config = os.path.join(self.tmpdir.name, 'conferences.json')
+        with open(config, 'w', encoding='utf-8') as f:
+            json.dump([{'name': 'LINAC2026', 'event_id': 95}], f)
+        output = os.path.join(self.tmpdir.name, 'linac.jsonl')
+
+        status, _ = self.run_cli('--adapters', config, 'crawl', 'linac2026', '--base-url',
+                                 self.server.base_url, '--rate', '1000', '--output', output)
+
+        self.assertEqual(status, 0)
+        papers = list(iter_papers(output))
+        self.assertEqual(len(papers), 6)
+        self.assertEqual({p['conference'] for p in papers}, {'LINAC2026'})
+        # A clean crawl leaves no journal behind
+        self.assertFalse(os.path.exists(f"{output}.journal.jsonl"))
+
+    def test_cli_crawl_keeps_journal_after_failures(self):
+        self.server.inject(self.server.contribution_path(502), 404)
+        output = os.path.join(self.tmpdir.name, 'linac.json')
+
+        status, _ = self.run_cli('crawl', 'linac2026', '--rate', '1000', '--output', output)
+
+        self.assertEqual(status, 0)
+        journal = CrawlJournal(f"{output}.journal.jsonl")
+        self.assertEqual(len(journal.completed()), 5)
+        self.assertEqual(len(journal.failed()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Analysis Engine Tests
+
+Tests for the vectorized analysis engine, checked against the committed
+HIAT2025 statistics and across the supported dataset formats.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_analysis.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.common import analysis, columnar
+
+HIAT_DIR = os.path.join(REPO_ROOT, 'conferences', 'HIAT2025')
+
+PAPERS = [
+    {'title': 'A', 'conference': 'IPAC2025', 'authors': ['X', 'Y'], 'abstract': 'text',
+     'institutions': ['IHEP, Beijing, China'], 'keywords': ['SRF', 'Nb3Sn'], 'category': 'MC7',
+     'session': 'TUPS', 'pages': 4},
+    {'title': 'B', 'conference': 'IPAC2025', 'authors': [], 'abstract': '  ',
+     'institutions': ['IHEP, Beijing', 'CERN'], 'keywords': ['SRF'], 'category': '', 'pages': 9},
+    {'title': 'C', 'conference': 'HIAT2025'},
+]
+
+
+class TestAnalysisEngine(unittest.TestCase):
+    """Test cases for the vectorized analysis engine."""
+
+    def test_matches_committed_hiat_statistics(self):
+        """Test the engine reproduces HIAT2025/statistics.json without entity resolution."""
+        _, df = analysis.load_papers_frame(os.path.join(HIAT_DIR, 'papers.json'))
+        stats = analysis.compute_statistics(df, resolve_entities=False)
+        with open(os.path.join(HIAT_DIR, 'statistics.json'), encoding='utf-8') as f:
+            expected = json.load(f)
+        for key in ('basic_stats', 'top_institutions', 'top_keywords',
+                    'page_distribution', 'figure_distribution'):
+            self.assertEqual(stats[key], expected[key], key)
+
+    def test_resolved_institutions(self):
+        """Test spelling variants of one institution are counted together."""
+        _, df = analysis.load_papers_frame(os.path.join(HIAT_DIR, 'papers.json'))
+        stats = analysis.compute_statistics(df)
+        names = [name for name, _ in stats['top_institutions']]
+        self.assertEqual(stats['top_institutions'][0][0], 'Facility for Rare Isotope Beams')
+        self.assertFalse(any('Rare Isotope Beams' in name for name in names[1:]))
+        self.assertLess(stats['basic_stats']['total_institutions'], df['institutions'].explode().nunique())
+
+    def test_metrics_on_sparse_records(self):
+        """Test coverage, top lists and histograms tolerate missing fields."""
+        stats = analysis.compute_statistics(analysis.normalize_frame(pd.DataFrame(PAPERS)))
+        self.assertEqual(stats['coverage']['abstracts']['count'], 1)
+        self.assertEqual(stats['coverage']['authors']['count'], 1)
+        self.assertEqual(stats['top_institutions'], [['IHEP', 2], ['CERN', 1]])
+        self.assertEqual(stats['top_keywords'], [['SRF', 2], ['Nb3Sn', 1]])
+        self.assertEqual(stats['conference_distribution'], {'IPAC2025': 2, 'HIAT2025': 1})
+        self.assertEqual(stats['page_distribution']['3-4页'], 1)
+        self.assertEqual(stats['page_distribution']['8+页'], 1)
+        self.assertEqual(stats['basic_stats']['total_pages'], 13)
+        json.dumps(stats)
+
+    def test_empty_dataset(self):
+        """Test an empty dataset yields zeroed statistics."""
+        stats = analysis.compute_statistics(analysis.normalize_frame(pd.DataFrame()))
+        self.assertEqual(stats['basic_stats']['total_papers'], 0)
+        self.assertEqual(stats['top_institutions'], [])
+
+    @unittest.skipIf(not columnar.available(), "pyarrow is not installed")
+    def test_formats_agree(self):
+        """Test JSON and Parquet inputs give the same statistics."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = os.path.join(tmpdir, 'papers.json')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump({'papers': PAPERS}, f)
+            parquet_path = os.path.join(tmpdir, 'papers.parquet')
+            columnar.write_papers(parquet_path, PAPERS)
+
+            _, from_json = analysis.analyze_file(json_path)
+            _, from_parquet = analysis.analyze_file(parquet_path)
+        for stats in (from_json, from_parquet):
+            del stats['generated_at']
+        self.assertEqual(from_json, from_parquet)
+
+
+if __name__ == '__main__':
+    unittest.main()
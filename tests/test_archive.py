@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Raw HTML Archive Tests
+
+Unit tests for the WARC archive and for offline re-extraction of a crawl
+recorded against the local Indico stand-in server.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_archive.py
+"""
+
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common.archive import WarcArchive
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+
+class TestWarcArchive(unittest.TestCase):
+    """Test cases for WarcArchive."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'pages.warc.gz')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Test records read back in order with their bodies intact."""
+        archive = WarcArchive(self.path)
+        archive.write('http://a/1', '<p>one</p>')
+        archive.write('http://a/2', '<p>zwei – 二</p>')
+
+        records = list(WarcArchive(self.path).iter_records())
+        self.assertEqual([r.url for r in records], ['http://a/1', 'http://a/2'])
+        self.assertEqual(records[1].body, '<p>zwei – 二</p>')
+        self.assertEqual(records[0].status, 200)
+
+        # Standard .warc.gz: the whole file is one multi-member gzip stream
+        with gzip.open(self.path, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'WARC/1.0\r\n'))
+
+    def test_random_access_uses_latest_copy(self):
+        """Test the offset index resolves a URL to its newest record."""
+        archive = WarcArchive(self.path)
+        archive.write('http://a/1', 'old')
+        archive.write('http://a/2', 'other')
+        archive.write('http://a/1', 'new')
+
+        self.assertEqual(archive.get('http://a/1').body, 'new')
+        self.assertIsNone(archive.get('http://a/3'))
+        self.assertEqual(archive.latest_records()['http://a/1'].body, 'new')
+
+        os.remove(archive.index_path)
+        self.assertEqual(archive.get('http://a/2').body, 'other')
+        self.assertTrue(archive.index_path.exists())
+
+    def test_truncated_tail_is_ignored(self):
+        """Test a record cut short by a crash does not hide earlier ones."""
+        archive = WarcArchive(self.path)
+        archive.write('http://a/1', 'complete')
+        archive.write('http://a/2', 'x' * 1000)
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size - 20)
+
+        self.assertEqual([r.url for r in archive.iter_records()], ['http://a/1'])
+
+
+class TestReextraction(unittest.TestCase):
+    """Test cases for re-extracting a crawl from its archive."""
+
+    def setUp(self):
+        self.server = IndicoStubServer(paper_count=8).start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'ipac2025.warc.gz')
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_reextract_matches_crawl_without_network(self):
+        """Test replaying the archive reproduces the crawl offline."""
+        crawler = ImprovedIPAC2025Crawler(
+            base_url=self.server.base_url, workers=3, archive=self.path,
+            rate_limiter=RateLimiter(requests_per_second=10000, base_delay=0.01))
+        papers = crawler.crawl_conference()
+        base_url = self.server.base_url
+        self.server.stop()
+
+        offline = ImprovedIPAC2025Crawler(base_url=base_url)
+        self.assertEqual(len(papers), 8)
+        self.assertEqual(offline.reextract_from_archive(self.path), papers)
+        self.assertEqual(offline.reextract_from_archive(self.path, parse_workers=2), papers)
+
+
+if __name__ == '__main__':
+    unittest.main()
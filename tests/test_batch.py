@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Batch Crawl Tests
+
+Tests for the fair connection scheduler and for batch crawls of several
+events, served by local Indico stand-in servers, through ``BatchCrawler``
+and the CLI's ``batch`` command.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_batch.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import srf_conference_insights_cli as cli
+from conferences.common import adapters
+from conferences.common.batch import BatchCrawler, ConnectionScheduler
+from conferences.common.indico import IndicoCrawler
+from conferences.common.paper_io import iter_papers
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+
+class TestConnectionScheduler(unittest.TestCase):
+    """Test cases for the shared connection budget."""
+
+    def queue_requests(self, scheduler, requests, order):
+        """Start a thread per ``(host, event)`` request, each logging its event when granted."""
+        threads = []
+        for host, event in requests:
+            def request(host=host, event=event):
+                scheduler.acquire(host, event)
+                order.append(event)
+                time.sleep(0.001)
+                scheduler.release(host)
+            threads.append(threading.Thread(target=request))
+            threads[-1].start()
+            wait_until(lambda: scheduler.waiting() == len(threads))
+        return threads
+
+    def test_small_event_is_not_starved(self):
+        scheduler = ConnectionScheduler(max_connections=1)
+        order = []
+        scheduler.acquire('indico.test', 'holder')
+        threads = self.queue_requests(scheduler, [('indico.test', 'big')] * 5
+                                      + [('indico.test', 'small')] * 2, order)
+
+        scheduler.release('indico.test')
+        for thread in threads:
+            thread.join()
+
+        # Round-robin over events instead of first come, first served
+        self.assertEqual(order, ['big', 'small', 'big', 'small', 'big', 'big', 'big'])
+        self.assertEqual(scheduler.granted, {'holder': 1, 'big': 5, 'small': 2})
+        self.assertEqual(scheduler.in_flight(), 0)
+
+    def test_budget_and_per_host_caps(self):
+        scheduler = ConnectionScheduler(max_connections=3, per_host=2)
+        for event in ('a', 'b'):
+            scheduler.acquire('one.test', event)
+        order = []
+
+        def hold(host, event):
+            thread = threading.Thread(target=lambda: (scheduler.acquire(host, event), order.append(event)))
+            thread.start()
+            return thread
+
+        threads = [hold('one.test', 'a')]
+        wait_until(lambda: scheduler.waiting() == 1)
+        # The free slot goes to a later request for a host below its cap
+        threads.append(hold('two.test', 'c'))
+        wait_until(lambda: order == ['c'])
+        self.assertEqual(scheduler.waiting(), 1)
+
+        scheduler.release('one.test')
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ['c', 'a'])
+        self.assertEqual(scheduler.peak, 3)
+
+
+class TestBatchCrawl(unittest.TestCase):
+    """Test cases for crawling several events in one process."""
+
+    def setUp(self):
+        self.big = IndicoStubServer(paper_count=40, event_id=81, latency=0.01).start()
+        self.addCleanup(self.big.stop)
+        self.small = IndicoStubServer(paper_count=6, event_id=95, first_id=500, latency=0.01).start()
+        self.addCleanup(self.small.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        registry = dict(adapters.ADAPTER_REGISTRY)
+        self.addCleanup(lambda: (adapters.ADAPTER_REGISTRY.clear(),
+                                 adapters.ADAPTER_REGISTRY.update(registry)))
+        adapters.register_adapter('BIG2025', event_id=81, base_url=self.big.base_url)
+        adapters.register_adapter('SMALL2025', event_id=95, base_url=self.small.base_url)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_batch_crawl(self):
+        batch = BatchCrawler(['big2025', 'small2025'], max_connections=4, rate=1000,
+                             output_dir=self.tmpdir.name, progress_interval=0)
+        summary = batch.run()
+
+        big, small = summary['events']['BIG2025'], summary['events']['SMALL2025']
+        self.assertEqual((big['status'], big['papers']), ('done', 40))
+        self.assertEqual((small['status'], small['papers']), ('done', 6))
+        self.assertEqual(big['requests'], 41)
+        self.assertEqual(small['output'], self.path('small2025_papers.json'))
+        with open(small['output'], encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['conference'], 'SMALL2025')
+        self.assertEqual(len(data['papers']), 6)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ['big2025_papers.json', 'small2025_papers.json'])
+        # The budget is used in full but never exceeded, and the small event
+        # finishes long before the big one
+        self.assertEqual(summary['peak_connections'], 4)
+        self.assertLess(small['seconds'], big['seconds'])
+        self.assertEqual(batch.progress('SMALL2025'),
+                         {'status': 'done', 'done': 6, 'failed': 0, 'total': 6, 'requests': 7})
+
+    def test_rate_limit_holds_after_waiting_for_slots(self):
+        scheduler = ConnectionScheduler(max_connections=3)
+        crawler = IndicoCrawler('big2025', rate_limiter=RateLimiter(requests_per_second=10, burst=1),
+                                scheduler=scheduler)
+        urls = [self.big.base_url + self.big.contribution_path(cid)
+                for cid in self.big.contribution_ids[:3]]
+        host = RateLimiter.host_of(urls[0])
+        for _ in range(3):
+            scheduler.acquire(host, 'other')
+        sent = []
+        get = crawler.session.get
+
+        def timed_get(url, **kwargs):
+            sent.append(time.monotonic())
+            return get(url, **kwargs)
+
+        with mock.patch.object(crawler.session, 'get', side_effect=timed_get):
+            threads = [threading.Thread(target=crawler.get_page_content, args=(url,)) for url in urls]
+            for thread in threads:
+                thread.start()
+            wait_until(lambda: scheduler.waiting() == 3)
+            # Long enough to refill the bucket several times over
+            time.sleep(0.3)
+            for _ in range(3):
+                scheduler.release(host)
+            for thread in threads:
+                thread.join()
+
+        # Freed slots do not release a burst of requests paid for while queued
+        self.assertEqual(len(sent), 3)
+        gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+        self.assertGreater(min(gaps), 0.08)
+
+    def test_failed_event_does_not_stop_others(self):
+        self.small.inject('/event/95/contributions/', 404)
+        batch = BatchCrawler(['big2025', 'small2025'], max_connections=4, rate=1000,
+                             output_dir=self.tmpdir.name, output_format='jsonl', progress_interval=0)
+        summary = batch.run(max_papers=10)
+
+        self.assertEqual(summary['events']['SMALL2025']['status'], 'failed')
+        self.assertEqual(summary['events']['BIG2025']['papers'], 10)
+        self.assertEqual(len(list(iter_papers(self.path('big2025_papers.jsonl')))), 10)
+
+    def test_cli_batch(self):
+        argv = ['srf-insights', 'batch', 'big2025', 'small2025', '--max-connections', '3',
+                '--rate', '1000', '--output-dir', self.tmpdir.name, '--summary', self.path('batch.json'),
+                '--metrics', self.path('metrics')]
+        output = io.StringIO()
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(output):
+            self.assertEqual(cli.main(), 0)
+
+        self.assertIn('✓ SMALL2025: 6 papers, 0 failed, 7 requests', output.getvalue())
+        with open(self.path('batch.json'), encoding='utf-8') as f:
+            summary = json.load(f)
+        self.assertEqual(summary['max_connections'], 3)
+        self.assertEqual(sorted(os.listdir(self.path('metrics'))), ['big2025.prom', 'small2025.prom'])
+
+    def test_cli_batch_unknown_conference(self):
+        output = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['srf-insights', 'batch', 'big2025', 'nope']), \
+                redirect_stdout(output):
+            self.assertEqual(cli.main(), 1)
+        self.assertIn("Conference 'nope' not supported yet", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Columnar Dataset Tests
+
+Tests for the Parquet / Arrow IPC export, its schema derivation from
+``conferences/conference_schema.json`` and the column-projected readers.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_columnar.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import jsonschema
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conferences.IPAC2025.analyze_real_data import analyze_papers
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common import columnar
+from conferences.common.paper_io import iter_papers, open_papers
+
+PAPERS = [
+    {'contribution_id': '1000', 'conference': 'IPAC2025', 'title': 'Nb3Sn cavities',
+     'authors': ['A. One', 'B. Two'], 'institutions': ['IHEP'], 'abstract': 'Coating',
+     'keywords': [], 'page_hash': 'ab' * 32},
+    {'contribution_id': 'HIAT25_0002', 'conference': 'HIAT2025', 'title': 'RFQ commissioning',
+     'authors': [], 'pages': 4, 'figures': 3, 'file_size_kb': 812.5},
+]
+
+
+@unittest.skipIf(not columnar.available(), "pyarrow is not installed")
+class TestColumnar(unittest.TestCase):
+    """Test cases for columnar paper datasets."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_schema_follows_conference_schema(self):
+        """Test list and numeric columns come from the JSON Schema."""
+        schema = columnar.arrow_schema()
+        properties = columnar.load_schema()['properties']
+        self.assertEqual(schema.names, list(properties))
+        self.assertEqual(str(schema.field('authors').type), 'list<item: string>')
+        self.assertEqual(str(schema.field('pages').type), 'int64')
+        self.assertEqual(str(schema.field('file_size_kb').type), 'double')
+
+    def test_sample_records_match_schema(self):
+        """Test the fixtures are valid paper records."""
+        for paper in PAPERS:
+            jsonschema.validate(paper, columnar.load_schema())
+
+    def test_round_trip_both_formats(self):
+        """Test Parquet and Arrow IPC read back the papers and metadata."""
+        for name in ('papers.parquet', 'papers.arrow'):
+            with self.subTest(format=name):
+                path = self.path(name)
+                rows = columnar.write_papers(path, iter(PAPERS), metadata={'source': 'test'})
+                self.assertEqual(rows, 2)
+                self.assertEqual(list(iter_papers(path)), PAPERS)
+                self.assertEqual(open_papers(path)[0], {'source': 'test'})
+
+    def test_column_projection(self):
+        """Test readers load only the requested columns."""
+        path = self.path('papers.parquet')
+        with columnar.ColumnarPaperWriter(path, batch_size=1) as writer:
+            for paper in PAPERS * 3:
+                writer.write(paper)
+
+        df = columnar.read_columns(path, ['conference', 'authors'])
+        self.assertEqual(list(df.columns), ['conference', 'authors'])
+        self.assertEqual(len(df), 6)
+        self.assertEqual(list(df['authors'][0]), ['A. One', 'B. Two'])
+
+    def test_save_and_analyze_parquet(self):
+        """Test the crawler's Parquet output feeds the analysis report."""
+        path = self.path('ipac2025_real_papers.parquet')
+        crawler = ImprovedIPAC2025Crawler()
+        crawler.save_papers(PAPERS[:1], path)
+
+        self.assertEqual(crawler.load_papers(path), PAPERS[:1])
+        self.assertEqual(columnar.read_metadata(path)['statistics']['total_papers'], 1)
+        self.assertTrue(analyze_papers(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Combine Pipeline Tests
+
+Tests for the registry-driven, incremental multi-conference combine step.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_combine.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.common import combine
+from conferences.common.paper_io import open_papers
+
+
+class TestCombine(unittest.TestCase):
+    """Test cases for the combine pipeline."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.output = os.path.join(self.root, 'out', 'papers-combined.json')
+        self.conversions = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_input(self, name, papers):
+        with open(os.path.join(self.root, name), 'w', encoding='utf-8') as f:
+            json.dump({'papers': papers}, f)
+
+    def source(self, name, filename):
+        def converter(papers):
+            self.conversions.append(name)
+            for paper in papers:
+                yield {**paper, 'conference': name}
+        return combine.CombineSource(name, ['missing.json', filename], converter)
+
+    def run_combine(self, sources, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            return combine.combine(self.output, sources=sources, root=self.root, **kwargs)
+
+    def test_incremental_runs(self):
+        """Test only new or changed sources are converted."""
+        self.write_input('a.json', [{'title': 'A1', 'authors': ['Ming Liu']}])
+        self.write_input('b.json', [{'title': 'B1', 'authors': ['M. Liu']}])
+        sources = [self.source('A', 'a.json'), self.source('B', 'b.json')]
+
+        summary = self.run_combine(sources)
+        self.assertEqual(summary['converted'], ['A', 'B'])
+        metadata, papers = open_papers(self.output)
+        papers = list(papers)
+        self.assertEqual([paper['title'] for paper in papers], ['A1', 'B1'])
+        self.assertEqual(papers[0]['author_ids'], papers[1]['author_ids'])
+        self.assertEqual(metadata['sources']['B']['input'], 'b.json')
+
+        summary = self.run_combine(sources)
+        self.assertEqual((summary['converted'], summary['skipped'], summary['written']),
+                         ([], ['A', 'B'], False))
+
+        self.write_input('b.json', [{'title': 'B2'}])
+        self.write_input('c.json', [{'title': 'C1'}])
+        self.conversions.clear()
+        summary = self.run_combine(sources + [self.source('C', 'c.json')])
+        self.assertEqual(self.conversions, ['B', 'C'])
+        self.assertTrue(summary['written'])
+        self.assertEqual(summary['statistics']['conferences'], {'A': 1, 'B': 1, 'C': 1})
+        self.assertEqual([paper['title'] for paper in open_papers(self.output)[1]], ['A1', 'B2', 'C1'])
+
+    def test_selected_and_missing_sources_keep_the_others(self):
+        """Test updating one source, or losing an input, keeps earlier papers."""
+        self.write_input('a.json', [{'title': 'A1'}])
+        self.write_input('b.json', [{'title': 'B1'}])
+        sources = [self.source('A', 'a.json'), self.source('B', 'b.json')]
+        self.run_combine(sources)
+
+        self.write_input('a.json', [{'title': 'A2'}])
+        summary = self.run_combine(sources[:1])
+        self.assertEqual(summary['converted'], ['A'])
+        self.assertEqual([paper['title'] for paper in open_papers(self.output)[1]], ['A2', 'B1'])
+
+        os.remove(os.path.join(self.root, 'b.json'))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            summary = combine.combine(self.output, sources=sources, root=self.root)
+        self.assertEqual(summary['missing'], ['B'])
+        self.assertFalse(summary['written'])
+        self.assertIn('keeping its 1 previously combined papers', output.getvalue())
+        self.assertEqual([paper['title'] for paper in open_papers(self.output)[1]], ['A2', 'B1'])
+
+    def test_removed_source_and_force(self):
+        """Test an explicitly removed source leaves the output and cache, and force reconverts."""
+        self.write_input('a.json', [{'title': 'A1'}])
+        self.write_input('b.json', [{'title': 'B1'}])
+        sources = [self.source('A', 'a.json'), self.source('B', 'b.json')]
+        self.run_combine(sources)
+
+        summary = self.run_combine(sources, remove=['B'])
+        self.assertEqual(summary['removed'], ['B'])
+        self.assertTrue(summary['written'])
+        self.assertEqual([paper['title'] for paper in open_papers(self.output)[1]], ['A1'])
+        cache_dir = os.path.join(self.root, 'out', combine.CACHE_DIRNAME)
+        self.assertFalse(os.path.exists(os.path.join(cache_dir, 'b.jsonl')))
+
+        self.assertEqual(self.run_combine(sources[:1], force=True)['converted'], ['A'])
+
+    def test_registry_reproduces_combined_papers(self):
+        """Test the registered sources rebuild the committed combined dataset."""
+        with redirect_stdout(io.StringIO()):
+            summary = combine.combine(self.output)
+        with open(os.path.join(REPO_ROOT, 'docs', 'data', 'papers-combined.json'), encoding='utf-8') as f:
+            committed = json.load(f)
+        rebuilt = list(open_papers(self.output)[1])
+        for paper in rebuilt:
+            del paper['author_ids'], paper['institution_ids']
+        self.assertEqual(rebuilt, committed['papers'])
+        self.assertEqual(summary['statistics']['conferences'], committed['conferences'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Entity Resolution Tests
+
+Tests for author and institution resolution to canonical IDs.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_entities.py
+"""
+
+import os
+import random
+import string
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conferences.common import entities
+
+FRIB_VARIANTS = [
+    'Facility for Rare Isotope Beams, Michigan State University, East Lansing, MI, USA',
+    '1Facility for Rare Isotope Beams, East Lansing, MI, USA',
+    'The Facility for Rare Isotope Beams (FRIB) at Michigan',
+    'FACILITY FOR RARE ISOTOPE BEAM*',
+    'Facility for Rare Isotope Beams, East Lansing, MI, USA',
+]
+
+
+class TestEntityResolution(unittest.TestCase):
+    """Test cases for author and institution resolution."""
+
+    def test_institution_variants_merge(self):
+        """Test markers, addresses, acronyms and truncations resolve to one institution."""
+        table = entities.resolve_institutions(FRIB_VARIANTS + [
+            'Argonne National Laboratory, Lemont, IL, USA',
+            '3also at Argonne National Laboratory, Lemont, IL, USA',
+            'Brookhaven National Laboratory, Upton, NY, USA',
+            '1',
+        ])
+        self.assertEqual(len({table.id_of(name) for name in FRIB_VARIANTS}), 1)
+        self.assertEqual(table.name_of(FRIB_VARIANTS[2]), 'Facility for Rare Isotope Beams')
+        self.assertEqual(table.name_of('3also at Argonne National Laboratory, Lemont, IL, USA'),
+                         'Argonne National Laboratory')
+        self.assertNotEqual(table.id_of('Brookhaven National Laboratory, Upton, NY, USA'),
+                            table.id_of('Argonne National Laboratory, Lemont, IL, USA'))
+        self.assertIsNone(table.id_of('1'))
+        self.assertEqual(len(table), 3)
+
+    def test_author_variants(self):
+        """Test author forms merge unless an initial is ambiguous."""
+        table = entities.resolve_authors([
+            'Jean-Pierre Dupont', 'J.-P. Dupont', 'Dupont, Jean-Pierre', 'A. Müller', 'Andreas Muller',
+            'H. Alamprese†', 'Ming Liu', 'Mei Liu', 'M. Liu', 'K. Smith-Jones', 'Karl Smith-Jones',
+        ])
+        self.assertEqual(table.ids_of(['Jean-Pierre Dupont', 'J.-P. Dupont', 'Dupont, Jean-Pierre']),
+                         [table.id_of('Jean-Pierre Dupont')])
+        self.assertEqual(table.name_of('A. Müller'), 'Andreas Muller')
+        self.assertEqual(table.name_of('H. Alamprese†'), 'H. Alamprese')
+        self.assertEqual(table.name_of('K. Smith-Jones'), 'Karl Smith-Jones')
+        self.assertEqual(len({table.id_of(name) for name in ('Ming Liu', 'Mei Liu', 'M. Liu')}), 3)
+
+    def test_ids_are_stable(self):
+        """Test IDs depend only on the resolved name, not on input order."""
+        forward = entities.resolve_institutions(FRIB_VARIANTS)
+        backward = entities.resolve_institutions(reversed(FRIB_VARIANTS))
+        self.assertEqual(forward.to_dict(), backward.to_dict())
+        self.assertTrue(forward.id_of(FRIB_VARIANTS[0]).startswith('inst-'))
+
+    def test_scales_without_false_merges(self):
+        """Test thousands of distinct institutions with variants resolve exactly."""
+        rng = random.Random(0)
+        words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10))).title()
+                 for _ in range(2000)]
+        bases = {' '.join(rng.sample(words, 4)) for _ in range(2000)}
+        names = [variant for base in bases for variant in
+                 (base, f'1{base}, City, Country', f'The {base} (ABC)', base[:-1])]
+        table = entities.resolve_institutions(names)
+        self.assertEqual(len(table), len(bases))
+
+    def test_minhash_estimates_similarity(self):
+        """Test identical sets share signatures and disjoint sets almost never do."""
+        signatures = entities.minhash_signatures([{'abc', 'bcd'}, {'bcd', 'abc'}, {'xyz', 'wvu'}])
+        self.assertTrue((signatures[0] == signatures[1]).all())
+        self.assertLess((signatures[0] == signatures[2]).mean(), 0.1)
+        self.assertEqual(entities.lsh_candidates(signatures), {(0, 1)})
+
+
+if __name__ == '__main__':
+    unittest.main()
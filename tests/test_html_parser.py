@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - HTML Parsing Tests
+
+Tests for the single-pass field extractor and regex link scanner, checked
+against the original BeautifulSoup implementation on saved Indico pages.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_html_parser.py
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common import html_parser
+from conferences.common.html_parser import SimpleSelector, SinglePassExtractor
+from benchmark_parsing import (BASE_URL, fast_parse_fields, fixture_pages,
+                               legacy_find_links, legacy_parse_fields, list_page)
+
+BACKENDS = ['html.parser'] + (['lxml'] if html_parser.lxml_html is not None else [])
+
+
+def attrs(**values):
+    """Attribute getter over keyword arguments."""
+    return values.get
+
+
+class TestSimpleSelector(unittest.TestCase):
+    """Test cases for SimpleSelector."""
+
+    def test_class_token(self):
+        """Test ``tag.class`` matches whole class tokens only."""
+        selector = SimpleSelector('div.abstract')
+        self.assertEqual(selector.tag, 'div')
+        self.assertTrue(selector.matches(attrs(**{'class': 'box abstract'})))
+        self.assertFalse(selector.matches(attrs(**{'class': 'abstract-text'})))
+        self.assertFalse(selector.matches(attrs()))
+
+    def test_substring_and_case(self):
+        """Test ``[attr*=v]`` with and without the ``i`` flag."""
+        self.assertTrue(SimpleSelector('div[class*="time"]').matches(
+            attrs(**{'class': 'start-time'})))
+        self.assertFalse(SimpleSelector('span[class*="author"]').matches(
+            attrs(**{'class': 'Author'})))
+        self.assertTrue(SimpleSelector('span[class*="author" i]').matches(
+            attrs(**{'class': 'Author'})))
+
+    def test_unsupported_selector(self):
+        """Test descendant combinators are rejected."""
+        with self.assertRaises(ValueError):
+            SimpleSelector('div p')
+
+
+class TestSinglePassExtractor(unittest.TestCase):
+    """Test cases for SinglePassExtractor."""
+
+    HTML = """<html><head><title>Page</title></head><body>
+    <div class="x-description">second choice</div>
+    <div class="abstract">first choice</div>
+    <span class="author">A. One</span><span class="author">B. Two</span>
+    </body></html>"""
+
+    def test_priority_beats_document_order(self):
+        """Test a higher-priority selector wins over an earlier element."""
+        for backend in BACKENDS:
+            extractor = SinglePassExtractor(
+                first_fields={'title': ['h1', 'title'],
+                              'abstract': ['div.abstract', 'div[class*="description"]']},
+                list_fields={'authors': ['span.author', 'a']},
+                backend=backend,
+            )
+            fields = extractor.extract(self.HTML)
+            self.assertEqual(fields['title'], 'Page')
+            self.assertEqual(fields['abstract'], 'first choice')
+            self.assertEqual(fields['authors'], [['A. One', 'B. Two'], []])
+
+    def test_missing_fields_are_empty(self):
+        """Test unmatched fields come back as empty strings."""
+        for backend in BACKENDS:
+            extractor = SinglePassExtractor(first_fields={'category': ['span.category']},
+                                            backend=backend)
+            self.assertEqual(extractor.extract(self.HTML), {'category': ''})
+
+
+class TestFixtureEquivalence(unittest.TestCase):
+    """Test the fast path reproduces the original extraction exactly."""
+
+    def test_contribution_pages(self):
+        """Test every fixture page parses identically on every backend."""
+        pages = fixture_pages()
+        self.assertGreaterEqual(len(pages), 3)
+        for backend in BACKENDS:
+            crawler = ImprovedIPAC2025Crawler(parser_backend=backend)
+            for name, html in pages:
+                with self.subTest(backend=backend, page=name):
+                    expected = legacy_parse_fields(html)
+                    self.assertTrue(expected['title'] and expected['authors'])
+                    self.assertEqual(fast_parse_fields(crawler, html), expected)
+
+    def test_contribution_links(self):
+        """Test the regex link scan finds the same links as the tree walk."""
+        html = list_page()
+        crawler = ImprovedIPAC2025Crawler()
+        links = crawler.find_contribution_links(html)
+        self.assertEqual(set(links), legacy_find_links(html, BASE_URL))
+        self.assertEqual(len(links), len(set(links)))
+
+
+if __name__ == '__main__':
+    unittest.main()
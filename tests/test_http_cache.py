@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - HTTP Cache Tests
+
+Unit tests for the on-disk response cache and its use by the IPAC2025
+crawler against the local Indico stand-in server.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_http_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common.http_cache import HTTPCache
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+
+class FakeClock:
+    """Wall clock under test control."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestHTTPCache(unittest.TestCase):
+    """Test cases for HTTPCache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_store_and_lookup(self):
+        """Test a stored body round-trips with its validators."""
+        cache = HTTPCache(self.tmpdir.name, clock=self.clock)
+        cache.store('http://x/1', 'héllo', {'ETag': '"abc"', 'Last-Modified': 'Mon'})
+        entry = cache.lookup('http://x/1')
+        self.assertEqual(cache.read_body(entry), 'héllo')
+        self.assertEqual(HTTPCache.conditional_headers(entry),
+                         {'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon'})
+        self.assertIsNone(cache.lookup('http://x/2'))
+
+    def test_identical_bodies_share_storage(self):
+        """Test content addressing stores duplicate bodies once."""
+        cache = HTTPCache(self.tmpdir.name, clock=self.clock)
+        cache.store('http://x/1', 'same page')
+        cache.store('http://x/2', 'same page')
+        self.assertEqual(cache.total_bytes, len('same page'))
+
+    def test_ttl(self):
+        """Test entries are fresh within the TTL and stale afterwards."""
+        cache = HTTPCache(self.tmpdir.name, ttl=60, clock=self.clock)
+        entry = cache.store('http://x/1', 'body')
+        self.assertTrue(cache.is_fresh(entry))
+        self.clock.now += 61
+        self.assertFalse(cache.is_fresh(entry))
+        cache.read_body(entry, revalidated=True)
+        self.assertTrue(cache.is_fresh(cache.lookup('http://x/1')))
+        self.assertFalse(HTTPCache(self.tmpdir.name).is_fresh(entry))
+
+    def test_eviction_drops_least_recently_used(self):
+        """Test the size bound evicts the least recently used entries."""
+        cache = HTTPCache(self.tmpdir.name, max_bytes=25, clock=self.clock)
+        cache.store('http://x/1', 'a' * 10)
+        self.clock.now += 1
+        cache.store('http://x/2', 'b' * 10)
+        self.clock.now += 1
+        cache.read_body(cache.lookup('http://x/1'))
+        self.clock.now += 1
+        cache.store('http://x/3', 'c' * 10)
+
+        self.assertIsNotNone(cache.lookup('http://x/1'))
+        self.assertIsNone(cache.lookup('http://x/2'))
+        self.assertIsNotNone(cache.lookup('http://x/3'))
+        self.assertLessEqual(cache.total_bytes, 25)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+    def test_eviction_frees_down_to_low_water_mark(self):
+        """Test eviction makes room for further stores without rescanning."""
+        cache = HTTPCache(self.tmpdir.name, max_bytes=100, clock=self.clock)
+        for i in range(11):
+            self.clock.now += 1
+            cache.store(f'http://x/{i}', chr(ord('a') + i) * 10)
+
+        self.assertEqual(cache.stats['evictions'], 2)
+        self.assertEqual(cache.total_bytes, 90)
+        self.assertIsNone(cache.lookup('http://x/1'))
+        self.assertIsNotNone(cache.lookup('http://x/2'))
+
+        with mock.patch('pathlib.Path.glob', side_effect=AssertionError('rescan')):
+            cache.store('http://x/11', 'z' * 10)
+            cache.store('http://x/12', 'y' * 10)
+        self.assertEqual(cache.stats['evictions'], 4)
+
+    def test_reopen_restores_index_and_skips_temp_files(self):
+        """Test a reopened cache keeps LRU order and ignores interrupted writes."""
+        cache = HTTPCache(self.tmpdir.name, max_bytes=25, clock=self.clock)
+        cache.store('http://x/1', 'a' * 10)
+        self.clock.now += 1
+        cache.store('http://x/2', 'b' * 10)
+        self.clock.now += 1
+        cache.read_body(cache.lookup('http://x/1'))
+        leftover = os.path.join(self.tmpdir.name, 'objects', 'ab', '.tmp-interrupted')
+        os.makedirs(os.path.dirname(leftover), exist_ok=True)
+        with open(leftover, 'w') as f:
+            f.write('t' * 100)
+
+        cache = HTTPCache(self.tmpdir.name, max_bytes=25, clock=self.clock)
+        self.assertEqual(cache.total_bytes, 20)
+        self.clock.now += 1
+        cache.store('http://x/3', 'c' * 10)
+        self.assertIsNotNone(cache.lookup('http://x/1'))
+        self.assertIsNone(cache.lookup('http://x/2'))
+
+
+class TestCachedCrawl(unittest.TestCase):
+    """Test cases for crawling through the HTTP cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.server = IndicoStubServer(paper_count=8).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def make_crawler(self, **cache_options):
+        return ImprovedIPAC2025Crawler(
+            base_url=self.server.base_url,
+            workers=4,
+            rate_limiter=RateLimiter(requests_per_second=10000),
+            cache=HTTPCache(self.tmpdir.name, **cache_options),
+        )
+
+    def test_recrawl_revalidates_with_304(self):
+        """Test a second crawl gets 304s and re-parses changed pages only."""
+        first = self.make_crawler().crawl_conference()
+        self.assertEqual(self.server.not_modified, [])
+
+        self.server.edit(1003)
+        crawler = self.make_crawler()
+        second = crawler.crawl_conference()
+
+        self.assertEqual(len(self.server.not_modified), 8)
+        self.assertEqual(crawler.cache.stats['revalidated'], 8)
+        self.assertEqual(crawler.cache.stats['stores'], 1)
+        self.assertEqual(second[3]['title'], 'Synthetic Paper 1003 (rev 1)')
+        self.assertEqual(second[:3], first[:3])
+
+    def test_fresh_entries_skip_network(self):
+        """Test entries within the TTL are served without any request."""
+        self.make_crawler(ttl=3600).crawl_conference()
+        request_count = len(self.server.requests)
+
+        papers = self.make_crawler(ttl=3600).crawl_conference()
+
+        self.assertEqual(len(papers), 8)
+        self.assertEqual(len(self.server.requests), request_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Figure Image Pipeline Tests
+
+Tests for deduplication, WebP variants and the manifest of the web figure
+image pipeline.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_images.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.common import images
+
+Image = images.Image
+
+
+def make_figure(width, height, seed=0):
+    """A figure with some structure: horizontal bands and a diagonal."""
+    image = Image.new('RGB', (width, height), 'white')
+    pixels = image.load()
+    for x in range(width):
+        for y in range(height):
+            band = (y * 8 // height + seed) % 3
+            pixels[x, y] = (60 * band, 255 - 80 * band, (x * 255 // width + 40 * seed) % 256)
+    return image
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestImagePipeline(unittest.TestCase):
+    """Test cases for the web figure image pipeline."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmpdir.name, 'figures')
+        self.output = os.path.join(self.tmpdir.name, 'web')
+        os.makedirs(self.source)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _save(self, name, image, **kwargs):
+        image.save(os.path.join(self.source, name), **kwargs)
+
+    def test_dhash_stable_under_rescaling(self):
+        figure = make_figure(400, 300)
+        distance = bin(images.dhash(figure) ^ images.dhash(figure.resize((200, 150)))).count('1')
+        self.assertLessEqual(distance, images.DHASH_THRESHOLD)
+        other = bin(images.dhash(figure) ^ images.dhash(make_figure(400, 300, seed=1))).count('1')
+        self.assertGreater(other, images.DHASH_THRESHOLD)
+
+    def test_build_deduplicates_and_maps_papers(self):
+        logo = make_figure(400, 140, seed=2)
+        self._save('001_FIRST_page1_img1.png', make_figure(1200, 800))
+        self._save('001_FIRST_page1_img2.png', logo)
+        self._save('002_SECOND_page1_img1.png', logo)                           # identical file
+        self._save('002_SECOND_page2_img1.png', logo, compress_level=1)         # same pixels, other bytes
+        self._save('002_SECOND_page3_img1.png', logo.resize((200, 70)))         # rescaled copy
+        self._save('002_SECOND_page3_img2.png', make_figure(300, 200, seed=1))
+
+        manifest = images.build_images(self.source, self.output, workers=0)
+        self.assertEqual((manifest['source_count'], manifest['image_count']), (6, 3))
+        self.assertEqual(sorted(manifest['papers']), ['1', '2'])
+
+        second = manifest['papers']['2']
+        self.assertEqual([(f['page'], f['index']) for f in second], [(1, 1), (2, 1), (3, 1), (3, 2)])
+        logo_id = manifest['papers']['1'][1]['image']
+        self.assertEqual({f['image'] for f in second[:3]}, {logo_id})
+        # The largest copy represents a group
+        self.assertEqual(manifest['images'][logo_id]['width'], 400)
+        self.assertEqual(len(manifest['images'][logo_id]['sources']), 4)
+
+        large = manifest['images'][manifest['papers']['1'][0]['image']]
+        self.assertEqual(sorted(large['variants']), ['full', 'medium', 'small', 'thumb'])
+        with Image.open(os.path.join(self.output, large['variants']['thumb'])) as thumb:
+            self.assertEqual((thumb.format, thumb.size), ('WEBP', (160, 107)))
+        # No upscaling: a 300 px image has no 480/960 px variants
+        small = manifest['images'][second[3]['image']]
+        self.assertEqual(sorted(small['variants']), ['full', 'thumb'])
+
+        with open(os.path.join(self.output, 'manifest.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), manifest)
+
+    def test_rebuild_reuses_outputs_and_prunes(self):
+        self._save('001_A_page1_img1.png', make_figure(500, 300))
+        self._save('001_A_page1_img2.png', make_figure(500, 300, seed=1))
+        manifest = images.build_images(self.source, self.output, workers=0)
+        removed_id = manifest['papers']['1'][1]['image']
+        thumb = os.path.join(self.output, manifest['images'][manifest['papers']['1'][0]['image']]['variants']['thumb'])
+        mtime = os.stat(thumb).st_mtime_ns
+
+        os.remove(os.path.join(self.source, '001_A_page1_img2.png'))
+        manifest = images.build_images(self.source, self.output, workers=0)
+        self.assertEqual(os.stat(thumb).st_mtime_ns, mtime)
+        self.assertEqual(manifest['image_count'], 1)
+        self.assertFalse([name for name in os.listdir(self.output) if name.startswith(removed_id)])
+
+    def test_parallel_matches_in_process(self):
+        for i in range(3):
+            self._save(f'00{i}_P_page1_img1.png', make_figure(200, 100, seed=i))
+        parallel = images.build_images(self.source, self.output, workers=2)
+        self.assertEqual(parallel, images.build_images(self.source, self.output, workers=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Run Metrics Tests
+
+Tests for the metrics registry: counters, timers, gauges, span hooks and the
+Prometheus text and JSON exports.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_metrics.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conferences.common.metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the metrics registry."""
+
+    def test_counters_by_label(self):
+        metrics = Metrics()
+        metrics.inc('http_requests_total', status=200)
+        metrics.inc('http_requests_total', 2, status=200)
+        metrics.inc('http_requests_total', status=429)
+        self.assertEqual(metrics.counter('http_requests_total', status=200), 3)
+        self.assertEqual(metrics.counter('http_requests_total', status='429'), 1)
+        self.assertEqual(metrics.counter('http_requests_total', status=500), 0)
+
+    def test_counters_are_thread_safe(self):
+        metrics = Metrics()
+
+        def work():
+            for _ in range(1000):
+                metrics.inc('events_total')
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(metrics.counter('events_total'), 8000)
+
+    def test_timer_summary_and_gauge_max(self):
+        metrics = Metrics()
+        for ms in range(1, 101):
+            metrics.observe('fetch_seconds', ms / 1000, status=200)
+        metrics.set_gauge('queue_depth', 7)
+        metrics.set_gauge('queue_depth', 2)
+
+        report = metrics.to_dict()
+        summary = report['timers']['fetch_seconds'][0]
+        self.assertEqual(summary['labels'], {'status': '200'})
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['sum'], 5.05)
+        self.assertEqual((summary['p50'], summary['p99'], summary['max']), (0.05, 0.099, 0.1))
+        self.assertEqual(report['gauges']['queue_depth'], [{'labels': {}, 'value': 2, 'max': 7}])
+
+    def test_span_reports_to_hooks(self):
+        metrics = Metrics()
+        events = []
+        metrics.add_hook(events.append)
+        with metrics.span('stage_seconds', stage='fetch'):
+            pass
+        with self.assertRaises(ValueError):
+            with metrics.span('stage_seconds', stage='save'):
+                raise ValueError('disk full')
+
+        self.assertEqual([(e['labels'], e['error']) for e in events],
+                         [({'stage': 'fetch'}, None), ({'stage': 'save'}, 'ValueError')])
+        self.assertEqual(len(metrics.to_dict()['timers']['stage_seconds']), 2)
+
+    def test_prometheus_export(self):
+        metrics = Metrics(prefix='srf')
+        metrics.inc('bytes_downloaded_total', 512)
+        metrics.observe('parse_seconds', 0.25, group='fields')
+        metrics.set_gauge('fetch_queue_depth', 3)
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE srf_bytes_downloaded_total counter\nsrf_bytes_downloaded_total 512\n', text)
+        self.assertIn('srf_parse_seconds{group="fields",quantile="0.99"} 0.250000\n', text)
+        self.assertIn('srf_parse_seconds_count{group="fields"} 1\n', text)
+        self.assertIn('srf_fetch_queue_depth_max 3\n', text)
+
+    def test_write_chooses_format_by_extension(self):
+        metrics = Metrics()
+        metrics.inc('papers_total', outcome='success')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = os.path.join(tmpdir, 'metrics.json')
+            prom_path = os.path.join(tmpdir, 'metrics.prom')
+            metrics.write(json_path)
+            metrics.write(prom_path)
+            with open(json_path, encoding='utf-8') as f:
+                report = json.load(f)
+            with open(prom_path, encoding='utf-8') as f:
+                text = f.read()
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['metrics.json', 'metrics.prom'])
+        self.assertEqual(report['counters']['papers_total'],
+                         [{'labels': {'outcome': 'success'}, 'value': 1}])
+        self.assertIn('srf_papers_total{outcome="success"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
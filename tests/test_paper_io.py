@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Paper Dataset I/O Tests
+
+Tests for the streaming JSON Lines writer and the readers shared by the
+crawler, the analysis tools and the combine step.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_paper_io.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from conferences.IPAC2025.analyze_real_data import analyze_papers
+from conferences.IPAC2025.improved_real_crawler import ImprovedIPAC2025Crawler
+from conferences.common import indico
+from conferences.common.paper_io import (JsonlPaperWriter, iter_papers, open_papers,
+                                         write_json_document)
+from conferences.common.rate_limit import RateLimiter
+from indico_stub import IndicoStubServer
+
+PAPERS = [
+    {'title': 'Nb3Sn cavities', 'authors': ['A. One'], 'abstract': 'Coating', 'type': 'Poster'},
+    {'title': 'Field emission', 'authors': [], 'abstract': ''},
+]
+
+
+class TestPaperIO(unittest.TestCase):
+    """Test cases for the paper dataset readers and writers."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_jsonl_round_trip(self):
+        """Test header, papers and statistics trailer read back."""
+        path = self.path('papers.jsonl')
+        with JsonlPaperWriter(path, {'conference': 'IPAC2025'}) as writer:
+            for paper in PAPERS:
+                writer.write(paper)
+
+        metadata, papers = open_papers(path)
+        self.assertEqual(list(papers), PAPERS)
+        self.assertEqual(metadata['conference'], 'IPAC2025')
+        self.assertEqual(metadata['statistics']['total_papers'], 2)
+        self.assertEqual(metadata['statistics']['papers_with_authors'], 1)
+
+    def test_interrupted_jsonl_is_readable(self):
+        """Test a file without trailer and with a torn line still streams."""
+        path = self.path('papers.jsonl')
+        writer = JsonlPaperWriter(path)
+        writer.write(PAPERS[0])
+        writer._file.write('{"title": "torn')
+        writer._file.close()
+
+        metadata, papers = open_papers(path)
+        self.assertEqual(list(papers), [PAPERS[0]])
+        self.assertNotIn('statistics', metadata)
+
+    def test_legacy_json_documents(self):
+        """Test the original document layouts are still readable."""
+        document, bare = self.path('papers.json'), self.path('list.json')
+        with open(document, 'w', encoding='utf-8') as f:
+            json.dump({'source': 'x', 'papers': PAPERS}, f)
+        with open(bare, 'w', encoding='utf-8') as f:
+            json.dump(PAPERS, f)
+
+        metadata, papers = open_papers(document)
+        self.assertEqual((metadata, list(papers)), ({'source': 'x'}, PAPERS))
+        self.assertEqual(list(iter_papers(bare)), PAPERS)
+
+    def test_streamed_json_document(self):
+        """Test the streaming JSON writer emits a valid document."""
+        path = self.path('combined.json')
+        write_json_document(path, {'extraction_time': 't'}, iter(PAPERS),
+                            trailer=lambda: {'total_papers': 2})
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data, {'extraction_time': 't', 'papers': PAPERS, 'total_papers': 2})
+
+        write_json_document(path, {}, [])
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'papers': []})
+
+    def test_analyze_jsonl(self):
+        """Test the analysis report runs on a JSON Lines dataset."""
+        path = self.path('ipac2025_real_papers.jsonl')
+        ImprovedIPAC2025Crawler().save_papers(PAPERS, path)
+        self.assertTrue(analyze_papers(path))
+
+
+class TestStreamingCrawl(unittest.TestCase):
+    """Test cases for crawls written straight to JSON Lines."""
+
+    def setUp(self):
+        self.server = IndicoStubServer(paper_count=12).start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_writer_receives_papers_in_order(self):
+        """Test concurrent crawls stream papers in contribution order."""
+        self.server.inject(self.server.contribution_path(1003), 404)
+        crawler = ImprovedIPAC2025Crawler(
+            base_url=self.server.base_url, workers=4,
+            rate_limiter=RateLimiter(requests_per_second=10000, base_delay=0.01))
+        path = os.path.join(self.tmpdir.name, 'papers.jsonl')
+
+        with crawler.open_writer(path) as writer:
+            counts = crawler.crawl_conference(writer=writer)
+
+        self.assertEqual(counts, {'links': 12, 'extracted': 11, 'failed': 1})
+        papers = crawler.load_papers(path)
+        self.assertEqual([p['contribution_id'] for p in papers],
+                         [str(cid) for cid in self.server.contribution_ids if cid != 1003])
+        metadata, _ = open_papers(path)
+        self.assertEqual(metadata['statistics']['total_papers'], 11)
+
+    def test_written_papers_are_not_retained(self):
+        """Test writer mode drops each paper once it is written."""
+        class Paper(dict):
+            """Paper record that can be weakly referenced."""
+
+        class TrackingWriter(JsonlPaperWriter):
+            """Writer recording how many written papers are still alive."""
+            refs, max_alive = [], 0
+
+            def write(self, paper):
+                super().write(paper)
+                alive = sum(ref() is not None for ref in self.refs)
+                TrackingWriter.max_alive = max(self.max_alive, alive)
+                self.refs.append(weakref.ref(paper))
+
+        parse = indico.parse_contribution_html
+        crawler = ImprovedIPAC2025Crawler(
+            base_url=self.server.base_url,
+            rate_limiter=RateLimiter(requests_per_second=10000, base_delay=0.01))
+        path = os.path.join(self.tmpdir.name, 'papers.jsonl')
+
+        with mock.patch.object(indico, 'parse_contribution_html',
+                               lambda *args, **kwargs: Paper(parse(*args, **kwargs))), \
+                TrackingWriter(path, crawler.output_metadata()) as writer:
+            counts = crawler.crawl_conference(writer=writer)
+
+        self.assertEqual(len(TrackingWriter.refs), 12)
+        # At most the paper written just before is still referenced
+        self.assertLessEqual(TrackingWriter.max_alive, 1)
+        self.assertEqual(counts['extracted'], 12)
+        self.assertTrue(all(ref() is None for ref in TrackingWriter.refs))
+
+
+if __name__ == '__main__':
+    unittest.main()
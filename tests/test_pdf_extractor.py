@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - PDF Extractor Tests
+
+Tests for the HIAT2025 proceedings PDF extractor, on JACoW-style PDFs
+generated with PyMuPDF.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_pdf_extractor.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.HIAT2025 import hiat2025_extractor, pdf_extractor
+from conferences.HIAT2025.hiat2025_extractor import HIAT2025Extractor
+from conferences.common.paper_io import open_papers
+
+pymupdf = pdf_extractor.pymupdf
+
+
+def make_proceedings_pdf(path, title='STATUS OF THE LINAC*'):
+    """Write a two-page JACoW-like paper: bold headings, one figure, one table, references."""
+    doc = pymupdf.open()
+    page = doc.new_page()
+    y = 60
+
+    def line(text, font='helv', size=9):
+        nonlocal y
+        page.insert_text((50, y), text, fontname=font, fontsize=size)
+        y += size + 4
+
+    line(title, 'hebo', 14)
+    line('A. Author*, B.-C. Second, Institute of Modern Physics, Lanzhou, China')
+    line('Abstract', 'hebo', 10)
+    line('The linac delivers high-inten-')
+    line('sity beams.')
+    line('INTRODUCTION', 'hebo', 10)
+    line('The facility is a new accelerator.')
+    line('Table 1: Main parameters')
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 40, 30), False)
+    pixmap.clear_with(200)
+    page.insert_image(pymupdf.Rect(300, 300, 340, 330), pixmap=pixmap)
+
+    page = doc.new_page()
+    y = 60
+    line('CONCLUSION', 'hebo', 10)
+    line('Commissioning is complete.')
+    line('REFERENCES', 'hebo', 10)
+    line('[1] A. Author et al., "First beam",')
+    line('in Proc. IPAC23, 2023.')
+    line('[2] B. Second, Phys. Rev. 1 (2020).')
+    doc.save(path)
+    doc.close()
+
+
+@unittest.skipIf(pymupdf is None, "PyMuPDF is not installed")
+class TestPdfExtractor(unittest.TestCase):
+    """Test cases for the proceedings PDF extractor."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_dir = os.path.join(self.tmpdir.name, 'pdfs')
+        os.makedirs(self.pdf_dir)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _pdf(self, name, **kwargs):
+        path = os.path.join(self.pdf_dir, name)
+        make_proceedings_pdf(path, **kwargs)
+        return path
+
+    def test_extract_pdf_fields(self):
+        paper = pdf_extractor.extract_pdf(self._pdf('007_MOP01.pdf'))
+
+        self.assertEqual(paper['paper_number'], 7)
+        self.assertEqual(paper['filename'], '007_MOP01.pdf')
+        self.assertEqual(paper['title'], 'STATUS OF THE LINAC*')
+        self.assertEqual(paper['authors'], ['A. Author', 'B.-C. Second'])
+        self.assertEqual(paper['affiliations'], ['Institute of Modern Physics, Lanzhou, China'])
+        self.assertEqual(paper['abstract'], 'The linac delivers high-intensity beams.')
+        self.assertEqual(paper['page_count'], 2)
+        self.assertEqual(list(paper['sections']), ['INTRODUCTION', 'CONCLUSION'])
+        self.assertIn('new accelerator', paper['sections']['INTRODUCTION'])
+        self.assertEqual(paper['tables'], ['Table 1: Main parameters'])
+        self.assertEqual(paper['references'], [
+            '[1] A. Author et al., "First beam", in Proc. IPAC23, 2023.',
+            '[2] B. Second, Phys. Rev. 1 (2020).',
+        ])
+        self.assertEqual((paper['figure_count'], paper['table_count'], paper['reference_count']), (1, 1, 2))
+        figure = paper['figures'][0]
+        self.assertEqual(figure['filename'], '007_MOP01_page1_img1.png')
+        self.assertEqual((figure['page'], figure['width'], figure['height']), (1, 40, 30))
+        self.assertGreater(paper['file_size_kb'], 0)
+
+    def test_images_saved(self):
+        image_dir = os.path.join(self.tmpdir.name, 'images')
+        paper = pdf_extractor.extract_pdf(self._pdf('001.pdf'), image_dir=image_dir)
+        self.assertEqual(os.listdir(image_dir), [paper['figures'][0]['filename']])
+
+    def test_split_header(self):
+        authors, affiliations = pdf_extractor.split_header(
+            'J. Wei1, H. Ao and Y. Zhang, 1FRIB, Michigan State University, East Lansing, USA, '
+            'M. Liu, IHEP, Beijing, China')
+        self.assertEqual(authors, ['J. Wei', 'H. Ao', 'Y. Zhang', 'M. Liu'])
+        self.assertEqual(affiliations, ['FRIB, Michigan State University, East Lansing, USA',
+                                        'IHEP, Beijing, China'])
+
+    def test_directory_parallel_in_order_skips_broken(self):
+        for number in (3, 1, 2):
+            self._pdf(f'{number:03d}_paper.pdf', title=f'PAPER NUMBER {number}')
+        with open(os.path.join(self.pdf_dir, '004_broken.pdf'), 'wb') as f:
+            f.write(b'not a pdf')
+
+        papers = list(pdf_extractor.extract_directory(self.pdf_dir, workers=2))
+        self.assertEqual([p['paper_number'] for p in papers], [1, 2, 3])
+        self.assertEqual(papers[1]['title'], 'PAPER NUMBER 2')
+        self.assertEqual(papers, list(pdf_extractor.extract_directory(self.pdf_dir, workers=0)))
+
+    def test_extractor_saves_jsonl(self):
+        self._pdf('001_a.pdf')
+        self._pdf('002_b.pdf')
+        output = os.path.join(self.tmpdir.name, 'papers.jsonl')
+        extractor = HIAT2025Extractor(self.pdf_dir, workers=0)
+        extractor.save_data(extractor.iter_papers(), output)
+
+        metadata, papers = open_papers(output)
+        self.assertEqual(metadata['conference'], 'HIAT2025')
+        self.assertEqual([p['filename'] for p in papers], ['001_a.pdf', '002_b.pdf'])
+
+        output = os.path.join(self.tmpdir.name, 'papers.json')
+        extractor.save_data(extractor.extract_papers(), output)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['total_papers'], 2)
+
+    def test_main_options(self):
+        self._pdf('001_a.pdf')
+        output = os.path.join(self.tmpdir.name, 'papers.jsonl')
+        with redirect_stdout(io.StringIO()):
+            hiat2025_extractor.main([self.pdf_dir, output, '--workers', '0', '--no-cache'])
+        self.assertEqual(len(list(open_papers(output)[1])), 1)
+
+        for argv in ([self.pdf_dir, '--workers'], [self.pdf_dir, '--workers', 'all'],
+                     [self.pdf_dir, '--cache', 'c', '--no-cache'],
+                     [self.pdf_dir, '--web-images', 'web'], ['--help']):
+            with self.assertRaises(SystemExit), redirect_stdout(io.StringIO()), \
+                    mock.patch.object(sys, 'stderr', io.StringIO()):
+                hiat2025_extractor.main(argv)
+
+
+@unittest.skipIf(pymupdf is None, "PyMuPDF is not installed")
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for the per-stage extraction cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        self.pdf = os.path.join(self.tmpdir.name, '005_paper.pdf')
+        make_proceedings_pdf(self.pdf)
+        self.calls = []
+        run_stages = pdf_extractor._run_stages
+
+        def recording_run_stages(path, stages, image_dir):
+            self.calls.append(sorted(stages))
+            return run_stages(path, stages, image_dir)
+
+        patcher = mock.patch.object(pdf_extractor, '_run_stages', recording_run_stages)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_rerun_served_from_cache(self):
+        first = pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)
+        second = pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [['figures', 'references', 'text']])
+
+    def test_content_keyed(self):
+        pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)
+        copy = os.path.join(self.tmpdir.name, '006_copy.pdf')
+        with open(self.pdf, 'rb') as src, open(copy, 'wb') as dst:
+            dst.write(src.read())
+        paper = pdf_extractor.extract_pdf(copy, cache=self.cache_dir)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual((paper['paper_number'], paper['filename']), (6, '006_copy.pdf'))
+        self.assertEqual(paper['figures'][0]['filename'], '006_copy_page1_img1.png')
+
+        make_proceedings_pdf(self.pdf, title='A CHANGED TITLE')
+        self.assertEqual(pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)['title'], 'A CHANGED TITLE')
+        self.assertEqual(len(self.calls), 2)
+
+    def test_version_bump_invalidates_one_stage(self):
+        first = pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)
+        versions = dict(pdf_extractor.STAGE_VERSIONS, references=2)
+        with mock.patch.object(pdf_extractor, 'STAGE_VERSIONS', versions):
+            self.assertEqual(pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir), first)
+            pdf_extractor.extract_pdf(self.pdf, cache=self.cache_dir)
+        self.assertEqual(self.calls, [['figures', 'references', 'text'], ['references']])
+
+    def test_missing_images_rerun_figures(self):
+        image_dir = os.path.join(self.tmpdir.name, 'images')
+        pdf_extractor.extract_pdf(self.pdf, image_dir=image_dir, cache=self.cache_dir)
+        pdf_extractor.extract_pdf(self.pdf, image_dir=image_dir, cache=self.cache_dir)
+        for name in os.listdir(image_dir):
+            os.remove(os.path.join(image_dir, name))
+        pdf_extractor.extract_pdf(self.pdf, image_dir=image_dir, cache=self.cache_dir)
+        self.assertEqual(self.calls, [['figures', 'references', 'text'], ['figures']])
+        self.assertEqual(len(os.listdir(image_dir)), 1)
+
+    def test_directory_with_cache(self):
+        pdf_dir = os.path.dirname(self.pdf)
+        first = list(pdf_extractor.extract_directory(pdf_dir, workers=2, cache_dir=self.cache_dir))
+        self.calls.clear()
+        self.assertEqual(list(pdf_extractor.extract_directory(pdf_dir, workers=0, cache_dir=self.cache_dir)),
+                         first)
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
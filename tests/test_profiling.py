@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Command Profiling Tests
+
+Tests for the cProfile and stack-sampling modes of ``profile_call``, the
+tracemalloc report and the CLI's ``--profile`` option.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_profiling.py
+"""
+
+import io
+import json
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import srf_conference_insights_cli as cli
+from conferences.common import profiling
+
+
+def busy_loop(seconds):
+    """Burn CPU for ``seconds``."""
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+def encode_records(count):
+    return json.dumps([{'title': f'Paper {i}', 'authors': ['A', 'B']} for i in range(count)])
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for command profiling."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_cprofile_writes_pstats(self):
+        report = io.StringIO()
+        result = profiling.profile_call(lambda: encode_records(2000), self.path('run.pstats'),
+                                        top=5, stream=report)
+
+        self.assertTrue(result.startswith('[{'))
+        functions = {name for _, _, name in pstats.Stats(self.path('run.pstats')).stats}
+        self.assertIn('encode_records', functions)
+        self.assertIn('Ordered by: cumulative time', report.getvalue())
+        self.assertRegex(report.getvalue(), r'%\s+json\n')
+
+    def test_sampling_covers_worker_threads(self):
+        worker = threading.Thread(target=busy_loop, args=(0.3,), name='parse-worker')
+
+        def command():
+            worker.start()
+            worker.join()
+
+        report = io.StringIO()
+        profiling.profile_call(command, self.path('run.collapsed'), mode='sample',
+                               interval=0.002, stream=report)
+
+        with open(self.path('run.collapsed'), encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertTrue(all(int(line.rsplit(' ', 1)[1]) > 0 for line in lines))
+        worker_stacks = [line for line in lines if line.startswith('parse-worker;')]
+        self.assertTrue(worker_stacks)
+        self.assertTrue(any(f'{__name__}:busy_loop' in line for line in worker_stacks))
+        self.assertIn(f'{__name__}:busy_loop', report.getvalue())
+
+    def test_memory_report(self):
+        report = io.StringIO()
+        profiling.profile_call(lambda: [bytearray(1024) for _ in range(2000)], self.path('run.pstats'),
+                               memory=True, stream=report)
+        self.assertIn('=== Memory: peak', report.getvalue())
+        self.assertIn('test_profiling.py', report.getvalue())
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            profiling.profile_call(lambda: None, self.path('run.out'), mode='perf')
+
+    def test_package_name(self):
+        self.assertEqual(profiling.package_name(json.__file__), 'json')
+        self.assertEqual(profiling.package_name(profiling.__file__), 'conferences')
+        self.assertEqual(profiling.package_name('~'), '<builtin>')
+
+    def test_cli_profile_option(self):
+        dataset = self.path('papers.json')
+        with open(dataset, 'w', encoding='utf-8') as f:
+            json.dump({'papers': [{'title': 'Nb3Sn coated SRF cavity', 'conference': 'IPAC2025'}]}, f)
+        argv = ['srf-insights', '--profile', self.path('search.pstats'), '--profile-top', '3',
+                'search', 'cavity', '--data', dataset, '--index', self.path('index')]
+        output, report = io.StringIO(), io.StringIO()
+        with mock.patch.object(sys, 'argv', argv), mock.patch.object(sys, 'stderr', report), \
+                redirect_stdout(output):
+            self.assertEqual(cli.main(), 0)
+        self.assertIn('Nb3Sn coated SRF cavity', output.getvalue())
+        self.assertIn('search_command', report.getvalue())
+        self.assertTrue(os.path.getsize(self.path('search.pstats')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Rate Limiter Tests
+
+Unit tests for the per-host token bucket and backoff logic, driven by a fake
+clock so no test actually sleeps.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_rate_limit.py
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conferences.common.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_steady_rate(self):
+        """Test the burst is free and later tokens are spaced by 1/rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_pause_blocks_bucket(self):
+        """Test pause delays the next reservation."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, burst=5, clock=clock)
+        bucket.pause(3.0)
+        self.assertAlmostEqual(bucket.reserve(), 3.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(requests_per_second=4.0, burst=1,
+                                   clock=self.clock, sleep=self.clock.sleep)
+
+    def test_hosts_are_independent(self):
+        """Test one host's budget does not throttle another."""
+        self.limiter.acquire('https://a.example/1')
+        self.limiter.acquire('https://b.example/1')
+        self.assertEqual(self.clock.now, 0.0)
+        self.limiter.acquire('https://a.example/2')
+        self.assertAlmostEqual(self.clock.now, 0.25)
+
+        metrics = self.limiter.metrics()
+        self.assertEqual(metrics['a.example']['requests'], 2)
+        self.assertAlmostEqual(metrics['a.example']['throttled_seconds'], 0.25)
+        self.assertEqual(metrics['b.example']['throttled_seconds'], 0.0)
+
+    def test_throttle_halves_rate_and_success_recovers(self):
+        """Test 429 lowers the host rate and 200s raise it back."""
+        url = 'https://a.example/1'
+        self.limiter.record_response(url, 429)
+        self.assertEqual(self.limiter.metrics()['a.example']['current_rate'], 2.0)
+        for _ in range(20):
+            self.limiter.record_response(url, 200)
+        self.assertEqual(self.limiter.metrics()['a.example']['current_rate'], 4.0)
+
+    @patch('conferences.common.rate_limit.random.uniform', return_value=0.5)
+    def test_retry_after_pauses_host(self, _uniform):
+        """Test Retry-After overrides a shorter jittered delay for the whole host."""
+        url = 'https://a.example/1'
+        delay = self.limiter.backoff(url, 0, status=429, headers={'Retry-After': '7'})
+        self.assertEqual(delay, 7.0)
+        # The pause applies to the next acquire from any worker
+        self.limiter.acquire('https://a.example/other')
+        self.assertAlmostEqual(self.clock.now, 7.0)
+        self.assertEqual(self.limiter.metrics()['a.example']['retries'], 1)
+
+    def test_pause_is_not_counted_as_throttling(self):
+        """Test waiting out a backoff pause adds no throttled time."""
+        url = 'https://a.example/1'
+        self.limiter.backoff(url, 0, status=429, headers={'Retry-After': '2'})
+        # A second worker reserved while the host was paused
+        wait, rate_wait = self.limiter._bucket('a.example').reserve_split()
+        self.assertEqual((wait, rate_wait), (2.0, 0.0))
+        self.limiter.acquire(url)
+
+        metrics = self.limiter.metrics()['a.example']
+        self.assertEqual(metrics['backoff_seconds'], 2.0)
+        # Only the token deficit of the second reservation counts
+        self.assertAlmostEqual(metrics['throttled_seconds'], 0.25)
+
+    def test_backoff_is_bounded(self):
+        """Test jittered exponential backoff never exceeds max_delay."""
+        limiter = RateLimiter(base_delay=1.0, max_delay=5.0,
+                              clock=self.clock, sleep=self.clock.sleep)
+        for attempt in range(10):
+            self.assertLessEqual(limiter.backoff('https://a.example/', attempt), 5.0)
+
+    def test_exhausted_budget_pauses_host(self):
+        """Test X-RateLimit-Remaining: 0 waits for the reset window."""
+        url = 'https://a.example/1'
+        self.limiter.record_response(url, 200, {'X-RateLimit-Remaining': '0',
+                                                'X-RateLimit-Reset': '12'})
+        self.limiter.acquire(url)
+        self.assertAlmostEqual(self.clock.now, 12.0)
+
+    def test_retryable_statuses(self):
+        """Test which statuses are retried."""
+        self.assertTrue(RateLimiter.is_retryable(None))
+        self.assertTrue(RateLimiter.is_retryable(503))
+        self.assertFalse(RateLimiter.is_retryable(404))
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    """Test cases for Retry-After parsing."""
+
+    def test_seconds_and_dates(self):
+        """Test delay-seconds, HTTP-date and garbage values."""
+        self.assertEqual(parse_retry_after('30'), 30.0)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:10 GMT',
+                                           now=1445412480.0), 10.0)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - BM25 Search Tests
+
+Tests for the memory-mapped BM25 index and the ``search`` CLI command.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_search.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import srf_conference_insights_cli as cli
+from conferences.common import search
+
+PAPERS = [
+    {'title': 'Nb3Sn coated SRF cavity', 'abstract': 'Vapor diffusion coating of niobium.',
+     'authors': ['A. One'], 'keywords': ['Nb3Sn'], 'conference': 'IPAC2025',
+     'category': 'MC7: Accelerator Technology', 'paper_code': 'TUPS001'},
+    {'title': 'Beam loss monitors', 'abstract': 'A cavity pickup is discussed briefly in an '
+     'otherwise long abstract about loss monitoring hardware and controls.',
+     'authors': ['B. Two'], 'conference': 'IPAC2025', 'category': 'MC6: Beam Instrumentation'},
+    {'title': 'RFQ cavity for heavy ions', 'authors': ['C. Three'], 'conference': 'HIAT2025',
+     'category': 'Heavy Ion Accelerator Technology'},
+    {'title': 'Magnet design', 'abstract': 'Nb3Sn conductor.', 'conference': 'HIAT2025'},
+]
+
+
+class TestSearch(unittest.TestCase):
+    """Test cases for BM25 search."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.tmpdir.name, 'papers.json')
+        self.write_dataset(PAPERS)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_dataset(self, papers):
+        with open(self.dataset, 'w', encoding='utf-8') as f:
+            json.dump({'papers': papers}, f)
+
+    def titles(self, hits):
+        return [hit['paper']['title'] for hit in hits]
+
+    def test_ranking_and_boosts(self):
+        """Test title matches outrank abstract matches unless boosts say otherwise."""
+        index = search.SearchIndex.open(self.dataset)
+        hits = index.search('cavity')
+        self.assertEqual(len(hits), 3)
+        self.assertEqual(hits[-1]['paper']['title'], 'Beam loss monitors')
+        self.assertTrue(all(a['score'] >= b['score'] for a, b in zip(hits, hits[1:])))
+
+        hits = index.search('nb3sn', boosts={'title': 0.0, 'keywords': 0.0})
+        self.assertEqual(self.titles(hits), ['Magnet design'])
+        self.assertEqual(index.search('nb3sn', top_k=1)[0]['paper']['paper_code'], 'TUPS001')
+        self.assertEqual(index.search('tokamak'), [])
+
+    def test_filters(self):
+        """Test conference and category filters."""
+        index = search.SearchIndex.open(self.dataset)
+        self.assertEqual(self.titles(index.search('cavity', conference='hiat2025')),
+                         ['RFQ cavity for heavy ions'])
+        self.assertEqual(self.titles(index.search('cavity', category=['MC6', 'MC7'])),
+                         ['Nb3Sn coated SRF cavity', 'Beam loss monitors'])
+
+    def test_index_is_memory_mapped_and_rebuilt_when_stale(self):
+        """Test loading maps the arrays and a changed dataset triggers a rebuild."""
+        index = search.SearchIndex.open(self.dataset)
+        self.assertIsInstance(index.postings, np.memmap)
+
+        self.write_dataset(PAPERS + [{'title': 'Cavity tuner', 'conference': 'IPAC2025'}])
+        self.assertFalse(search.SearchIndex.is_current(self.dataset, search.default_index_dir(self.dataset)))
+        with redirect_stdout(io.StringIO()):
+            index = search.SearchIndex.open(self.dataset)
+        self.assertEqual(index.doc_count, 5)
+        self.assertIn('Cavity tuner', self.titles(index.search('tuner')))
+
+    def test_cli_search(self):
+        """Test ``srf-insights search`` prints ranked JSON results."""
+        argv = ['srf-insights', 'search', 'cavity', '--data', self.dataset,
+                '--conference', 'IPAC2025', '--boost', 'title=3', '--json']
+        output = io.StringIO()
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(output):
+            self.assertEqual(cli.main(), 0)
+        hits = json.loads(output.getvalue()[output.getvalue().index('['):])
+        self.assertEqual(self.titles(hits), ['Nb3Sn coated SRF cavity', 'Beam loss monitors'])
+
+        with mock.patch.object(sys, 'argv', argv[:-1] + ['--boost', 'title']), \
+                redirect_stdout(io.StringIO()):
+            self.assertEqual(cli.main(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - CLI Startup Budget Tests
+
+Regression test for the import-time budget of the ``srf-insights`` entry
+points (see ``tests/benchmark_startup.py``): no entry point may load a heavy
+dependency it does not need. The millisecond budgets depend on machine load
+and are only checked when ``SRF_STARTUP_BUDGET=1`` is set.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_startup.py
+    SRF_STARTUP_BUDGET=1 pytest tests/test_startup.py
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_startup import STARTUP_BUDGET, check_budget, measure
+
+
+class TestStartupBudget(unittest.TestCase):
+    """Test cases for lazy imports and CLI startup time."""
+
+    def test_no_unexpected_heavy_imports(self):
+        report = check_budget(runs=1, timing=False)
+        self.assertEqual(set(report), set(STARTUP_BUDGET))
+        problems = {name: entry['problems'] for name, entry in report.items() if entry['problems']}
+        self.assertEqual(problems, {})
+
+    @unittest.skipUnless(os.environ.get('SRF_STARTUP_BUDGET'), "set SRF_STARTUP_BUDGET=1 to check import times")
+    def test_entry_points_within_budget(self):
+        report = check_budget(runs=3)
+        problems = {name: entry['problems'] for name, entry in report.items() if entry['problems']}
+        self.assertEqual(problems, {})
+
+    def test_measure_reports_heavy_imports(self):
+        result = measure('json', runs=1)
+        self.assertEqual(result['heavy'], [])
+        self.assertGreater(result['import_ms'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Search Index Tests
+
+Tests for the prebuilt sharded full-text index used by the web interface.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_text_index.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.common import text_index
+
+PAPERS = [
+    {'title': 'Nb3Sn SRF cavities', 'authors': ['A. Müller'], 'keywords': ['nb3sn']},
+    {'title': 'High-gradient niobium cavity', 'abstract': 'Mid-T baking of niobium.'},
+    {'title': 'RFQ commissioning', 'affiliations': ['IHEP, Beijing']},
+]
+
+
+class TestTextIndex(unittest.TestCase):
+    """Test cases for the static search index."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.tmpdir.name, 'papers.json')
+        with open(self.dataset, 'w', encoding='utf-8') as f:
+            json.dump({'papers': PAPERS}, f)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_tokenize(self):
+        """Test tokens are lowercase runs of Unicode letters and digits."""
+        self.assertEqual(text_index.tokenize('Nb3Sn, Mid-T baking_x Müller'),
+                         ['nb3sn', 'mid', 't', 'baking', 'x', 'müller'])
+
+    def test_round_trip_and_search(self):
+        """Test the written shards load back and answer prefix-AND queries."""
+        output_dir = os.path.join(self.tmpdir.name, 'index')
+        manifest = text_index.build_index(self.dataset, output_dir)
+        self.assertEqual(manifest['paper_count'], 3)
+        self.assertEqual(manifest['prefix_length'], 1)
+
+        _, postings = text_index.load_index(output_dir)
+        self.assertEqual(postings['niobium'], [1])
+        self.assertEqual(text_index.search(postings, 'cav'), [0, 1])
+        self.assertEqual(text_index.search(postings, 'cav NIOB'), [1])
+        self.assertEqual(text_index.search(postings, 'müll'), [0])
+        self.assertEqual(text_index.search(postings, 'ihep beij'), [2])
+        self.assertEqual(text_index.search(postings, 'cavity rfq'), [])
+
+    def test_rebuild_removes_stale_shards(self):
+        """Test shards of terms no longer present are deleted."""
+        output_dir = os.path.join(self.tmpdir.name, 'index')
+        text_index.build_index(self.dataset, output_dir)
+        with open(self.dataset, 'w', encoding='utf-8') as f:
+            json.dump({'papers': PAPERS[:1]}, f)
+        manifest = text_index.build_index(self.dataset, output_dir)
+        files = sorted(name for name in os.listdir(output_dir) if name != 'manifest.json')
+        self.assertEqual(files, sorted(manifest['shards'].values()))
+
+    def test_committed_indexes_are_current(self):
+        """Test the shipped web indexes were built from the current datasets."""
+        data_dir = os.path.join(REPO_ROOT, 'docs', 'data')
+        for name in ('papers-simple', 'papers-medium', 'papers', 'papers-combined'):
+            with self.subTest(dataset=name):
+                with open(os.path.join(data_dir, 'index', name, 'manifest.json'), encoding='utf-8') as f:
+                    manifest = json.load(f)
+                with open(os.path.join(data_dir, f'{name}.json'), encoding='utf-8') as f:
+                    papers = json.load(f)['papers']
+                self.assertEqual(manifest['paper_count'], len(papers))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+SRF Conference Insights - Web Shard Tests
+
+Tests for the tiered list / detail shards served to the web interface.
+
+Author: Ming Liu <mliu@ihep.ac.cn>
+Project: SRF Conference Insights
+Institution: Institute of High Energy Physics, Chinese Academy of Sciences
+
+Usage:
+    pytest tests/test_web_shards.py
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from conferences.common import web_shards
+
+PAPERS = [
+    {'paper_number': i, 'title': f'Paper {i}', 'authors': ['A. One'], 'affiliations': ['IHEP'],
+     'abstract': 'x' * 300 if i == 1 else '', 'figures': [{'page': 1}, {'page': 2}],
+     'sections': {'Introduction': 'long text ' * 50}, 'page_count': 4}
+    for i in range(1, 6)
+]
+
+
+class TestWebShards(unittest.TestCase):
+    """Test cases for the web shard build."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.tmpdir.name, 'papers.json')
+        self.output_dir = os.path.join(self.tmpdir.name, 'shards')
+        self.write_dataset(PAPERS)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_dataset(self, papers):
+        with open(self.dataset, 'w', encoding='utf-8') as f:
+            json.dump({'papers': papers}, f)
+
+    def files(self):
+        return sorted(os.path.relpath(os.path.join(root, name), self.output_dir)
+                      for root, _, names in os.walk(self.output_dir) for name in names)
+
+    def test_list_and_details(self):
+        """Test list entries are slim and detail shards hold the full records."""
+        manifest = web_shards.build_shards(self.dataset, self.output_dir, page_size=2)
+        _, entries, records = web_shards.load_shards(self.output_dir)
+        self.assertEqual(manifest['paper_count'], 5)
+        self.assertEqual(len(manifest['pages']), 3)
+        self.assertEqual(records, PAPERS)
+
+        first = entries[0]
+        self.assertNotIn('sections', first)
+        self.assertEqual(first['figures'], 2)
+        self.assertEqual(len(entries[0]['abstract']), web_shards.SNIPPET_LENGTH + 3)
+        self.assertNotIn('abstract', entries[1])
+        with open(os.path.join(self.output_dir, first['detail']), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), PAPERS[0])
+        self.assertLess(manifest['list_bytes'], manifest['detail_bytes'] / 3)
+
+    def test_content_hashes_and_compression(self):
+        """Test names follow content, rebuilds are stable and stale files are removed."""
+        manifest = web_shards.build_shards(self.dataset, self.output_dir, page_size=2)
+        path = os.path.join(self.output_dir, manifest['list'])
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.assertIn(hashlib.sha256(data).hexdigest()[:web_shards.HASH_LENGTH], manifest['list'])
+        with open(path + '.gz', 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), data)
+
+        before = self.files()
+        web_shards.build_shards(self.dataset, self.output_dir, page_size=2)
+        self.assertEqual(self.files(), before)
+
+        self.write_dataset(PAPERS[:1] + [{**PAPERS[1], 'title': 'Renamed'}] + PAPERS[2:])
+        changed = web_shards.build_shards(self.dataset, self.output_dir, page_size=2)
+        self.assertNotEqual(changed['list'], manifest['list'])
+        self.assertEqual(changed['pages'][1:], manifest['pages'][1:])
+        self.assertNotIn(manifest['list'], self.files())
+        self.assertEqual(len(self.files()), len(before))
+
+    def test_committed_shards_are_current(self):
+        """Test the shipped shards were built from the current papers.json."""
+        shard_dir = os.path.join(REPO_ROOT, 'docs', 'data', 'shards', 'papers')
+        manifest, entries, _ = web_shards.load_shards(shard_dir)
+        with open(os.path.join(REPO_ROOT, 'docs', 'data', 'papers.json'), 'rb') as f:
+            self.assertEqual(manifest['dataset_sha256'], hashlib.sha256(f.read()).hexdigest())
+        self.assertEqual(len(entries), manifest['paper_count'])
+
+
+if __name__ == '__main__':
+    unittest.main()
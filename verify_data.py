@@ -14,6 +14,8 @@ import json
 import os
 from pathlib import Path
 
+from conferences.common.paper_io import iter_papers
+
 def ensure_data_files():
     """Ensure all necessary data files exist for the web interface."""
     docs_dir = Path(__file__).parent / "docs"
@@ -115,7 +117,12 @@ def ensure_data_files():
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(fallback_data, f, ensure_ascii=False, indent=2)
         else:
-            print(f"Data file exists: {filename}")
+            # Stream through the papers to check the file parses
+            try:
+                count = sum(1 for _ in iter_papers(filepath))
+                print(f"Data file exists: {filename} ({count} papers)")
+            except ValueError as e:
+                print(f"❌ Invalid data file: {filename} ({e})")
     
     # Verify web files exist
     web_files = [